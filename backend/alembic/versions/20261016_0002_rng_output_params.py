@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261016_0002"
+down_revision = "20241022_0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("rng_runs", sa.Column("output_params", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("rng_runs", "output_params")
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261016_0003"
+down_revision = "20261016_0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column("rng_runs", "length", type_=sa.BigInteger(), existing_nullable=False)
+
+
+def downgrade() -> None:
+    op.alter_column("rng_runs", "length", type_=sa.Integer(), existing_nullable=False)
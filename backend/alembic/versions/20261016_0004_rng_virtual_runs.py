@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261016_0004"
+down_revision = "20261016_0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "rng_runs",
+        sa.Column("storage_mode", sa.String(length=16), nullable=False, server_default="object"),
+    )
+    op.add_column("rng_runs", sa.Column("key_hex", sa.String(length=64), nullable=True))
+    op.add_column("rng_runs", sa.Column("nonce_hex", sa.String(length=32), nullable=True))
+    op.add_column("rng_runs", sa.Column("counter_start", sa.BigInteger(), nullable=True))
+    op.add_column("rng_runs", sa.Column("counter_end", sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("rng_runs", "counter_end")
+    op.drop_column("rng_runs", "counter_start")
+    op.drop_column("rng_runs", "nonce_hex")
+    op.drop_column("rng_runs", "key_hex")
+    op.drop_column("rng_runs", "storage_mode")
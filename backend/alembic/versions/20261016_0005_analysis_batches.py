@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261016_0005"
+down_revision = "20261016_0004"
+branch_labels = None
+depends_on = None
+
+
+SCHEMA_DEFAULT_TIMESTAMP = sa.text("timezone('utc', now())")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "analysis_batches",
+        sa.Column("id", sa.dialects.postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=SCHEMA_DEFAULT_TIMESTAMP, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=SCHEMA_DEFAULT_TIMESTAMP, nullable=False),
+        sa.Column("tests", sa.JSON(), nullable=False),
+        sa.Column("run_ids", sa.JSON(), nullable=False),
+        sa.Column("sequence_bits", sa.BigInteger(), nullable=False),
+        sa.Column("checks", sa.JSON(), nullable=False),
+    )
+    op.add_column("test_reports", sa.Column("batch_id", sa.dialects.postgresql.UUID(as_uuid=True), nullable=True))
+    op.create_foreign_key(
+        "fk_test_reports_batch_id",
+        "test_reports",
+        "analysis_batches",
+        ["batch_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+    op.create_index("ix_test_reports_batch_id", "test_reports", ["batch_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_test_reports_batch_id", table_name="test_reports")
+    op.drop_constraint("fk_test_reports_batch_id", "test_reports", type_="foreignkey")
+    op.drop_column("test_reports", "batch_id")
+    op.drop_table("analysis_batches")
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261017_0006"
+down_revision = "20261016_0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column("audit_uploads", "raw_payload", existing_type=sa.LargeBinary(), nullable=True)
+
+
+def downgrade() -> None:
+    # Streamed uploads keep their payload only in object storage and must be removed first.
+    op.alter_column("audit_uploads", "raw_payload", existing_type=sa.LargeBinary(), nullable=False)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import io
+
+import sqlalchemy as sa
+from alembic import op
+from minio.error import S3Error
+from sqlalchemy.dialects.postgresql import UUID
+
+revision = "20261017_0007"
+down_revision = "20261017_0006"
+branch_labels = None
+depends_on = None
+
+
+audit_uploads = sa.table(
+    "audit_uploads",
+    sa.column("id", UUID(as_uuid=True)),
+    sa.column("result_path", sa.String()),
+    sa.column("raw_payload", sa.LargeBinary()),
+)
+
+
+def _object_exists(client, bucket: str, path: str, size: int) -> bool:
+    try:
+        return client.stat_object(bucket, path).size == size
+    except S3Error as exc:
+        if exc.code in {"NoSuchKey", "NoSuchObject"}:
+            return False
+        raise
+
+
+def upgrade() -> None:
+    if op.get_context().as_sql:
+        raise RuntimeError("moving audit payloads to object storage requires an online migration")
+
+    from randomtrust.core import create_minio_client, get_settings
+
+    settings = get_settings()
+    client = create_minio_client(settings)
+    connection = op.get_bind()
+
+    rows = connection.execute(
+        sa.select(
+            audit_uploads.c.id,
+            audit_uploads.c.result_path,
+            sa.func.length(audit_uploads.c.raw_payload).label("size"),
+        ).where(audit_uploads.c.raw_payload.is_not(None))
+    ).all()
+    for audit_id, result_path, size in rows:
+        path = result_path or f"audit/{audit_id}.bin"
+        # Uploads have always been written to MinIO as well, so most rows only need their copy checked.
+        if not _object_exists(client, settings.minio_bucket, path, size):
+            payload = connection.execute(
+                sa.select(audit_uploads.c.raw_payload).where(audit_uploads.c.id == audit_id)
+            ).scalar_one()
+            client.put_object(
+                settings.minio_bucket,
+                path,
+                data=io.BytesIO(payload),
+                length=len(payload),
+                content_type="application/octet-stream",
+            )
+        if result_path is None:
+            connection.execute(
+                sa.update(audit_uploads).where(audit_uploads.c.id == audit_id).values(result_path=path)
+            )
+
+    op.drop_column("audit_uploads", "raw_payload")
+
+
+def downgrade() -> None:
+    op.add_column("audit_uploads", sa.Column("raw_payload", sa.LargeBinary(), nullable=True))
+    if op.get_context().as_sql:
+        return
+
+    from randomtrust.core import create_minio_client, get_settings
+
+    settings = get_settings()
+    client = create_minio_client(settings)
+    connection = op.get_bind()
+
+    rows = connection.execute(
+        sa.select(audit_uploads.c.id, audit_uploads.c.result_path).where(audit_uploads.c.result_path.is_not(None))
+    ).all()
+    for audit_id, path in rows:
+        obj = client.get_object(settings.minio_bucket, path)
+        try:
+            payload = obj.read()
+        finally:
+            obj.close()
+            obj.release_conn()
+        connection.execute(
+            sa.update(audit_uploads).where(audit_uploads.c.id == audit_id).values(raw_payload=payload)
+        )
@@ -0,0 +1,61 @@
+"""Cost of the SP 800-90B health tests relative to a full entropy mix.
+
+Run from the backend directory:
+
+    python -m benchmarks.health_tests [--rows 64] [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from typing import Callable
+
+from randomtrust.entropy import (
+    EntropyMixer,
+    HealthTestConfig,
+    LorenzChaosSimulator,
+    NoiseSimulator,
+    quantize_noise,
+    run_health_tests,
+)
+
+
+def _median_seconds(func: Callable[[], object], repeat: int) -> float:
+    func()  # warm-up
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def _format(seconds: float) -> str:
+    return f"{seconds * 1e3:9.3f} ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=64, help="requests per batch mix")
+    parser.add_argument("--repeat", type=int, default=20, help="timed iterations; the median is reported")
+    args = parser.parse_args()
+
+    noise_simulator = NoiseSimulator()
+    config = HealthTestConfig()
+    mixer = EntropyMixer(noise_simulator=noise_simulator, chaos_simulator=LorenzChaosSimulator(), health_config=config)
+
+    for rows in (1, args.rows):
+        seeds = list(range(rows))
+        samples = quantize_noise(noise_simulator.generate_batch(seeds).signal)
+        health = _median_seconds(lambda: run_health_tests(samples, config), args.repeat)
+        mix = _median_seconds(lambda: mixer.mix_entropy_batch([(seed, None) for seed in seeds]), args.repeat)
+        print(
+            f"{rows:4d} x {samples.shape[1]} samples: health tests {_format(health)},"
+            f" mix {_format(mix)} ({health / mix:.2%} of the mix)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,43 @@
 from __future__ import annotations
 
-from .tests import AVAILABLE_TESTS, TestOutcome, run_selected_tests
+from .base import PackedBits, SequenceTooShortError, TestOutcome
+from .batch import BatchCheck, BatchReport, aggregate_checks, run_batch_tests
+from .min_entropy import MIN_ENTROPY_VERSION, MinEntropyEstimate, MinEntropyReport, estimate_min_entropy
+from .parallel import (
+    ParallelReport,
+    SharedBits,
+    SharedMemoryExhaustedError,
+    TestTiming,
+    run_parallel_tests,
+    shared_memory_available,
+)
+from .streaming import ACCUMULATORS, StreamingBattery, TestAccumulator, run_streaming_tests
+from .tests import ANALYSIS_VERSION, AVAILABLE_TESTS, run_selected_tests, test_parameters
 
 __all__ = [
+    "ACCUMULATORS",
+    "ANALYSIS_VERSION",
     "AVAILABLE_TESTS",
+    "MIN_ENTROPY_VERSION",
+    "BatchCheck",
+    "BatchReport",
+    "MinEntropyEstimate",
+    "MinEntropyReport",
+    "PackedBits",
+    "ParallelReport",
+    "SequenceTooShortError",
+    "SharedBits",
+    "SharedMemoryExhaustedError",
+    "StreamingBattery",
+    "TestAccumulator",
     "TestOutcome",
+    "TestTiming",
+    "aggregate_checks",
+    "estimate_min_entropy",
+    "run_batch_tests",
+    "run_parallel_tests",
     "run_selected_tests",
+    "run_streaming_tests",
+    "shared_memory_available",
+    "test_parameters",
 ]
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Union
+
+import numpy as np
+
+# Blocks of these byte widths are reinterpreted as one unsigned word and popcounted directly.
+_WORD_DTYPES = {1: np.uint8, 2: np.uint16, 4: np.uint32, 8: np.uint64}
+
+
+class SequenceTooShortError(ValueError):
+    """Input does not satisfy a test's minimum length (or cycle count) requirement."""
+
+
+@dataclass(slots=True)
+class TestOutcome:
+    name: str
+    passed: bool
+    metric: float
+    threshold: float
+    details: dict[str, float]
+
+
+@dataclass(frozen=True, slots=True)
+class PackedBits:
+    """MSB-first bit sequence packed into `np.uint8`; padding bits of the last byte are zero."""
+
+    data: np.ndarray
+    length: int
+
+    @classmethod
+    def from_bytes(cls, payload: bytes | bytearray | memoryview) -> PackedBits:
+        data = np.frombuffer(payload, dtype=np.uint8)
+        return cls(data=data, length=data.size * 8)
+
+    @classmethod
+    def from_bits(cls, bits: Iterable[int]) -> PackedBits:
+        if isinstance(bits, (np.ndarray, list, tuple)):
+            unpacked = np.asarray(bits).reshape(-1)
+        else:
+            unpacked = np.fromiter(bits, dtype=np.uint8)
+        return cls(data=np.packbits(unpacked != 0), length=unpacked.size)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def unpack(self) -> np.ndarray:
+        return np.unpackbits(self.data, count=self.length)
+
+    def count_ones(self) -> int:
+        return int(np.bitwise_count(self.data).sum(dtype=np.int64))
+
+    def count_transitions(self) -> int:
+        """Number of positions i > 0 with bit[i] != bit[i - 1]."""
+        if self.length < 2:
+            return 0
+        data = self.data
+        # Shift the whole sequence right by one bit, carrying each byte's LSB into the next byte.
+        shifted = data >> 1
+        shifted[1:] |= data[:-1] << 7
+        diff = data ^ shifted
+        # The first bit has no predecessor and bits past `length` are padding.
+        diff[0] &= 0x7F
+        tail = self.length % 8
+        if tail:
+            diff[-1] &= (0xFF << (8 - tail)) & 0xFF
+        return int(np.bitwise_count(diff).sum(dtype=np.int64))
+
+    def block_ones(self, block_size: int) -> np.ndarray:
+        """Ones count of every complete `block_size`-bit block."""
+        blocks = self.length // block_size
+        if block_size % 8 == 0:
+            # Byte-aligned blocks are popcounted on the packed buffer without unpacking.
+            width = block_size // 8
+            packed = self.data[: blocks * width]
+            if width in _WORD_DTYPES:
+                return np.bitwise_count(packed.view(_WORD_DTYPES[width])).astype(np.int64)
+            return np.bitwise_count(packed).reshape(blocks, width).sum(axis=1, dtype=np.int64)
+        unpacked = np.unpackbits(self.data, count=blocks * block_size)
+        return unpacked.reshape(blocks, block_size).sum(axis=1, dtype=np.int64)
+
+
+BitSource = Union[PackedBits, Iterable[int]]
+
+
+def as_packed_bits(bits: BitSource) -> PackedBits:
+    return bits if isinstance(bits, PackedBits) else PackedBits.from_bits(bits)
@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from math import sqrt
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Awaitable, Callable, Iterable
+
+import numpy as np
+
+from randomtrust.core.executor import ComputeExecutor
+
+from . import nist
+from .base import PackedBits, SequenceTooShortError, TestOutcome
+from .parallel import SharedBits, TestTiming, _track_progress
+from .streaming import run_chunked_test
+from .tests import AVAILABLE_TESTS, frequency_outcome, runs_outcome
+
+# SP 800-22 §4.2.2: P-value uniformity is judged on ten bins and needs at least 55 sequences.
+UNIFORMITY_BINS = 10
+UNIFORMITY_MIN_SEQUENCES = 55
+UNIFORMITY_ALPHA = 0.0001
+
+# These tests only report their smallest P-value, which is not uniform; their verdicts still count.
+_MINIMUM_ONLY = frozenset({"non_overlapping_template"})
+
+
+@dataclass(slots=True)
+class BatchReport:
+    # One list of outcomes per sequence, in stack order.
+    rows: list[list[TestOutcome]]
+    timings: list[TestTiming]
+
+
+@dataclass(slots=True)
+class BatchCheck:
+    test: str
+    series: str
+    sequences: int
+    passed: int
+    proportion: float
+    proportion_min: float
+    proportion_max: float
+    proportion_passed: bool
+    # None when fewer than UNIFORMITY_MIN_SEQUENCES P-values exist or the test has none to bin.
+    uniformity_p_value: float | None
+    uniformity_passed: bool | None
+
+
+def _popcounts(matrix: np.ndarray) -> np.ndarray:
+    # Popcounting 64-bit words is several times faster than bytes when the row width allows it.
+    if matrix.shape[-1] % 8 == 0:
+        return np.bitwise_count(matrix.view(np.uint64))
+    return np.bitwise_count(matrix)
+
+
+def _row_transitions(matrix: np.ndarray) -> np.ndarray:
+    # Same shift/xor trick as PackedBits.count_transitions, applied to every row at once.
+    shifted = matrix >> 1
+    shifted[:, 1:] |= matrix[:, :-1] << 7
+    diff = matrix ^ shifted
+    diff[:, 0] &= 0x7F
+    return np.bitwise_count(diff).sum(axis=1, dtype=np.int64)
+
+
+def _stacked_frequency(matrix: np.ndarray, n: int) -> list[TestOutcome]:
+    ones = _popcounts(matrix).sum(axis=1, dtype=np.int64)
+    return [frequency_outcome(int(count), n) for count in ones]
+
+
+def _stacked_runs(matrix: np.ndarray, n: int) -> list[TestOutcome]:
+    ones = _popcounts(matrix).sum(axis=1, dtype=np.int64)
+    transitions = _row_transitions(matrix)
+    return [runs_outcome(n, int(count), int(changes)) for count, changes in zip(ones, transitions)]
+
+
+def _stacked_block_frequency(matrix: np.ndarray, n: int, block_size: int = 128) -> list[TestOutcome]:
+    blocks = nist.block_frequency_count(n, block_size)
+    width = block_size // 8
+    ones = _popcounts(matrix[:, : blocks * width].reshape(matrix.shape[0], blocks, width)).sum(axis=2)
+    square_sums = ((ones / block_size - 0.5) ** 2).sum(axis=1)
+    return [nist.block_frequency_outcome(float(square), blocks, block_size) for square in square_sums]
+
+
+# Tests whose statistics reduce to popcounts, computed for the whole (sequences, bytes) stack in one task.
+_STACKED_TESTS: dict[str, Callable[[np.ndarray, int], list[TestOutcome]]] = {
+    "frequency": _stacked_frequency,
+    "runs": _stacked_runs,
+    "block_frequency": _stacked_block_frequency,
+}
+
+
+def _attached_matrix(shm: SharedMemory, rows: int, row_bytes: int) -> np.ndarray:
+    matrix = np.frombuffer(shm.buf, dtype=np.uint8, count=rows * row_bytes).reshape(rows, row_bytes)
+    matrix.flags.writeable = False
+    return matrix
+
+
+def _run_stacked(shm_name: str, rows: int, row_bytes: int, name: str) -> tuple[float, float, Any]:
+    started_at = time.time()
+    shm = SharedMemory(name=shm_name)
+    try:
+        try:
+            result: Any = _STACKED_TESTS[name](_attached_matrix(shm, rows, row_bytes), row_bytes * 8)
+        except SequenceTooShortError as exc:
+            # A fresh exception carries no traceback frames pinning the shared view.
+            result = SequenceTooShortError(str(exc))
+    finally:
+        try:
+            shm.close()
+        except BufferError:
+            # An unexpected error's traceback still references the view; it is unmapped with it.
+            pass
+    return started_at, time.time(), result
+
+
+def _run_rows(
+    shm_name: str,
+    rows: int,
+    row_bytes: int,
+    first: int,
+    last: int,
+    names: list[str],
+    explicit: bool,
+) -> tuple[float, float, Any]:
+    started_at = time.time()
+    shm = SharedMemory(name=shm_name)
+    outcomes: list[dict[str, TestOutcome]] = []
+    durations = dict.fromkeys(names, 0.0)
+    result: Any = (outcomes, durations)
+    try:
+        matrix = _attached_matrix(shm, rows, row_bytes)
+        for row in range(first, last):
+            packed = PackedBits(data=matrix[row], length=row_bytes * 8)
+            row_outcomes: dict[str, TestOutcome] = {}
+            for name in names:
+                test_started = time.perf_counter()
+                try:
+                    # Rows go through the accumulators, like whole-sequence tasks of the parallel path.
+                    row_outcomes[name] = run_chunked_test(name, packed)
+                except SequenceTooShortError as exc:
+                    # The default battery skips tests the input is too short for; explicit requests fail.
+                    if explicit:
+                        result = SequenceTooShortError(str(exc))
+                        break
+                durations[name] += time.perf_counter() - test_started
+            outcomes.append(row_outcomes)
+            if isinstance(result, SequenceTooShortError):
+                break
+        del matrix, packed
+    finally:
+        try:
+            shm.close()
+        except BufferError:
+            # An unexpected error's traceback still references the view; it is unmapped with it.
+            pass
+    return started_at, time.time(), result
+
+
+async def run_batch_tests(
+    stack: SharedBits,
+    rows: int,
+    tests: Iterable[str] | None = None,
+    *,
+    executor: ComputeExecutor,
+    progress: Callable[[float], None] | None = None,
+) -> BatchReport:
+    """Run the battery over `rows` equal-length byte sequences stacked back to back in `stack`."""
+    if rows <= 0 or not len(stack):
+        raise ValueError("No bits provided for analysis")
+    if len(stack) % (rows * 8):
+        raise ValueError("stacked sequences must be whole bytes of equal length")
+    if not stack.complete:
+        raise ValueError("shared bit buffer is not completely written")
+    row_bytes = len(stack) // rows // 8
+    explicit = bool(tests)
+    selected = list(tests or AVAILABLE_TESTS.keys())
+    for name in selected:
+        # Guard against unsupported identifiers passed from external callers.
+        if name not in AVAILABLE_TESTS:
+            raise ValueError(f"unknown test: {name}")
+    stacked = list(dict.fromkeys(name for name in selected if name in _STACKED_TESTS))
+    per_row = list(dict.fromkeys(name for name in selected if name not in _STACKED_TESTS))
+
+    calls: list[Awaitable[Any]] = [executor.run(_run_stacked, stack.name, rows, row_bytes, name) for name in stacked]
+    if per_row:
+        # A few row ranges per worker keep the pool busy without paying task overhead per sequence.
+        parts = min(rows, executor.max_workers * 4)
+        edges = [rows * index // parts for index in range(parts + 1)]
+        calls += [
+            executor.run(_run_rows, stack.name, rows, row_bytes, first, last, per_row, explicit)
+            for first, last in zip(edges[:-1], edges[1:])
+        ]
+    if progress is not None:
+        calls = _track_progress(calls, progress)
+    # Every task is awaited before returning, so none outlives the caller's shared segment.
+    results = await asyncio.gather(*calls, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    for _, _, value in results:
+        if isinstance(value, SequenceTooShortError) and explicit:
+            raise value
+
+    columns: dict[str, list[TestOutcome]] = {}
+    timings: dict[str, TestTiming] = {}
+    for name, (started_at, finished_at, value) in zip(stacked, results):
+        if isinstance(value, SequenceTooShortError):
+            continue
+        columns[name] = value
+        elapsed_ms = (finished_at - started_at) * 1_000.0
+        timings[name] = TestTiming(name=name, segments=1, wall_ms=elapsed_ms, compute_ms=elapsed_ms)
+
+    range_results = results[len(stacked) :]
+    row_outcomes = [outcomes for _, _, (chunk, _) in range_results for outcomes in chunk]
+    if range_results:
+        started_at = min(start for start, _, _ in range_results)
+        finished_at = max(finish for _, finish, _ in range_results)
+        for name in per_row:
+            if any(name in outcomes for outcomes in row_outcomes):
+                timings[name] = TestTiming(
+                    name=name,
+                    segments=len(range_results),
+                    wall_ms=(finished_at - started_at) * 1_000.0,
+                    compute_ms=sum(durations[name] for _, _, (_, durations) in range_results) * 1_000.0,
+                )
+
+    report_rows: list[list[TestOutcome]] = []
+    for row in range(rows):
+        outcomes = row_outcomes[row] if row_outcomes else {}
+        report_rows.append(
+            [
+                columns[name][row] if name in columns else outcomes[name]
+                for name in selected
+                if name in columns or name in outcomes
+            ]
+        )
+    ordered = [timings[name] for name in dict.fromkeys(selected) if name in timings]
+    return BatchReport(rows=report_rows, timings=ordered)
+
+
+def p_value_series(outcome: TestOutcome) -> dict[str, float] | None:
+    """Individually uniform P-values of an outcome by series name, or None if it exposes none."""
+    individual = {key: float(value) for key, value in outcome.details.items() if key.startswith("p_value_")}
+    if individual:
+        return individual
+    if "p_value" in outcome.details and outcome.name not in _MINIMUM_ONLY:
+        return {"p_value": float(outcome.details["p_value"])}
+    return None
+
+
+def proportion_bounds(sequences: int, alpha: float = nist.ALPHA) -> tuple[float, float]:
+    """SP 800-22 §4.2.1 confidence interval for the proportion of passing sequences."""
+    expected = 1.0 - alpha
+    margin = 3.0 * sqrt(expected * alpha / sequences)
+    return expected - margin, expected + margin
+
+
+def uniformity_p_value(p_values: Iterable[float]) -> float:
+    """SP 800-22 §4.2.2 chi-square P-value of the P-value histogram over ten equal bins."""
+    values = np.clip(np.fromiter(p_values, dtype=np.float64), 0.0, 1.0)
+    counts, _ = np.histogram(values, bins=UNIFORMITY_BINS, range=(0.0, 1.0))
+    expected = values.size / UNIFORMITY_BINS
+    chi_square = float(((counts - expected) ** 2 / expected).sum())
+    return nist.igamc((UNIFORMITY_BINS - 1) / 2.0, chi_square / 2.0)
+
+
+def _check(test: str, series: str, verdicts: list[bool], p_values: list[float] | None) -> BatchCheck:
+    sequences = len(verdicts)
+    passed = sum(verdicts)
+    low, high = proportion_bounds(sequences)
+    proportion = passed / sequences
+    uniformity = None
+    if p_values is not None and len(p_values) >= UNIFORMITY_MIN_SEQUENCES:
+        uniformity = uniformity_p_value(p_values)
+    return BatchCheck(
+        test=test,
+        series=series,
+        sequences=sequences,
+        passed=passed,
+        proportion=proportion,
+        proportion_min=low,
+        proportion_max=high,
+        proportion_passed=proportion >= low,
+        uniformity_p_value=uniformity,
+        uniformity_passed=None if uniformity is None else uniformity >= UNIFORMITY_ALPHA,
+    )
+
+
+def aggregate_checks(rows: Iterable[Iterable[TestOutcome]]) -> list[BatchCheck]:
+    """Pass-proportion and P-value uniformity checks across sequences, per test and P-value series.
+
+    Each series counts only the sequences that produced it, so tests skipped for some sequences
+    (e.g. random excursions with too few cycles) are judged on the rest.
+    """
+    series_values: dict[tuple[str, str], list[float]] = {}
+    verdicts: dict[str, list[bool]] = {}
+    for outcomes in rows:
+        for outcome in outcomes:
+            series = p_value_series(outcome)
+            if series is not None:
+                for key, value in series.items():
+                    series_values.setdefault((outcome.name, key), []).append(value)
+            elif outcome.name in _MINIMUM_ONLY:
+                verdicts.setdefault(outcome.name, []).append(bool(outcome.passed))
+
+    checks = [
+        _check(test, series, [value >= nist.ALPHA for value in values], values)
+        for (test, series), values in series_values.items()
+    ]
+    checks += [_check(test, "verdict", passed, None) for test, passed in verdicts.items()]
+    order = {name: index for index, name in enumerate(AVAILABLE_TESTS)}
+    return sorted(checks, key=lambda check: order[check.test])
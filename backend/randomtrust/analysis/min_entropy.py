@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from math import log2, sqrt
+from typing import Callable
+
+import numpy as np
+
+from .nist import previous_occurrences
+
+# Bump when an estimator changes, so cached reports are recomputed.
+MIN_ENTROPY_VERSION = 1
+# Upper 99.5% point of the standard normal, used by every 90B confidence bound.
+_Z_ALPHA = 2.576
+# Minimum count of the most common tuple for the t-tuple estimate (SP 800-90B §6.3.5).
+_TUPLE_CUTOFF = 35
+
+
+@dataclass(slots=True)
+class MinEntropyEstimate:
+    name: str
+    # Per-sample (or per-bit for bitstring estimates) min-entropy; None when the estimator does not apply.
+    min_entropy: float | None
+    # Upper bound on the probability of the most likely output.
+    p_max: float | None
+
+
+@dataclass(slots=True)
+class MinEntropyReport:
+    samples: int
+    bits_per_sample: int
+    original: list[MinEntropyEstimate]
+    bitstring: list[MinEntropyEstimate]
+    h_original: float
+    h_bitstring: float
+    # min(H_original, bits_per_sample * H_bitstring), SP 800-90B §3.1.3.
+    min_entropy: float
+
+
+def _estimate(name: str, p_max: float | None, bits: float = 1.0) -> MinEntropyEstimate:
+    if p_max is None:
+        return MinEntropyEstimate(name=name, min_entropy=None, p_max=None)
+    p_max = min(max(p_max, 2.0 ** -bits), 1.0)
+    return MinEntropyEstimate(name=name, min_entropy=-log2(p_max), p_max=p_max)
+
+
+def _bisect(f: Callable[[float], float], low: float, high: float, iterations: int = 60) -> float:
+    # `f` decreases over [low, high]; the caller checks the sign at both ends.
+    for _ in range(iterations):
+        middle = (low + high) / 2.0
+        if f(middle) > 0.0:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2.0
+
+
+def most_common_value(samples: np.ndarray, bits: int) -> MinEntropyEstimate:
+    """Most Common Value estimate (SP 800-90B §6.3.1)."""
+    n = samples.size
+    p_hat = float(np.bincount(samples).max()) / n
+    p_upper = p_hat + _Z_ALPHA * sqrt(p_hat * (1.0 - p_hat) / (n - 1))
+    return _estimate("mcv", p_upper, bits)
+
+
+def _collision_steps(bits: np.ndarray) -> np.ndarray:
+    """Length of the binary collision that starts at every position, 0 where none fits."""
+    n = bits.size
+    steps = np.zeros(n, dtype=np.int64)
+    # Two equal bits collide at once; otherwise the third bit repeats one of them.
+    steps[: n - 2] = 3
+    steps[: n - 1][bits[1:] == bits[:-1]] = 2
+    return steps
+
+
+def _walk(steps: np.ndarray) -> np.ndarray:
+    """Positions visited from 0 following `steps`, found by pointer doubling."""
+    n = steps.size
+    jump = np.append(np.where(steps > 0, np.arange(n) + steps, n), n)
+    jump = np.minimum(jump, n)
+    path = np.zeros(1, dtype=np.int64)
+    # `path` holds the first 2**k positions and `jump` maps a position 2**k steps ahead.
+    while path[-1] < n:
+        path = np.concatenate([path, jump[path]])
+        jump = jump[jump]
+    return path[path < n]
+
+
+def collision(bits: np.ndarray) -> MinEntropyEstimate:
+    """Collision estimate over a binary sequence (SP 800-90B §6.3.2)."""
+    steps = _collision_steps(bits)
+    starts = _walk(steps)
+    times = steps[starts]
+    times = times[times > 0].astype(np.float64)
+    v = times.size
+    if v < 2:
+        return _estimate("collision", None)
+    mean = float(times.mean())
+    sigma = float(times.std(ddof=1))
+    mean_lower = mean - _Z_ALPHA * sigma / sqrt(v)
+
+    def expected(p: float) -> float:
+        q = 1.0 - p
+        f = 2.0 * q**3 + 2.0 * q**2 + q
+        return p / q**2 * (1.0 + 0.5 * (1.0 / p - 1.0 / q)) * f - p / q * 0.5 * (1.0 / p - 1.0 / q)
+
+    # The expected collision time falls from 2.5 at p = 1/2 to 2 as p approaches 1.
+    if mean_lower >= 2.5:
+        return _estimate("collision", 0.5)
+    high = 1.0 - 1e-9
+    if mean_lower <= expected(high):
+        return _estimate("collision", 1.0)
+    return _estimate("collision", _bisect(lambda p: expected(p) - mean_lower, 0.5, high))
+
+
+def markov(bits: np.ndarray) -> MinEntropyEstimate:
+    """Markov estimate over a binary sequence (SP 800-90B §6.3.3)."""
+    if bits.size < 2:
+        return _estimate("markov", None)
+    ones = float(bits.mean())
+    starts = np.bincount(bits[:-1], minlength=2)
+    pairs = np.bincount(bits[:-1] * 2 + bits[1:], minlength=4)
+    transitions = [pairs[index] / starts[index // 2] if starts[index // 2] else 0.0 for index in range(4)]
+    log0, log1 = (log2(p) if p > 0.0 else -np.inf for p in (1.0 - ones, ones))
+    l00, l01, l10, l11 = (log2(p) if p > 0.0 else -np.inf for p in transitions)
+    # Log-probabilities of the most likely 128-bit sequences.
+    best = max(
+        log0 + 127 * l00,
+        log0 + 64 * l01 + 63 * l10,
+        log0 + l01 + 126 * l11,
+        log1 + l10 + 126 * l00,
+        log1 + 64 * l10 + 63 * l01,
+        log1 + 127 * l11,
+    )
+    return _estimate("markov", 2.0 ** (best / 128.0))
+
+
+def compression(bits: np.ndarray, block: int = 6, dictionary: int = 1000) -> MinEntropyEstimate:
+    """Compression estimate over a binary sequence (SP 800-90B §6.3.4)."""
+    total = bits.size // block
+    tests = total - dictionary
+    if tests < 2:
+        return _estimate("compression", None)
+    weights = 1 << np.arange(block - 1, -1, -1, dtype=np.int64)
+    values = bits[: total * block].reshape(total, block).astype(np.int64) @ weights
+    previous = previous_occurrences(values) + 1
+    positions = np.arange(dictionary + 1, total + 1, dtype=np.int64)
+    distances = np.log2(positions - previous[dictionary:])
+    mean = float(distances.mean())
+    sigma = 0.5907 * sqrt(max(float((distances**2).sum()) / (tests - 1) - mean**2, 0.0))
+    mean_lower = mean - _Z_ALPHA * sigma / sqrt(tests)
+
+    # G(z) sums log2(u) weighted by how many test positions a first repeat after u blocks can fall at.
+    u = np.arange(1, total + 1, dtype=np.float64)
+    log_u = np.log2(u)
+    counts = np.where(u <= dictionary, tests, total - u)
+    late = u > dictionary
+
+    def g(z: float) -> float:
+        if z <= 0.0:
+            return 0.0
+        tail = np.power(1.0 - z, u - 1.0)
+        return float((log_u * z * z * tail * counts).sum() + (log_u[late] * z * tail[late]).sum()) / tests
+
+    symbols = 2**block
+
+    def expected(p: float) -> float:
+        return g(p) + (symbols - 1) * g((1.0 - p) / (symbols - 1))
+
+    low = 1.0 / symbols
+    if mean_lower >= expected(low):
+        return _estimate("compression", 0.5)
+    p = _bisect(lambda p: expected(p) - mean_lower, low, 1.0)
+    return _estimate("compression", p ** (1.0 / block))
+
+
+@dataclass(slots=True)
+class _Repeats:
+    # q[w - 1]: occurrences of the most common w-tuple.
+    q: np.ndarray
+    # pairs[w - 1]: pairs of positions whose w-tuples are equal.
+    pairs: np.ndarray
+
+
+def _suffix_ranks(symbols: np.ndarray) -> tuple[np.ndarray, list[np.ndarray]]:
+    """Suffix array by prefix doubling, with the rank of every 2**k-prefix kept per level."""
+    n = symbols.size
+    rank = np.unique(symbols, return_inverse=True)[1].astype(np.int64)
+    levels = [rank]
+    order = np.argsort(rank, kind="stable")
+    span = 1
+    while span < n and rank[order[-1]] < n - 1:
+        second = np.full(n, -1, dtype=np.int64)
+        second[: n - span] = rank[span:]
+        order = np.lexsort((second, rank))
+        changed = np.empty(n, dtype=bool)
+        changed[0] = False
+        changed[1:] = (rank[order[1:]] != rank[order[:-1]]) | (second[order[1:]] != second[order[:-1]])
+        rank = np.empty(n, dtype=np.int64)
+        rank[order] = np.cumsum(changed)
+        levels.append(rank)
+        span *= 2
+    return order, levels
+
+
+def _common_prefixes(order: np.ndarray, levels: list[np.ndarray]) -> np.ndarray:
+    """Longest common prefix of neighbouring suffixes, by binary lifting over the prefix ranks."""
+    n = order.size
+    left, right = order[:-1], order[1:]
+    lcp = np.zeros(n - 1, dtype=np.int64)
+    for level in range(len(levels) - 1, -1, -1):
+        a, b = left + lcp, right + lcp
+        inside = np.flatnonzero((a < n) & (b < n))
+        same = levels[level][a[inside]] == levels[level][b[inside]]
+        lcp[inside[same]] += 1 << level
+    return lcp
+
+
+def _repeats(symbols: np.ndarray) -> _Repeats:
+    """Most common tuple count and equal tuple pairs for every tuple length present twice."""
+    order, levels = _suffix_ranks(symbols)
+    lcp = _common_prefixes(order, levels)
+    m = lcp.size
+    longest = int(lcp.max()) if m else 0
+    if longest == 0:
+        return _Repeats(q=np.ones(1, dtype=np.int64), pairs=np.zeros(1, dtype=np.int64))
+
+    # Sparse table of range minima over the LCP array.
+    table = [lcp]
+    while (1 << len(table)) <= m:
+        width = 1 << (len(table) - 1)
+        table.append(np.minimum(table[-1][:-width], table[-1][width:]))
+    index = np.arange(m, dtype=np.int64)
+    # Each LCP entry is the minimum of the intervals reaching left over larger values
+    # and right over values at least as large, so every interval is counted once.
+    start = index.copy()
+    stop = index + 1
+    for level in range(len(table) - 1, -1, -1):
+        width = 1 << level
+        candidate = start - width
+        ok = np.flatnonzero(candidate >= 0)
+        ok = ok[table[level][candidate[ok]] > lcp[ok]]
+        start[ok] = candidate[ok]
+        ok = np.flatnonzero(stop + width <= m)
+        ok = ok[table[level][stop[ok]] >= lcp[ok]]
+        stop[ok] += width
+    left = index - start + 1
+    right = stop - index
+    cnt = np.bincount(lcp, weights=(left * right).astype(np.float64), minlength=longest + 1)
+    group = np.zeros(longest + 1, dtype=np.int64)
+    np.maximum.at(group, lcp, left + right)
+    # Lengths from 1 to the longest repeat; a tuple of length w repeats wherever some lcp >= w.
+    pairs = np.cumsum(cnt[::-1])[::-1][1:]
+    q = np.maximum.accumulate(group[::-1])[::-1][1:]
+    return _Repeats(q=q, pairs=pairs)
+
+
+def tuple_estimates(samples: np.ndarray, bits: int) -> tuple[MinEntropyEstimate, MinEntropyEstimate]:
+    """t-Tuple and Longest Repeated Substring estimates (SP 800-90B §6.3.5, §6.3.6)."""
+    n = samples.size
+    repeats = _repeats(samples)
+    lengths = np.arange(1, repeats.q.size + 1, dtype=np.float64)
+    frequent = int(np.count_nonzero(repeats.q >= _TUPLE_CUTOFF))
+    if frequent:
+        w = lengths[:frequent]
+        p_hat = float(np.max((repeats.q[:frequent] / (n - w + 1)) ** (1.0 / w)))
+        t_tuple = _estimate("t_tuple", p_hat + _Z_ALPHA * sqrt(p_hat * (1.0 - p_hat) / (n - 1)), bits)
+    else:
+        t_tuple = _estimate("t_tuple", None)
+
+    first, last = frequent + 1, repeats.pairs.size
+    if first > last or not repeats.pairs[last - 1]:
+        return t_tuple, _estimate("lrs", None)
+    w = lengths[first - 1 : last]
+    positions = n - w + 1
+    collisions = repeats.pairs[first - 1 : last] / (positions * (positions - 1) / 2.0)
+    p_hat = float(np.max(collisions ** (1.0 / w)))
+    return t_tuple, _estimate("lrs", p_hat + _Z_ALPHA * sqrt(p_hat * (1.0 - p_hat) / (n - 1)), bits)
+
+
+def _lowest(estimates: list[MinEntropyEstimate], bits: int) -> float:
+    values = [estimate.min_entropy for estimate in estimates if estimate.min_entropy is not None]
+    return min(values, default=float(bits))
+
+
+def estimate_min_entropy(samples: np.ndarray, bits_per_sample: int = 8) -> MinEntropyReport:
+    """SP 800-90B non-IID min-entropy of `samples`, per sample and per bit of their binary form."""
+    samples = np.ascontiguousarray(samples).reshape(-1)
+    if samples.size < 2:
+        raise ValueError("at least two samples are required for min-entropy estimation")
+    if bits_per_sample == 8:
+        samples = samples.astype(np.uint8, copy=False)
+        bitstring = np.unpackbits(samples)
+    else:
+        samples = samples.astype(np.int64, copy=False)
+        shifts = np.arange(bits_per_sample - 1, -1, -1, dtype=np.int64)
+        bitstring = ((samples[:, None] >> shifts) & 1).astype(np.uint8).reshape(-1)
+
+    original = [most_common_value(samples, bits_per_sample), *tuple_estimates(samples, bits_per_sample)]
+    binary = [
+        most_common_value(bitstring, 1),
+        collision(bitstring),
+        markov(bitstring),
+        compression(bitstring),
+        *tuple_estimates(bitstring, 1),
+    ]
+    h_original = _lowest(original, bits_per_sample)
+    h_bitstring = _lowest(binary, 1)
+    return MinEntropyReport(
+        samples=int(samples.size),
+        bits_per_sample=bits_per_sample,
+        original=original,
+        bitstring=binary,
+        h_original=h_original,
+        h_bitstring=h_bitstring,
+        min_entropy=min(h_original, bits_per_sample * h_bitstring),
+    )
@@ -0,0 +1,703 @@
+"""NIST SP 800-22 rev. 1a statistical tests over packed bit sequences.
+
+Every test returns a `TestOutcome` whose metric is the P-value (the smallest one for tests that
+produce several) and whose threshold is the significance level, Bonferroni-corrected when a test
+reports more than one P-value.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from math import erf, erfc, exp, floor, lgamma, log, log2, sqrt
+
+import numpy as np
+
+from .base import BitSource, PackedBits, SequenceTooShortError, TestOutcome, as_packed_bits
+
+ALPHA = 0.01
+
+_MACHEP = 1.11022302462515654042e-16
+_MAXLOG = 7.09782712893383996843e2
+_BIG = 4.503599627370496e15
+_BIGINV = 2.22044604925031308085e-16
+
+# Longest run of ones: (block size, lowest class, highest class, class probabilities) per input size.
+_LONGEST_RUN_TABLES = (
+    (6272, 8, 1, 4, (0.2148, 0.3672, 0.2305, 0.1875)),
+    (750_000, 128, 4, 9, (0.1174, 0.2430, 0.2493, 0.1752, 0.1027, 0.1124)),
+    (None, 10_000, 10, 16, (0.0882, 0.2092, 0.2483, 0.1933, 0.1208, 0.0675, 0.0727)),
+)
+# Overlapping template of 9 ones in 1032-bit blocks (corrected probabilities from rev. 1a).
+_OVERLAPPING_PI = np.array([0.364091, 0.185659, 0.139381, 0.100571, 0.070432, 0.139865])
+OVERLAPPING_BLOCK = 1032
+# Maurer's universal test: minimum input size per block length L, expected value and variance.
+_UNIVERSAL_MIN_LENGTHS = (
+    (6, 387_840),
+    (7, 904_960),
+    (8, 2_068_480),
+    (9, 4_654_080),
+    (10, 10_342_400),
+    (11, 22_753_280),
+    (12, 49_643_520),
+    (13, 107_560_960),
+    (14, 231_669_760),
+    (15, 496_435_200),
+    (16, 1_059_061_760),
+)
+_UNIVERSAL_EXPECTED = {
+    6: (5.2177052, 2.954),
+    7: (6.1962507, 3.125),
+    8: (7.1836656, 3.238),
+    9: (8.1764248, 3.311),
+    10: (9.1723243, 3.356),
+    11: (10.170032, 3.384),
+    12: (11.168765, 3.401),
+    13: (12.168070, 3.410),
+    14: (13.167693, 3.416),
+    15: (14.167488, 3.419),
+    16: (15.167379, 3.421),
+}
+_LINEAR_COMPLEXITY_PI = np.array([0.010417, 0.03125, 0.125, 0.5, 0.25, 0.0625, 0.020833])
+EXCURSION_STATES = (-4, -3, -2, -1, 1, 2, 3, 4)
+_VARIANT_STATES = tuple(x for x in range(-9, 10) if x != 0)
+_MIN_EXCURSION_CYCLES = 500
+# Window values are computed over slices of this many bits in long blocks.
+_WINDOW_SLICE_BITS = 1 << 22
+
+
+def igamc(a: float, x: float) -> float:
+    """Regularized upper incomplete gamma function Q(a, x) (Cephes algorithm)."""
+    if x <= 0 or a <= 0:
+        return 1.0
+    if x < 1.0 or x < a:
+        return 1.0 - igam(a, x)
+    ax = a * log(x) - x - lgamma(a)
+    if ax < -_MAXLOG:
+        return 0.0
+    ax = exp(ax)
+
+    # Continued fraction expansion.
+    y = 1.0 - a
+    z = x + y + 1.0
+    c = 0.0
+    pkm2, qkm2 = 1.0, x
+    pkm1, qkm1 = x + 1.0, z * x
+    ans = pkm1 / qkm1
+    while True:
+        c += 1.0
+        y += 1.0
+        z += 2.0
+        yc = y * c
+        pk = pkm1 * z - pkm2 * yc
+        qk = qkm1 * z - qkm2 * yc
+        if qk != 0:
+            r = pk / qk
+            t = abs((ans - r) / r)
+            ans = r
+        else:
+            t = 1.0
+        pkm2, pkm1 = pkm1, pk
+        qkm2, qkm1 = qkm1, qk
+        if abs(pk) > _BIG:
+            pkm2 *= _BIGINV
+            pkm1 *= _BIGINV
+            qkm2 *= _BIGINV
+            qkm1 *= _BIGINV
+        if t <= _MACHEP:
+            return ans * ax
+
+
+def igam(a: float, x: float) -> float:
+    """Regularized lower incomplete gamma function P(a, x) (Cephes algorithm)."""
+    if x <= 0 or a <= 0:
+        return 0.0
+    if x > 1.0 and x > a:
+        return 1.0 - igamc(a, x)
+    ax = a * log(x) - x - lgamma(a)
+    if ax < -_MAXLOG:
+        return 0.0
+    ax = exp(ax)
+
+    # Power series.
+    r = a
+    c = 1.0
+    ans = 1.0
+    while True:
+        r += 1.0
+        c *= x / r
+        ans += c
+        if c / ans <= _MACHEP:
+            return ans * ax / a
+
+
+def _normal_cdf(value: float) -> float:
+    return 0.5 * (1.0 + erf(value / sqrt(2.0)))
+
+
+def _outcome(name: str, p_values: dict[str, float], details: dict[str, float]) -> TestOutcome:
+    p_value = min(p_values.values())
+    threshold = ALPHA / len(p_values)
+    return TestOutcome(
+        name=name,
+        passed=p_value >= threshold,
+        metric=p_value,
+        threshold=threshold,
+        details={**details, "p_value": p_value, **({} if len(p_values) == 1 else p_values)},
+    )
+
+
+def require(condition: bool, message: str) -> None:
+    if not condition:
+        raise SequenceTooShortError(message)
+
+
+def window_values(bits: np.ndarray, m: int, wrap: bool) -> np.ndarray:
+    """Integer value (MSB first) of every m-bit window; `wrap` appends the first m - 1 bits."""
+    sequence = np.concatenate([bits, bits[: m - 1]]) if wrap else bits
+    count = sequence.size - m + 1
+    values = np.zeros(max(count, 0), dtype=np.int64)
+    for offset in range(m):
+        values <<= 1
+        values |= sequence[offset : offset + count]
+    return values
+
+
+def _chi_square(observed: np.ndarray, expected: np.ndarray) -> float:
+    return float((((observed - expected) ** 2) / expected).sum())
+
+
+def block_frequency_test(bits: BitSource, block_size: int = 128) -> TestOutcome:
+    """Frequency test within blocks (SP 800-22 §2.2)."""
+    packed = as_packed_bits(bits)
+    n = len(packed)
+    block_frequency_count(n, block_size)
+    ones = packed.block_ones(block_size)
+    square_sum = float(((ones / block_size - 0.5) ** 2).sum())
+    return block_frequency_outcome(square_sum, int(ones.size), block_size)
+
+
+def block_frequency_count(n: int, block_size: int = 128) -> int:
+    require(n >= 100 and n >= block_size, "sequence too short for block frequency test")
+    return n // block_size
+
+
+def block_frequency_outcome(square_sum: float, blocks: int, block_size: int) -> TestOutcome:
+    chi_square = 4.0 * block_size * square_sum
+    p_value = igamc(blocks / 2.0, chi_square / 2.0)
+    return _outcome(
+        "block_frequency",
+        {"p_value": p_value},
+        {"chi_square": chi_square, "blocks": blocks, "block_size": block_size},
+    )
+
+
+def longest_runs(blocks: np.ndarray) -> np.ndarray:
+    # Zero columns around every block turn each row's runs into gaps between consecutive zeros.
+    count, width = blocks.shape
+    framed = np.zeros((count, width + 2), dtype=np.uint8)
+    framed[:, 1:-1] = blocks
+    zeros = np.flatnonzero(framed.reshape(-1) == 0)
+    gaps = np.diff(zeros) - 1
+    longest = np.zeros(count, dtype=np.int64)
+    np.maximum.at(longest, zeros[:-1] // (width + 2), gaps)
+    return longest
+
+
+def longest_run_test(bits: BitSource) -> TestOutcome:
+    """Test for the longest run of ones in a block (SP 800-22 §2.4)."""
+    packed = as_packed_bits(bits)
+    n = len(packed)
+    block_size = longest_run_block_size(n)
+    count = n // block_size
+    blocks = packed.unpack()[: count * block_size].reshape(count, block_size)
+    return longest_run_outcome(longest_run_classes(longest_runs(blocks), block_size), block_size)
+
+
+def longest_run_block_size(n: int) -> int:
+    require(n >= 128, "sequence too short for longest run test")
+    return next(size for limit, size, _, _, _ in _LONGEST_RUN_TABLES if limit is None or n < limit)
+
+
+def _longest_run_table(block_size: int) -> tuple[int, int, tuple[float, ...]]:
+    return next((low, high, pi) for _, size, low, high, pi in _LONGEST_RUN_TABLES if size == block_size)
+
+
+def longest_run_classes(longest: np.ndarray, block_size: int) -> np.ndarray:
+    lowest, highest, pi = _longest_run_table(block_size)
+    return np.bincount(np.clip(longest, lowest, highest) - lowest, minlength=len(pi))
+
+
+def longest_run_outcome(observed: np.ndarray, block_size: int) -> TestOutcome:
+    _, _, pi = _longest_run_table(block_size)
+    count = int(observed.sum())
+    chi_square = _chi_square(observed, count * np.asarray(pi))
+    p_value = igamc((len(pi) - 1) / 2.0, chi_square / 2.0)
+    return _outcome(
+        "longest_run",
+        {"p_value": p_value},
+        {"chi_square": chi_square, "blocks": count, "block_size": block_size},
+    )
+
+
+def gf2_ranks(rows: np.ndarray, width: int) -> np.ndarray:
+    """Rank over GF(2) of a batch of matrices given as (count, rows) arrays of row bitmasks."""
+    rows = rows.copy()
+    count, height = rows.shape
+    ranks = np.zeros(count, dtype=np.int64)
+    used = np.zeros((count, height), dtype=bool)
+    # Gaussian elimination runs column by column on every matrix at once.
+    for column in range(width):
+        bit = rows.dtype.type(1 << (width - 1 - column))
+        candidates = ((rows & bit) != 0) & ~used
+        matrices = np.flatnonzero(candidates.any(axis=1))
+        if matrices.size == 0:
+            continue
+        pivots = candidates[matrices].argmax(axis=1)
+        pivot_rows = rows[matrices, pivots]
+        eliminate = (rows[matrices] & bit) != 0
+        eliminate[np.arange(matrices.size), pivots] = False
+        rows[matrices] ^= np.where(eliminate, pivot_rows[:, np.newaxis], 0).astype(rows.dtype)
+        used[matrices, pivots] = True
+        ranks[matrices] += 1
+    return ranks
+
+
+def _rank_probability(rank: int, rows: int, cols: int) -> float:
+    product = 1.0
+    for i in range(rank):
+        product *= (1.0 - 2.0 ** (i - rows)) * (1.0 - 2.0 ** (i - cols)) / (1.0 - 2.0 ** (i - rank))
+    return 2.0 ** (rank * (rows + cols - rank) - rows * cols) * product
+
+
+def matrix_rank_test(bits: BitSource, size: int = 32) -> TestOutcome:
+    """Binary matrix rank test on size x size matrices (SP 800-22 §2.5)."""
+    packed = as_packed_bits(bits)
+    count = matrix_rank_count(len(packed), size)
+    matrices = packed.unpack()[: count * size * size].reshape(count, size * size)
+    return matrix_rank_outcome(matrix_rank_classes(matrices, size), size)
+
+
+def matrix_rank_count(n: int, size: int = 32) -> int:
+    count = n // (size * size)
+    require(count >= 38, "sequence too short for binary matrix rank test")
+    return count
+
+
+def matrix_rank_classes(matrices: np.ndarray, size: int) -> np.ndarray:
+    """Counts of full rank, rank - 1 and lower for (count, size * size) unpacked matrices."""
+    count = matrices.shape[0]
+    weights = np.left_shift(np.uint64(1), np.arange(size - 1, -1, -1, dtype=np.uint64))
+    rows = (matrices.reshape(count * size, size).astype(np.uint64) * weights).sum(axis=1, dtype=np.uint64)
+    ranks = gf2_ranks(rows.reshape(count, size), size)
+    return np.array(
+        [np.count_nonzero(ranks == size), np.count_nonzero(ranks == size - 1), np.count_nonzero(ranks < size - 1)]
+    )
+
+
+def matrix_rank_outcome(observed: np.ndarray, size: int) -> TestOutcome:
+    count = int(observed.sum())
+    full = _rank_probability(size, size, size)
+    deficient = _rank_probability(size - 1, size, size)
+    expected = count * np.array([full, deficient, 1.0 - full - deficient])
+    chi_square = _chi_square(observed, expected)
+    p_value = exp(-chi_square / 2.0)
+    return _outcome(
+        "matrix_rank",
+        {"p_value": p_value},
+        {"chi_square": chi_square, "matrices": count, "full_rank": int(observed[0])},
+    )
+
+
+def dft_test(bits: BitSource) -> TestOutcome:
+    """Discrete Fourier transform (spectral) test (SP 800-22 §2.6)."""
+    packed = as_packed_bits(bits)
+    n = len(packed)
+    require(n >= 1000, "sequence too short for DFT test")
+    signal = packed.unpack().astype(np.float64) * 2.0 - 1.0
+    modulus = np.abs(np.fft.rfft(signal)[: n // 2])
+    threshold = sqrt(log(1.0 / 0.05) * n)
+    expected_peaks = 0.95 * n / 2.0
+    peaks = int(np.count_nonzero(modulus < threshold))
+    d = (peaks - expected_peaks) / sqrt(n * 0.95 * 0.05 / 4.0)
+    p_value = erfc(abs(d) / sqrt(2.0))
+    return _outcome("dft", {"p_value": p_value}, {"peaks_below_threshold": peaks, "d": d})
+
+
+@lru_cache(maxsize=None)
+def aperiodic_templates(length: int) -> tuple[int, ...]:
+    """All m-bit templates that cannot overlap a shifted copy of themselves."""
+    templates = []
+    mask = (1 << length) - 1
+    for template in range(1 << length):
+        if all((template >> shift) != (template & (mask >> shift)) for shift in range(1, length)):
+            templates.append(template)
+    return tuple(templates)
+
+
+def non_overlapping_block_size(n: int, template_length: int = 9, blocks: int = 8) -> int:
+    block_size = n // blocks
+    require(
+        block_size >= (1 << template_length) + template_length - 1,
+        "sequence too short for non-overlapping template test",
+    )
+    return block_size
+
+
+def non_overlapping_template_test(bits: BitSource, template_length: int = 9, blocks: int = 8) -> TestOutcome:
+    """Non-overlapping template matching test over every aperiodic template (SP 800-22 §2.7)."""
+    packed = as_packed_bits(bits)
+    m = template_length
+    block_size = non_overlapping_block_size(len(packed), m, blocks)
+    rows = packed.unpack()[: blocks * block_size].reshape(blocks, block_size)
+    return non_overlapping_template_outcome(non_overlapping_counts(rows, m), block_size, m)
+
+
+def non_overlapping_counts(blocks: np.ndarray, template_length: int = 9) -> np.ndarray:
+    """Per-block counts of every m-bit window value for (count, block_size) unpacked blocks."""
+    m = template_length
+    counts = np.zeros((blocks.shape[0], 1 << m), dtype=np.int64)
+    # Aperiodic templates cannot match twice within m bits, so greedy non-overlapping counting
+    # reduces to counting every in-block window that equals the template. Blocks grow with the
+    # input, so their windows are valued a slice at a time instead of an int64 per bit at once.
+    for row, block in zip(counts, blocks):
+        for start in range(0, max(block.size - m + 1, 0), _WINDOW_SLICE_BITS):
+            windows = window_values(block[start : start + _WINDOW_SLICE_BITS + m - 1], m, wrap=False)
+            row += np.bincount(windows, minlength=row.size)
+    return counts
+
+
+def non_overlapping_template_outcome(counts: np.ndarray, block_size: int, template_length: int) -> TestOutcome:
+    """Outcome from (blocks, 2**m) per-block counts of every m-bit window value."""
+    m = template_length
+    blocks = counts.shape[0]
+    templates = np.array(aperiodic_templates(m))
+    observed = counts[:, templates]
+
+    mean = (block_size - m + 1) / 2.0**m
+    variance = block_size * (1.0 / 2.0**m - (2.0 * m - 1.0) / 2.0 ** (2 * m))
+    chi_squares = (((observed - mean) ** 2) / variance).sum(axis=0)
+    p_values = np.array([igamc(blocks / 2.0, chi / 2.0) for chi in chi_squares])
+    p_value = float(p_values.min())
+    threshold = ALPHA / templates.size
+    return TestOutcome(
+        name="non_overlapping_template",
+        passed=p_value >= threshold,
+        metric=p_value,
+        threshold=threshold,
+        details={
+            "p_value": p_value,
+            "templates": templates.size,
+            "template_length": m,
+            "proportion_passed": float(np.count_nonzero(p_values >= ALPHA) / templates.size),
+        },
+    )
+
+
+def overlapping_block_count(n: int) -> int:
+    count = n // OVERLAPPING_BLOCK
+    # Keeps every class expectation above five so the chi-square approximation holds.
+    require(count * _OVERLAPPING_PI.min() >= 5, "sequence too short for overlapping template test")
+    return count
+
+
+def overlapping_template_classes(blocks: np.ndarray, template_length: int = 9) -> np.ndarray:
+    """Class counts (0..5+ matches of the all-ones template) for (count, 1032) unpacked blocks."""
+    count, width = blocks.shape
+    windows = window_values(blocks.reshape(-1), template_length, wrap=False)
+    hits = np.zeros(count * width, dtype=np.uint8)
+    hits[: windows.size] = windows == (1 << template_length) - 1
+    matches = hits.reshape(count, width)[:, : width - template_length + 1].sum(axis=1)
+    return np.bincount(np.minimum(matches, _OVERLAPPING_PI.size - 1), minlength=_OVERLAPPING_PI.size)
+
+
+def overlapping_template_test(bits: BitSource, template_length: int = 9) -> TestOutcome:
+    """Overlapping template matching test with the all-ones template (SP 800-22 §2.8)."""
+    packed = as_packed_bits(bits)
+    count = overlapping_block_count(len(packed))
+    blocks = packed.unpack()[: count * OVERLAPPING_BLOCK].reshape(count, OVERLAPPING_BLOCK)
+    return overlapping_template_outcome(overlapping_template_classes(blocks, template_length))
+
+
+def overlapping_template_outcome(observed: np.ndarray) -> TestOutcome:
+    count = int(observed.sum())
+    chi_square = _chi_square(observed, count * _OVERLAPPING_PI)
+    p_value = igamc((_OVERLAPPING_PI.size - 1) / 2.0, chi_square / 2.0)
+    return _outcome("overlapping_template", {"p_value": p_value}, {"chi_square": chi_square, "blocks": count})
+
+
+def universal_parameters(n: int) -> tuple[int, int]:
+    """Block length L and initialization segment size Q for an n-bit input."""
+    require(n >= _UNIVERSAL_MIN_LENGTHS[0][1], "sequence too short for universal test")
+    block = max(size for size, minimum in _UNIVERSAL_MIN_LENGTHS if n >= minimum)
+    return block, 10 * (1 << block)
+
+
+def previous_occurrences(values: np.ndarray) -> np.ndarray:
+    """Index of the previous equal value for every position, or -1 when there is none."""
+    order = np.argsort(values, kind="stable")
+    previous_sorted = np.full(values.size, -1, dtype=np.int64)
+    same = values[order[1:]] == values[order[:-1]]
+    previous_sorted[1:] = np.where(same, order[:-1], -1)
+    previous = np.empty(values.size, dtype=np.int64)
+    previous[order] = previous_sorted
+    return previous
+
+
+def universal_test(bits: BitSource) -> TestOutcome:
+    """Maurer's "universal statistical" test (SP 800-22 §2.9)."""
+    packed = as_packed_bits(bits)
+    n = len(packed)
+    block, init = universal_parameters(n)
+    total = n // block
+    weights = 1 << np.arange(block - 1, -1, -1, dtype=np.int64)
+    values = packed.unpack()[: total * block].reshape(total, block) @ weights
+
+    # 1-based distance to the previous occurrence; a value never seen counts from position 0.
+    previous = previous_occurrences(values) + 1
+    positions = np.arange(init + 1, total + 1, dtype=np.int64)
+    log_sum = float(np.log2(positions - previous[init:]).sum())
+    return universal_outcome(log_sum, block, total - init)
+
+
+def universal_outcome(log_sum: float, block: int, tested: int) -> TestOutcome:
+    fn = log_sum / tested
+    expected, variance = _UNIVERSAL_EXPECTED[block]
+    c = 0.7 - 0.8 / block + (4 + 32 / block) * tested ** (-3 / block) / 15
+    sigma = c * sqrt(variance / tested)
+    p_value = erfc(abs(fn - expected) / (sqrt(2.0) * sigma))
+    return _outcome("universal", {"p_value": p_value}, {"fn": fn, "block_length": block, "blocks": tested})
+
+
+def linear_complexities(blocks: np.ndarray) -> np.ndarray:
+    """Berlekamp-Massey over GF(2), run on all blocks in lockstep on bit-packed words."""
+    count, length = blocks.shape
+    words = (length + 1) // 64 + 1
+    # Bit k + 1 holds s_k, so that a connection polynomial stored reversed lines up with the history.
+    padded = np.zeros((count, words * 64), dtype=np.uint8)
+    padded[:, 1 : length + 1] = blocks
+    sequence = np.packbits(padded, axis=1, bitorder="little").view("<u8")
+    # At step n bit (n + 1 - i) of `reversed_c` holds C_i; `reversed_b` keeps B aligned to step m,
+    # which is exactly the term x^(n - m) * B(x) contributes at any later step n.
+    reversed_c = np.zeros((count, words), dtype=np.uint64)
+    reversed_c[:, 0] = 2
+    # B = 1 with m = -1 sits one position below C_0.
+    reversed_b = np.zeros((count, words), dtype=np.uint64)
+    reversed_b[:, 0] = 1
+    complexity = np.zeros(count, dtype=np.int64)
+    one, top = np.uint64(1), np.uint64(63)
+    for n in range(length):
+        # Only words up to bit n + 1 are populated yet.
+        active = (n + 1) // 64 + 1
+        c, b = reversed_c[:, :active], reversed_b[:, :active]
+        parity = np.bitwise_count(c & sequence[:, :active]).sum(axis=1, dtype=np.uint64) & one
+        grow = parity.astype(bool) & (2 * complexity <= n)
+        previous = c.copy()
+        # Branch-free masked updates beat fancy indexing on the mostly-updated rows.
+        c ^= b & (np.uint64(0) - parity)[:, np.newaxis]
+        np.copyto(b, previous, where=grow[:, np.newaxis])
+        complexity = np.where(grow, n + 1 - complexity, complexity)
+        span = min(active + 1, words)
+        carry = reversed_c[:, : span - 1] >> top
+        reversed_c[:, :span] <<= one
+        reversed_c[:, 1:span] |= carry
+    return complexity
+
+
+def linear_complexity_classes(blocks: np.ndarray) -> np.ndarray:
+    """Counts of the seven T_i classes for (count, M) unpacked blocks."""
+    m = blocks.shape[1]
+    complexity = linear_complexities(blocks)
+    mean = m / 2.0 + (9.0 + (-1) ** (m + 1)) / 36.0 - (m / 3.0 + 2.0 / 9.0) / 2.0**m
+    t = (-1) ** m * (complexity - mean) + 2.0 / 9.0
+    classes = np.digitize(t, [-2.5, -1.5, -0.5, 0.5, 1.5, 2.5], right=True)
+    return np.bincount(classes, minlength=_LINEAR_COMPLEXITY_PI.size)
+
+
+def linear_complexity_block_count(n: int, block_size: int = 500) -> int:
+    count = n // block_size
+    require(count >= 200, "sequence too short for linear complexity test")
+    return count
+
+
+def linear_complexity_test(bits: BitSource, block_size: int = 500) -> TestOutcome:
+    """Linear complexity test (SP 800-22 §2.10)."""
+    packed = as_packed_bits(bits)
+    count = linear_complexity_block_count(len(packed), block_size)
+    blocks = packed.unpack()[: count * block_size].reshape(count, block_size)
+    return linear_complexity_outcome(linear_complexity_classes(blocks))
+
+
+def linear_complexity_outcome(observed: np.ndarray) -> TestOutcome:
+    count = int(observed.sum())
+    chi_square = _chi_square(observed, count * _LINEAR_COMPLEXITY_PI)
+    p_value = igamc((_LINEAR_COMPLEXITY_PI.size - 1) / 2.0, chi_square / 2.0)
+    return _outcome("linear_complexity", {"p_value": p_value}, {"chi_square": chi_square, "blocks": count})
+
+
+def _psi_square(counts: np.ndarray, n: int) -> float:
+    if counts.size <= 1:
+        return 0.0
+    counts = counts.astype(np.float64)
+    return float(counts.size / n * (counts**2).sum() - n)
+
+
+def _fold(counts: np.ndarray) -> np.ndarray:
+    # Wrapped (m - 1)-bit windows are the m-bit ones with their last bit dropped.
+    return counts.reshape(-1, 2).sum(axis=1)
+
+
+def serial_block_length(n: int, block_length: int = 16) -> int:
+    m = min(block_length, floor(log2(max(n, 1))) - 3)
+    require(m >= 2, "sequence too short for serial test")
+    return m
+
+
+def serial_test(bits: BitSource, block_length: int = 16) -> TestOutcome:
+    """Serial test; m is capped at floor(log2 n) - 3 as SP 800-22 §2.11 recommends."""
+    packed = as_packed_bits(bits)
+    n = len(packed)
+    m = serial_block_length(n, block_length)
+    windows = window_values(packed.unpack(), m, wrap=True)
+    return serial_outcome(np.bincount(windows, minlength=1 << m), n)
+
+
+def serial_outcome(counts: np.ndarray, n: int) -> TestOutcome:
+    """Outcome from the counts of every wrapped m-bit window value."""
+    m = counts.size.bit_length() - 1
+    psi_m = _psi_square(counts, n)
+    psi_m1 = _psi_square(_fold(counts), n)
+    psi_m2 = _psi_square(_fold(_fold(counts)), n)
+    delta1 = psi_m - psi_m1
+    delta2 = psi_m - 2.0 * psi_m1 + psi_m2
+    p_values = {
+        "p_value_1": igamc(2.0 ** (m - 2), delta1 / 2.0),
+        "p_value_2": igamc(2.0 ** (m - 3), delta2 / 2.0),
+    }
+    return _outcome("serial", p_values, {"block_length": m, "delta_1": delta1, "delta_2": delta2})
+
+
+def _phi(counts: np.ndarray, n: int) -> float:
+    frequencies = counts[counts > 0] / n
+    return float((frequencies * np.log(frequencies)).sum())
+
+
+def approximate_entropy_block_length(n: int, block_length: int = 10) -> int:
+    m = min(block_length, floor(log2(max(n, 1))) - 6)
+    require(m >= 1, "sequence too short for approximate entropy test")
+    return m
+
+
+def approximate_entropy_test(bits: BitSource, block_length: int = 10) -> TestOutcome:
+    """Approximate entropy test; m is capped at floor(log2 n) - 6 as SP 800-22 §2.12 recommends."""
+    packed = as_packed_bits(bits)
+    n = len(packed)
+    m = approximate_entropy_block_length(n, block_length)
+    windows = window_values(packed.unpack(), m + 1, wrap=True)
+    return approximate_entropy_outcome(np.bincount(windows, minlength=1 << (m + 1)), n)
+
+
+def approximate_entropy_outcome(counts: np.ndarray, n: int) -> TestOutcome:
+    """Outcome from the counts of every wrapped (m + 1)-bit window value."""
+    m = counts.size.bit_length() - 2
+    apen = _phi(_fold(counts), n) - _phi(counts, n)
+    chi_square = 2.0 * n * (log(2.0) - apen)
+    p_value = igamc(2.0 ** (m - 1), chi_square / 2.0)
+    return _outcome(
+        "approximate_entropy",
+        {"p_value": p_value},
+        {"apen": apen, "chi_square": chi_square, "block_length": m},
+    )
+
+
+def _cusum_p_value(n: int, z: int) -> float:
+    root = sqrt(n)
+    # int() truncates toward zero exactly like the reference implementation's casts.
+    first = sum(
+        _normal_cdf((4 * k + 1) * z / root) - _normal_cdf((4 * k - 1) * z / root)
+        for k in range(int((-n / z + 1) / 4), int((n / z - 1) / 4) + 1)
+    )
+    second = sum(
+        _normal_cdf((4 * k + 3) * z / root) - _normal_cdf((4 * k + 1) * z / root)
+        for k in range(int((-n / z - 3) / 4), int((n / z - 1) / 4) + 1)
+    )
+    return 1.0 - first + second
+
+
+def cumulative_sums_test(bits: BitSource) -> TestOutcome:
+    """Cumulative sums test in forward and backward mode (SP 800-22 §2.13)."""
+    packed = as_packed_bits(bits)
+    n = len(packed)
+    require(n >= 100, "sequence too short for cumulative sums test")
+    walk = np.cumsum(packed.unpack().astype(np.int64) * 2 - 1)
+    # Backward partial sums are S_n - S_k, so the walk's extremes (with S_0 = 0) determine both modes.
+    return cumulative_sums_outcome(n, int(walk[-1]), min(int(walk.min()), 0), max(int(walk.max()), 0))
+
+
+def cumulative_sums_outcome(n: int, final: int, lowest: int, highest: int) -> TestOutcome:
+    z_forward = max(abs(lowest), abs(highest))
+    z_backward = max(abs(final - lowest), abs(final - highest))
+    p_values = {
+        "p_value_forward": _cusum_p_value(n, z_forward),
+        "p_value_backward": _cusum_p_value(n, z_backward),
+    }
+    return _outcome("cumulative_sums", p_values, {"z_forward": z_forward, "z_backward": z_backward})
+
+
+def _random_walk(packed: PackedBits) -> tuple[np.ndarray, int]:
+    walk = np.cumsum(packed.unpack().astype(np.int64) * 2 - 1)
+    # Every return to zero closes a cycle; a walk that does not end at zero closes one more.
+    cycles = int(np.count_nonzero(walk == 0)) + int(walk[-1] != 0)
+    return walk, cycles
+
+
+def _excursion_probabilities(state: int) -> np.ndarray:
+    q = 1.0 / (2.0 * abs(state))
+    pi = [1.0 - q]
+    pi += [1.0 / (4.0 * state * state) * (1.0 - q) ** (k - 1) for k in range(1, 5)]
+    pi.append(q * (1.0 - q) ** 4)
+    return np.array(pi)
+
+
+def random_excursions_test(bits: BitSource) -> TestOutcome:
+    """Random excursions test for states -4..4 (SP 800-22 §2.14)."""
+    packed = as_packed_bits(bits)
+    require(len(packed) > 0, "sequence too short for random excursions test")
+    walk, cycles = _random_walk(packed)
+    zeros = walk == 0
+    # Cycle index of every step: the number of returns to zero strictly before it.
+    cycle_ids = np.cumsum(zeros) - zeros
+    observed = np.stack(
+        [
+            np.bincount(np.minimum(np.bincount(cycle_ids[walk == state], minlength=cycles), 5), minlength=6)
+            for state in EXCURSION_STATES
+        ]
+    )
+    return random_excursions_outcome(observed, cycles)
+
+
+def random_excursions_outcome(observed: np.ndarray, cycles: int) -> TestOutcome:
+    """Outcome from (states, 6) counts of cycles visiting each state 0..5+ times."""
+    require(cycles >= _MIN_EXCURSION_CYCLES, "not enough cycles for random excursions test")
+    p_values: dict[str, float] = {}
+    for state, row in zip(EXCURSION_STATES, observed):
+        chi_square = _chi_square(row, cycles * _excursion_probabilities(state))
+        p_values[f"p_value_{state:+d}"] = igamc(2.5, chi_square / 2.0)
+    return _outcome("random_excursions", p_values, {"cycles": cycles})
+
+
+def random_excursions_variant_test(bits: BitSource) -> TestOutcome:
+    """Random excursions variant test for states -9..9 (SP 800-22 §2.15)."""
+    packed = as_packed_bits(bits)
+    require(len(packed) > 0, "sequence too short for random excursions variant test")
+    walk, cycles = _random_walk(packed)
+    return random_excursions_variant_outcome(np.bincount(np.clip(walk, -10, 10) + 10, minlength=21), cycles)
+
+
+def random_excursions_variant_outcome(visits: np.ndarray, cycles: int) -> TestOutcome:
+    """Outcome from visit totals of the clipped walk, indexed by state + 10."""
+    require(cycles >= _MIN_EXCURSION_CYCLES, "not enough cycles for random excursions variant test")
+    p_values = {
+        f"p_value_{state:+d}": erfc(abs(int(visits[state + 10]) - cycles) / sqrt(2.0 * cycles * (4.0 * abs(state) - 2.0)))
+        for state in _VARIANT_STATES
+    }
+    return _outcome("random_excursions_variant", p_values, {"cycles": cycles})
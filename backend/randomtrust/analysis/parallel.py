@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Awaitable, Callable, Iterable
+
+import numpy as np
+
+from randomtrust.core.executor import ComputeExecutor
+
+from . import nist
+from .base import BitSource, PackedBits, SequenceTooShortError, TestOutcome, as_packed_bits
+from .streaming import run_chunked_test
+from .tests import AVAILABLE_TESTS
+
+
+@dataclass(slots=True)
+class TestTiming:
+    name: str
+    segments: int
+    # From the first task starting to the last one finishing, across workers.
+    wall_ms: float
+    # Sum of the run time of every task of the test.
+    compute_ms: float
+
+
+@dataclass(slots=True)
+class ParallelReport:
+    outcomes: list[TestOutcome]
+    timings: list[TestTiming]
+
+
+class SharedMemoryExhaustedError(RuntimeError):
+    """The shared memory filesystem has no room for a segment of the requested size."""
+
+
+_SHM_ROOT = "/dev/shm"
+# Caps the bits one segment task unpacks; extra segments queue behind the busy workers.
+_MAX_SEGMENT_BITS = 1 << 22
+
+
+class _SharedMemoryBudget:
+    # Segments are sparse files on tmpfs, and writing past its capacity kills the process with
+    # SIGBUS. Space is only taken as a segment is written, so bytes promised to this process's
+    # segments but not yet written are subtracted from what the filesystem reports free.
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._unwritten = 0
+
+    def available(self) -> int | None:
+        with self._lock:
+            free = self._free()
+            return None if free is None else max(free - self._unwritten, 0)
+
+    def reserve(self, nbytes: int) -> None:
+        with self._lock:
+            free = self._free()
+            if free is not None and nbytes > free - self._unwritten:
+                raise SharedMemoryExhaustedError(
+                    f"{nbytes} bytes of shared memory requested, {max(free - self._unwritten, 0)} available"
+                )
+            self._unwritten += nbytes
+
+    def release(self, nbytes: int) -> None:
+        with self._lock:
+            self._unwritten -= nbytes
+
+    @staticmethod
+    def _free() -> int | None:
+        try:
+            stats = os.statvfs(_SHM_ROOT)
+        except OSError:
+            # Platforms without a /dev/shm tmpfs back segments differently; nothing to check.
+            return None
+        return stats.f_bavail * stats.f_frsize
+
+
+_BUDGET = _SharedMemoryBudget()
+
+
+def shared_memory_available() -> int | None:
+    """Bytes a new `SharedBits` may still take; `None` where the limit cannot be measured."""
+    return _BUDGET.available()
+
+
+class SharedBits:
+    """Packed bit buffer in a shared memory segment that pool workers attach to by name."""
+
+    def __init__(self, length: int) -> None:
+        self._length = length
+        self._nbytes = (length + 7) // 8
+        _BUDGET.reserve(self._nbytes)
+        try:
+            # Zero-sized segments are rejected by the OS.
+            self._shm = SharedMemory(create=True, size=max(self._nbytes, 1))
+        except BaseException:
+            _BUDGET.release(self._nbytes)
+            raise
+        self._cursor = 0
+        self._written = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_packed(cls, bits: BitSource) -> SharedBits:
+        packed = as_packed_bits(bits)
+        shared = cls(len(packed))
+        try:
+            shared.write(packed.data)
+        except BaseException:
+            shared.close()
+            raise
+        return shared
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def complete(self) -> bool:
+        return self._written == self._nbytes
+
+    def __len__(self) -> int:
+        return self._length
+
+    def write(self, chunk: bytes | bytearray | memoryview | np.ndarray) -> None:
+        size = self.write_at(self._cursor, chunk)
+        self._cursor += size
+
+    def write_at(self, offset: int, chunk: bytes | bytearray | memoryview | np.ndarray) -> int:
+        """Copy `chunk` to byte `offset`; disjoint ranges may be written from several threads."""
+        view = memoryview(chunk).cast("B")
+        end = offset + view.nbytes
+        if end > self._nbytes:
+            raise ValueError("payload exceeds the shared bit buffer")
+        self._shm.buf[offset:end] = view
+        with self._lock:
+            self._written += view.nbytes
+        _BUDGET.release(view.nbytes)
+        return view.nbytes
+
+    def close(self) -> None:
+        _BUDGET.release(self._nbytes - self._written)
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> SharedBits:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+@dataclass(frozen=True, slots=True)
+class _SplitTest:
+    # (block_size, blocks) for an n-bit input; raises SequenceTooShortError like the test itself.
+    layout: Callable[[int], tuple[int, int]]
+    # Summary of consecutive (count, block_size) unpacked blocks, computed inside a worker.
+    summarize: Callable[[np.ndarray], np.ndarray]
+    # Outcome from the segment summaries in sequence order.
+    finish: Callable[[list[np.ndarray], int], TestOutcome]
+
+
+def _longest_run_layout(n: int) -> tuple[int, int]:
+    block_size = nist.longest_run_block_size(n)
+    return block_size, n // block_size
+
+
+# Block-wise tests whose blocks are independent, so sequence segments can run on separate workers.
+_SPLIT_TESTS: dict[str, _SplitTest] = {
+    "longest_run": _SplitTest(
+        layout=_longest_run_layout,
+        summarize=lambda blocks: nist.longest_run_classes(nist.longest_runs(blocks), blocks.shape[1]),
+        finish=lambda parts, block_size: nist.longest_run_outcome(np.sum(parts, axis=0), block_size),
+    ),
+    "matrix_rank": _SplitTest(
+        layout=lambda n: (32 * 32, nist.matrix_rank_count(n)),
+        summarize=lambda blocks: nist.matrix_rank_classes(blocks, 32),
+        finish=lambda parts, _: nist.matrix_rank_outcome(np.sum(parts, axis=0), 32),
+    ),
+    "non_overlapping_template": _SplitTest(
+        layout=lambda n: (nist.non_overlapping_block_size(n), 8),
+        summarize=nist.non_overlapping_counts,
+        finish=lambda parts, block_size: nist.non_overlapping_template_outcome(np.concatenate(parts), block_size, 9),
+    ),
+    "overlapping_template": _SplitTest(
+        layout=lambda n: (nist.OVERLAPPING_BLOCK, nist.overlapping_block_count(n)),
+        summarize=nist.overlapping_template_classes,
+        finish=lambda parts, _: nist.overlapping_template_outcome(np.sum(parts, axis=0)),
+    ),
+    "linear_complexity": _SplitTest(
+        layout=lambda n: (500, nist.linear_complexity_block_count(n)),
+        summarize=nist.linear_complexity_classes,
+        finish=lambda parts, _: nist.linear_complexity_outcome(np.sum(parts, axis=0)),
+    ),
+}
+
+
+def _attached_view(shm: SharedMemory, length: int) -> np.ndarray:
+    view = np.frombuffer(shm.buf, dtype=np.uint8, count=(length + 7) // 8)
+    view.flags.writeable = False
+    return view
+
+
+def _run_whole(shm_name: str, length: int, name: str) -> tuple[float, float, Any]:
+    started_at = time.time()
+    shm = SharedMemory(name=shm_name)
+    try:
+        try:
+            # Whole-sequence tests would need 150-200 bytes per payload byte at once; the accumulators
+            # keep each worker's memory bounded by a chunk.
+            result: Any = run_chunked_test(name, PackedBits(data=_attached_view(shm, length), length=length))
+        except SequenceTooShortError as exc:
+            # A fresh exception carries no traceback frames pinning the shared view.
+            result = SequenceTooShortError(str(exc))
+    finally:
+        try:
+            shm.close()
+        except BufferError:
+            # An unexpected error's traceback still references the view; it is unmapped with it.
+            pass
+    return started_at, time.time(), result
+
+
+def _run_segment(shm_name: str, length: int, name: str, block_size: int, first: int, last: int) -> tuple[float, float, Any]:
+    started_at = time.time()
+    start, stop = first * block_size, last * block_size
+    shm = SharedMemory(name=shm_name)
+    try:
+        # Only the segment's bytes are unpacked; the copy lets the mapping go before the heavy work.
+        covering = np.unpackbits(_attached_view(shm, length)[start // 8 : (stop + 7) // 8])
+    finally:
+        shm.close()
+    offset = start % 8
+    blocks = covering[offset : offset + stop - start].reshape(last - first, block_size)
+    return started_at, time.time(), _SPLIT_TESTS[name].summarize(blocks)
+
+
+def _segments(blocks: int, block_size: int, workers: int, min_segment_bits: int) -> list[tuple[int, int]]:
+    total = blocks * block_size
+    parts = max(min(workers, total // min_segment_bits), -(-total // _MAX_SEGMENT_BITS), 1)
+    parts = min(parts, blocks)
+    edges = [blocks * index // parts for index in range(parts + 1)]
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def _track_progress(calls: list[Awaitable[Any]], progress: Callable[[float], None]) -> list[Awaitable[Any]]:
+    finished = 0
+
+    async def tracked(call: Awaitable[Any]) -> Any:
+        nonlocal finished
+        try:
+            return await call
+        finally:
+            finished += 1
+            progress(finished / len(calls))
+
+    return [tracked(call) for call in calls]
+
+
+async def run_parallel_tests(
+    bits: SharedBits,
+    tests: Iterable[str] | None = None,
+    *,
+    executor: ComputeExecutor,
+    min_segment_bits: int = 1 << 20,
+    progress: Callable[[float], None] | None = None,
+) -> ParallelReport:
+    """Fan the battery out over the executor; outcomes keep the order of the requested tests."""
+    n = len(bits)
+    # Reject empty inputs early to avoid division errors in subsequent tests.
+    if not n:
+        raise ValueError("No bits provided for analysis")
+    if not bits.complete:
+        raise ValueError("shared bit buffer is not completely written")
+    explicit = bool(tests)
+    selected = list(tests or AVAILABLE_TESTS.keys())
+
+    whole: list[int] = []
+    layouts: dict[int, tuple[int, list[tuple[int, int]]]] = {}
+    for index, name in enumerate(selected):
+        # Guard against unsupported identifiers passed from external callers.
+        if name not in AVAILABLE_TESTS:
+            raise ValueError(f"unknown test: {name}")
+        split = _SPLIT_TESTS.get(name)
+        if split is None:
+            whole.append(index)
+            continue
+        try:
+            block_size, blocks = split.layout(n)
+        except SequenceTooShortError:
+            # The default battery skips tests the input is too short for; explicit requests fail.
+            if explicit:
+                raise
+            continue
+        layouts[index] = (block_size, _segments(blocks, block_size, executor.max_workers, min_segment_bits))
+
+    # Unsplittable tests are each one long task, so they are queued ahead of the segments.
+    owners: list[int] = []
+    calls: list[Awaitable[Any]] = []
+    for index in whole:
+        owners.append(index)
+        calls.append(executor.run(_run_whole, bits.name, n, selected[index]))
+    for index, (block_size, ranges) in layouts.items():
+        for first, last in ranges:
+            owners.append(index)
+            calls.append(executor.run(_run_segment, bits.name, n, selected[index], block_size, first, last))
+    if progress is not None:
+        calls = _track_progress(calls, progress)
+    # Every task is awaited before returning, so none outlives the caller's shared segment.
+    results = await asyncio.gather(*calls, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+    parts: dict[int, list[tuple[float, float, Any]]] = {}
+    for index, result in zip(owners, results):
+        parts.setdefault(index, []).append(result)
+
+    outcomes: list[TestOutcome] = []
+    timings: list[TestTiming] = []
+    for index, name in enumerate(selected):
+        if index not in parts:
+            continue
+        tasks = parts[index]
+        values = [value for _, _, value in tasks]
+        if isinstance(values[0], SequenceTooShortError):
+            if explicit:
+                raise values[0]
+            continue
+        if index in layouts:
+            outcomes.append(_SPLIT_TESTS[name].finish(values, layouts[index][0]))
+        else:
+            outcomes.append(values[0])
+        started_at = min(start for start, _, _ in tasks)
+        finished_at = max(finish for _, finish, _ in tasks)
+        timings.append(
+            TestTiming(
+                name=name,
+                segments=len(tasks),
+                wall_ms=(finished_at - started_at) * 1_000.0,
+                compute_ms=sum(finish - start for start, finish, _ in tasks) * 1_000.0,
+            )
+        )
+    return ParallelReport(outcomes=outcomes, timings=timings)
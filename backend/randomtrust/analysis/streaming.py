@@ -0,0 +1,552 @@
+"""Incremental (constant-memory) counterparts of every test in `AVAILABLE_TESTS`.
+
+An accumulator is created for the total number of bits it will receive (several tests pick their
+parameters from it), fed consecutive chunks through `update` and closed with `finalize`, which
+returns the same `TestOutcome` as the in-memory test on the concatenated sequence.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Union
+
+import numpy as np
+
+from . import nist
+from .base import BitSource, PackedBits, SequenceTooShortError, TestOutcome, as_packed_bits
+from .tests import chi_square_outcome, frequency_outcome, runs_outcome
+
+# The spectral test needs the whole sequence at once; longer streams are tested on this prefix.
+DFT_MAX_BITS = 1 << 24
+# Pool workers feed in-memory sequences to the accumulators in chunks of this many bits.
+TASK_CHUNK_BITS = 1 << 22
+
+
+@dataclass(slots=True)
+class BitChunk:
+    """One chunk of a stream; the unpacked view is built once and shared by all accumulators."""
+
+    packed: PackedBits
+    _bits: np.ndarray | None = field(default=None, init=False, repr=False)
+
+    @property
+    def bits(self) -> np.ndarray:
+        if self._bits is None:
+            self._bits = self.packed.unpack()
+        return self._bits
+
+    def __len__(self) -> int:
+        return len(self.packed)
+
+
+ChunkSource = Union[BitChunk, BitSource, bytes, bytearray, memoryview]
+
+
+def as_bit_chunk(chunk: ChunkSource) -> BitChunk:
+    if isinstance(chunk, BitChunk):
+        return chunk
+    if isinstance(chunk, (bytes, bytearray, memoryview)):
+        return BitChunk(PackedBits.from_bytes(chunk))
+    return BitChunk(as_packed_bits(chunk))
+
+
+class _BlockBuffer:
+    """Regroups a stream into complete fixed-size blocks, keeping at most `limit` of them."""
+
+    def __init__(self, block_size: int, limit: int) -> None:
+        self._block_size = block_size
+        self._remaining = limit
+        self._carry = np.empty(0, dtype=np.uint8)
+
+    def push(self, bits: np.ndarray) -> np.ndarray:
+        if self._remaining <= 0:
+            return np.empty((0, self._block_size), dtype=np.uint8)
+        data = np.concatenate([self._carry, bits]) if self._carry.size else bits
+        count = min(data.size // self._block_size, self._remaining)
+        used = count * self._block_size
+        self._carry = data[used : used + self._block_size - 1].copy() if count < self._remaining else self._carry[:0]
+        self._remaining -= count
+        return data[:used].reshape(count, self._block_size)
+
+
+class _WrappedWindows:
+    """Counts every m-bit window of a cyclic sequence (the first m - 1 bits are appended at the end)."""
+
+    def __init__(self, m: int) -> None:
+        self._m = m
+        self._head = np.empty(0, dtype=np.uint8)
+        self._carry = np.empty(0, dtype=np.uint8)
+        self.counts = np.zeros(1 << m, dtype=np.int64)
+
+    def push(self, bits: np.ndarray) -> None:
+        if self._head.size < self._m - 1:
+            self._head = np.concatenate([self._head, bits[: self._m - 1 - self._head.size]])
+        sequence = np.concatenate([self._carry, bits])
+        self._count(sequence)
+        self._carry = sequence[sequence.size - min(sequence.size, self._m - 1) :].copy()
+
+    def close(self) -> None:
+        self._count(np.concatenate([self._carry, self._head]))
+
+    def _count(self, sequence: np.ndarray) -> None:
+        if sequence.size >= self._m:
+            windows = nist.window_values(sequence, self._m, wrap=False)
+            self.counts += np.bincount(windows, minlength=self.counts.size)
+
+
+class TestAccumulator:
+    """Incremental form of one test: `update` with consecutive chunks, then `finalize` once."""
+
+    name: str
+
+    def __init__(self, total_bits: int) -> None:
+        self._total_bits = total_bits
+        self._received = 0
+
+    @property
+    def total_bits(self) -> int:
+        return self._total_bits
+
+    def update(self, chunk: ChunkSource) -> None:
+        chunk = as_bit_chunk(chunk)
+        if self._received + len(chunk) > self._total_bits:
+            raise ValueError(f"{self.name} accumulator received more than {self._total_bits} bits")
+        self._received += len(chunk)
+        if len(chunk):
+            self._consume(chunk)
+
+    def finalize(self) -> TestOutcome:
+        if self._received != self._total_bits:
+            raise ValueError(f"{self.name} accumulator received {self._received} of {self._total_bits} bits")
+        return self._finish()
+
+    def _consume(self, chunk: BitChunk) -> None:
+        raise NotImplementedError
+
+    def _finish(self) -> TestOutcome:
+        raise NotImplementedError
+
+
+class FrequencyAccumulator(TestAccumulator):
+    name = "frequency"
+
+    def __init__(self, total_bits: int) -> None:
+        super().__init__(total_bits)
+        self._ones = 0
+
+    def _consume(self, chunk: BitChunk) -> None:
+        self._ones += chunk.packed.count_ones()
+
+    def _finish(self) -> TestOutcome:
+        return frequency_outcome(self._ones, self._total_bits)
+
+
+class RunsAccumulator(TestAccumulator):
+    name = "runs"
+
+    def __init__(self, total_bits: int) -> None:
+        super().__init__(total_bits)
+        self._ones = 0
+        self._transitions = 0
+        self._last_bit: int | None = None
+
+    def _consume(self, chunk: BitChunk) -> None:
+        packed = chunk.packed
+        self._ones += packed.count_ones()
+        self._transitions += packed.count_transitions()
+        # The boundary between two chunks is the only transition neither chunk sees on its own.
+        first = int(packed.data[0] >> 7)
+        if self._last_bit is not None and self._last_bit != first:
+            self._transitions += 1
+        last = len(packed) - 1
+        self._last_bit = int(packed.data[last // 8] >> (7 - last % 8)) & 1
+
+    def _finish(self) -> TestOutcome:
+        return runs_outcome(self._total_bits, self._ones, self._transitions)
+
+
+class ChiSquareAccumulator(TestAccumulator):
+    name = "chi_square"
+
+    def __init__(self, total_bits: int, block_size: int = 32) -> None:
+        super().__init__(total_bits)
+        if total_bits < block_size:
+            raise SequenceTooShortError("sequence too short for chi-square test")
+        self._block_size = block_size
+        self._blocks = _BlockBuffer(block_size, total_bits // block_size)
+        self._square_sum = 0.0
+        self._ones_sum = 0
+        self._count = 0
+
+    def _consume(self, chunk: BitChunk) -> None:
+        ones = self._blocks.push(chunk.bits).sum(axis=1, dtype=np.int64)
+        self._square_sum += float(((ones - self._block_size / 2) ** 2).sum())
+        self._ones_sum += int(ones.sum())
+        self._count += ones.size
+
+    def _finish(self) -> TestOutcome:
+        return chi_square_outcome(self._square_sum, self._ones_sum, self._count, self._block_size)
+
+
+class BlockFrequencyAccumulator(TestAccumulator):
+    name = "block_frequency"
+
+    def __init__(self, total_bits: int, block_size: int = 128) -> None:
+        super().__init__(total_bits)
+        self._block_size = block_size
+        self._blocks = _BlockBuffer(block_size, nist.block_frequency_count(total_bits, block_size))
+        self._square_sum = 0.0
+        self._count = 0
+
+    def _consume(self, chunk: BitChunk) -> None:
+        ones = self._blocks.push(chunk.bits).sum(axis=1, dtype=np.int64)
+        self._square_sum += float(((ones / self._block_size - 0.5) ** 2).sum())
+        self._count += ones.size
+
+    def _finish(self) -> TestOutcome:
+        return nist.block_frequency_outcome(self._square_sum, self._count, self._block_size)
+
+
+class LongestRunAccumulator(TestAccumulator):
+    name = "longest_run"
+
+    def __init__(self, total_bits: int) -> None:
+        super().__init__(total_bits)
+        self._block_size = nist.longest_run_block_size(total_bits)
+        self._blocks = _BlockBuffer(self._block_size, total_bits // self._block_size)
+        self._observed: np.ndarray | int = 0
+
+    def _consume(self, chunk: BitChunk) -> None:
+        blocks = self._blocks.push(chunk.bits)
+        if blocks.shape[0]:
+            self._observed = self._observed + nist.longest_run_classes(nist.longest_runs(blocks), self._block_size)
+
+    def _finish(self) -> TestOutcome:
+        return nist.longest_run_outcome(np.asarray(self._observed), self._block_size)
+
+
+class MatrixRankAccumulator(TestAccumulator):
+    name = "matrix_rank"
+
+    def __init__(self, total_bits: int, size: int = 32) -> None:
+        super().__init__(total_bits)
+        self._size = size
+        self._blocks = _BlockBuffer(size * size, nist.matrix_rank_count(total_bits, size))
+        self._observed = np.zeros(3, dtype=np.int64)
+
+    def _consume(self, chunk: BitChunk) -> None:
+        matrices = self._blocks.push(chunk.bits)
+        if matrices.shape[0]:
+            self._observed += nist.matrix_rank_classes(matrices, self._size)
+
+    def _finish(self) -> TestOutcome:
+        return nist.matrix_rank_outcome(self._observed, self._size)
+
+
+class DFTAccumulator(TestAccumulator):
+    name = "dft"
+
+    def __init__(self, total_bits: int) -> None:
+        super().__init__(total_bits)
+        nist.require(total_bits >= 1000, "sequence too short for DFT test")
+        self._limit = min(total_bits, DFT_MAX_BITS)
+        self._parts: list[np.ndarray] = []
+        self._buffered = 0
+
+    def _consume(self, chunk: BitChunk) -> None:
+        if self._buffered < self._limit:
+            part = chunk.bits[: self._limit - self._buffered]
+            self._parts.append(part.copy())
+            self._buffered += part.size
+
+    def _finish(self) -> TestOutcome:
+        outcome = nist.dft_test(PackedBits.from_bits(np.concatenate(self._parts)))
+        self._parts.clear()
+        if self._limit < self._total_bits:
+            outcome.details["bits_tested"] = self._limit
+        return outcome
+
+
+class NonOverlappingTemplateAccumulator(TestAccumulator):
+    name = "non_overlapping_template"
+
+    def __init__(self, total_bits: int, template_length: int = 9, blocks: int = 8) -> None:
+        super().__init__(total_bits)
+        self._m = template_length
+        self._blocks = blocks
+        self._block_size = nist.non_overlapping_block_size(total_bits, template_length, blocks)
+        self._counts = np.zeros(blocks << template_length, dtype=np.int64)
+        self._carry = np.empty(0, dtype=np.uint8)
+        self._position = 0
+
+    def _consume(self, chunk: BitChunk) -> None:
+        m = self._m
+        sequence = np.concatenate([self._carry, chunk.bits])
+        if sequence.size >= m:
+            windows = nist.window_values(sequence, m, wrap=False)
+            # Window starts are global bit offsets; only windows fully inside one block count.
+            starts = np.arange(windows.size, dtype=np.int64) + (self._position - self._carry.size)
+            block = starts // self._block_size
+            valid = (block < self._blocks) & (starts % self._block_size <= self._block_size - m)
+            self._counts += np.bincount((block[valid] << m) + windows[valid], minlength=self._counts.size)
+        self._position += len(chunk)
+        self._carry = sequence[sequence.size - min(sequence.size, m - 1) :].copy()
+
+    def _finish(self) -> TestOutcome:
+        counts = self._counts.reshape(self._blocks, 1 << self._m)
+        return nist.non_overlapping_template_outcome(counts, self._block_size, self._m)
+
+
+class OverlappingTemplateAccumulator(TestAccumulator):
+    name = "overlapping_template"
+
+    def __init__(self, total_bits: int, template_length: int = 9) -> None:
+        super().__init__(total_bits)
+        self._m = template_length
+        self._blocks = _BlockBuffer(nist.OVERLAPPING_BLOCK, nist.overlapping_block_count(total_bits))
+        self._observed: np.ndarray | int = 0
+
+    def _consume(self, chunk: BitChunk) -> None:
+        blocks = self._blocks.push(chunk.bits)
+        if blocks.shape[0]:
+            self._observed = self._observed + nist.overlapping_template_classes(blocks, self._m)
+
+    def _finish(self) -> TestOutcome:
+        return nist.overlapping_template_outcome(np.asarray(self._observed))
+
+
+class UniversalAccumulator(TestAccumulator):
+    name = "universal"
+
+    def __init__(self, total_bits: int) -> None:
+        super().__init__(total_bits)
+        self._block, self._init = nist.universal_parameters(total_bits)
+        total = total_bits // self._block
+        self._tested = total - self._init
+        self._blocks = _BlockBuffer(self._block, total)
+        self._weights = 1 << np.arange(self._block - 1, -1, -1, dtype=np.int64)
+        # 1-based index of the latest occurrence of every L-bit value; 0 when not seen yet.
+        self._last_seen = np.zeros(1 << self._block, dtype=np.int64)
+        self._index = 0
+        self._log_sum = 0.0
+
+    def _consume(self, chunk: BitChunk) -> None:
+        blocks = self._blocks.push(chunk.bits)
+        if not blocks.shape[0]:
+            return
+        values = blocks @ self._weights
+        positions = np.arange(self._index + 1, self._index + values.size + 1, dtype=np.int64)
+        local = nist.previous_occurrences(values)
+        previous = np.where(local >= 0, self._index + local + 1, self._last_seen[values])
+        tested = positions > self._init
+        self._log_sum += float(np.log2(positions[tested] - previous[tested]).sum())
+        np.maximum.at(self._last_seen, values, positions)
+        self._index += values.size
+
+    def _finish(self) -> TestOutcome:
+        return nist.universal_outcome(self._log_sum, self._block, self._tested)
+
+
+class LinearComplexityAccumulator(TestAccumulator):
+    name = "linear_complexity"
+
+    def __init__(self, total_bits: int, block_size: int = 500) -> None:
+        super().__init__(total_bits)
+        self._blocks = _BlockBuffer(block_size, nist.linear_complexity_block_count(total_bits, block_size))
+        self._observed: np.ndarray | int = 0
+
+    def _consume(self, chunk: BitChunk) -> None:
+        blocks = self._blocks.push(chunk.bits)
+        if blocks.shape[0]:
+            self._observed = self._observed + nist.linear_complexity_classes(blocks)
+
+    def _finish(self) -> TestOutcome:
+        return nist.linear_complexity_outcome(np.asarray(self._observed))
+
+
+class SerialAccumulator(TestAccumulator):
+    name = "serial"
+
+    def __init__(self, total_bits: int, block_length: int = 16) -> None:
+        super().__init__(total_bits)
+        self._windows = _WrappedWindows(nist.serial_block_length(total_bits, block_length))
+
+    def _consume(self, chunk: BitChunk) -> None:
+        self._windows.push(chunk.bits)
+
+    def _finish(self) -> TestOutcome:
+        self._windows.close()
+        return nist.serial_outcome(self._windows.counts, self._total_bits)
+
+
+class ApproximateEntropyAccumulator(TestAccumulator):
+    name = "approximate_entropy"
+
+    def __init__(self, total_bits: int, block_length: int = 10) -> None:
+        super().__init__(total_bits)
+        m = nist.approximate_entropy_block_length(total_bits, block_length)
+        self._windows = _WrappedWindows(m + 1)
+
+    def _consume(self, chunk: BitChunk) -> None:
+        self._windows.push(chunk.bits)
+
+    def _finish(self) -> TestOutcome:
+        self._windows.close()
+        return nist.approximate_entropy_outcome(self._windows.counts, self._total_bits)
+
+
+class CumulativeSumsAccumulator(TestAccumulator):
+    name = "cumulative_sums"
+
+    def __init__(self, total_bits: int) -> None:
+        super().__init__(total_bits)
+        nist.require(total_bits >= 100, "sequence too short for cumulative sums test")
+        self._level = 0
+        self._lowest = 0
+        self._highest = 0
+
+    def _consume(self, chunk: BitChunk) -> None:
+        walk = self._level + np.cumsum(chunk.bits.astype(np.int64) * 2 - 1)
+        self._lowest = min(self._lowest, int(walk.min()))
+        self._highest = max(self._highest, int(walk.max()))
+        self._level = int(walk[-1])
+
+    def _finish(self) -> TestOutcome:
+        return nist.cumulative_sums_outcome(self._total_bits, self._level, self._lowest, self._highest)
+
+
+class RandomExcursionsAccumulator(TestAccumulator):
+    name = "random_excursions"
+
+    def __init__(self, total_bits: int) -> None:
+        super().__init__(total_bits)
+        nist.require(total_bits > 0, "sequence too short for random excursions test")
+        states = len(nist.EXCURSION_STATES)
+        self._level = 0
+        self._closed = 0
+        # Visits of the cycle still open at the end of the previous chunk.
+        self._open = np.zeros(states, dtype=np.int64)
+        self._observed = np.zeros((states, 6), dtype=np.int64)
+
+    def _consume(self, chunk: BitChunk) -> None:
+        walk = self._level + np.cumsum(chunk.bits.astype(np.int64) * 2 - 1)
+        zeros = walk == 0
+        returns = int(np.count_nonzero(zeros))
+        # Local cycle index: 0 continues the open cycle, `returns` is the one left open.
+        cycle_ids = np.cumsum(zeros) - zeros
+        for row, state in enumerate(nist.EXCURSION_STATES):
+            visits = np.bincount(cycle_ids[walk == state], minlength=returns + 1)
+            visits[0] += self._open[row]
+            self._observed[row] += np.bincount(np.minimum(visits[:returns], 5), minlength=6)
+            self._open[row] = visits[returns]
+        self._closed += returns
+        self._level = int(walk[-1])
+
+    def _finish(self) -> TestOutcome:
+        observed = self._observed.copy()
+        cycles = self._closed
+        if self._level != 0:
+            # A walk that does not end at zero closes its last cycle at the end of the sequence.
+            cycles += 1
+            observed[np.arange(observed.shape[0]), np.minimum(self._open, 5)] += 1
+        return nist.random_excursions_outcome(observed, cycles)
+
+
+class RandomExcursionsVariantAccumulator(TestAccumulator):
+    name = "random_excursions_variant"
+
+    def __init__(self, total_bits: int) -> None:
+        super().__init__(total_bits)
+        nist.require(total_bits > 0, "sequence too short for random excursions variant test")
+        self._level = 0
+        self._visits = np.zeros(21, dtype=np.int64)
+
+    def _consume(self, chunk: BitChunk) -> None:
+        walk = self._level + np.cumsum(chunk.bits.astype(np.int64) * 2 - 1)
+        self._visits += np.bincount(np.clip(walk, -10, 10) + 10, minlength=21)
+        self._level = int(walk[-1])
+
+    def _finish(self) -> TestOutcome:
+        cycles = int(self._visits[10]) + int(self._level != 0)
+        return nist.random_excursions_variant_outcome(self._visits, cycles)
+
+
+ACCUMULATORS: dict[str, Callable[[int], TestAccumulator]] = {
+    "frequency": FrequencyAccumulator,
+    "runs": RunsAccumulator,
+    "chi_square": ChiSquareAccumulator,
+    "block_frequency": BlockFrequencyAccumulator,
+    "longest_run": LongestRunAccumulator,
+    "matrix_rank": MatrixRankAccumulator,
+    "dft": DFTAccumulator,
+    "non_overlapping_template": NonOverlappingTemplateAccumulator,
+    "overlapping_template": OverlappingTemplateAccumulator,
+    "universal": UniversalAccumulator,
+    "linear_complexity": LinearComplexityAccumulator,
+    "serial": SerialAccumulator,
+    "approximate_entropy": ApproximateEntropyAccumulator,
+    "cumulative_sums": CumulativeSumsAccumulator,
+    "random_excursions": RandomExcursionsAccumulator,
+    "random_excursions_variant": RandomExcursionsVariantAccumulator,
+}
+
+
+class StreamingBattery:
+    """Feeds one stream into the accumulators of several tests at once."""
+
+    def __init__(self, total_bits: int, tests: Iterable[str] | None = None) -> None:
+        # Reject empty inputs early to avoid division errors in subsequent tests.
+        if total_bits <= 0:
+            raise ValueError("No bits provided for analysis")
+        self._explicit = bool(tests)
+        self._accumulators: list[TestAccumulator] = []
+        for name in tests or ACCUMULATORS.keys():
+            # Guard against unsupported identifiers passed from external callers.
+            if name not in ACCUMULATORS:
+                raise ValueError(f"unknown test: {name}")
+            try:
+                self._accumulators.append(ACCUMULATORS[name](total_bits))
+            except SequenceTooShortError:
+                # The default battery skips tests the input is too short for; explicit requests fail.
+                if self._explicit:
+                    raise
+
+    def update(self, chunk: ChunkSource) -> None:
+        chunk = as_bit_chunk(chunk)
+        for accumulator in self._accumulators:
+            accumulator.update(chunk)
+
+    def finalize(self) -> list[TestOutcome]:
+        outcomes: list[TestOutcome] = []
+        for accumulator in self._accumulators:
+            try:
+                outcomes.append(accumulator.finalize())
+            except SequenceTooShortError:
+                if self._explicit:
+                    raise
+        return outcomes
+
+
+def run_chunked_test(name: str, bits: PackedBits, chunk_bits: int = TASK_CHUNK_BITS) -> TestOutcome:
+    """One test on an in-memory sequence through its accumulator, unpacking `chunk_bits` at a time.
+
+    Working memory stays bounded by the chunk rather than growing with the sequence, and the outcome
+    (including the DFT prefix) is the one the streaming path produces for the same payload.
+    """
+    accumulator = ACCUMULATORS[name](len(bits))
+    step = chunk_bits // 8
+    for offset in range(0, bits.data.size, step):
+        length = min(chunk_bits, len(bits) - offset * 8)
+        accumulator.update(PackedBits(data=bits.data[offset : offset + step], length=length))
+    return accumulator.finalize()
+
+
+def run_streaming_tests(
+    chunks: Iterable[ChunkSource],
+    total_bits: int,
+    tests: Iterable[str] | None = None,
+) -> list[TestOutcome]:
+    battery = StreamingBattery(total_bits, tests)
+    for chunk in chunks:
+        battery.update(chunk)
+    return battery.finalize()
@@ -1,32 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from math import sqrt
-from typing import Iterable, Sequence
+import inspect
+from math import erfc, sqrt
+from typing import Iterable
 
+from . import nist
+from .base import BitSource, SequenceTooShortError, TestOutcome, as_packed_bits
 
-@dataclass(slots=True)
-class TestOutcome:
-    name: str
-    passed: bool
-    metric: float
-    threshold: float
-    details: dict[str, float]
 
-
-def _mean(bits: Sequence[int]) -> float:
-    return sum(bits) / len(bits)
-
-
-def _variance(bits: Sequence[int], mean: float) -> float:
-    return sum((b - mean) ** 2 for b in bits) / len(bits)
-
-
-def frequency_test(bits: Sequence[int]) -> TestOutcome:
-    """Monobit frequency test."""
-    ones = sum(bits)
-    zeros = len(bits) - ones
-    balance = (ones - zeros) / len(bits)
+def frequency_outcome(ones: int, n: int) -> TestOutcome:
+    zeros = n - ones
+    balance = (ones - zeros) / n
     metric = abs(balance)
     threshold = 0.01
     passed = metric < threshold
@@ -35,14 +19,18 @@ def frequency_test(bits: Sequence[int]) -> TestOutcome:
         passed=passed,
         metric=metric,
         threshold=threshold,
-        details={"ones": ones, "zeros": zeros},
+        details={"ones": ones, "zeros": zeros, "p_value": erfc(abs(ones - zeros) / sqrt(2 * n))},
     )
 
 
-def runs_test(bits: Sequence[int]) -> TestOutcome:
-    """Runs test following NIST SP 800-22 approximation."""
-    n = len(bits)
-    pi = _mean(bits)
+def frequency_test(bits: BitSource) -> TestOutcome:
+    """Monobit frequency test."""
+    packed = as_packed_bits(bits)
+    return frequency_outcome(packed.count_ones(), len(packed))
+
+
+def runs_outcome(n: int, ones: int, transitions: int) -> TestOutcome:
+    pi = ones / n
     if pi in (0.0, 1.0):
         return TestOutcome(
             name="runs",
@@ -52,7 +40,7 @@ def runs_test(bits: Sequence[int]) -> TestOutcome:
             details={"runs": 1, "pi": pi},
         )
 
-    runs = 1 + sum(1 for a, b in zip(bits, bits[1:]) if a != b)
+    runs = 1 + transitions
     expected_runs = 2 * n * pi * (1 - pi)
     denominator = 2 * sqrt(2 * n) * pi * (1 - pi)
     z_score = 0.0 if denominator == 0 else abs(runs - expected_runs) / denominator
@@ -63,42 +51,78 @@ def runs_test(bits: Sequence[int]) -> TestOutcome:
         passed=passed,
         metric=z_score,
         threshold=threshold,
-        details={"runs": runs, "expected_runs": expected_runs, "pi": pi},
+        details={"runs": runs, "expected_runs": expected_runs, "pi": pi, "p_value": erfc(z_score)},
     )
 
 
-def chi_square_test(bits: Sequence[int], block_size: int = 32) -> TestOutcome:
-    """Chi-square test on fixed-size blocks."""
-    if len(bits) < block_size:
-        raise ValueError("sequence too short for chi-square test")
-    blocks = [bits[i : i + block_size] for i in range(0, len(bits), block_size)]
-    blocks = [b for b in blocks if len(b) == block_size]
-    ones_counts = [sum(block) for block in blocks]
-    mean = sum(ones_counts) / len(ones_counts)
-    expected = block_size / 2
-    chi_square = sum((count - expected) ** 2 / expected for count in ones_counts)
-    threshold = len(blocks)
+def runs_test(bits: BitSource) -> TestOutcome:
+    """Runs test following NIST SP 800-22 approximation."""
+    packed = as_packed_bits(bits)
+    return runs_outcome(len(packed), packed.count_ones(), packed.count_transitions())
+
+
+def chi_square_outcome(square_sum: float, ones_sum: int, blocks: int, block_size: int) -> TestOutcome:
+    chi_square = square_sum / (block_size / 2)
+    threshold = blocks
     passed = chi_square < threshold
     return TestOutcome(
         name="chi_square",
         passed=passed,
         metric=chi_square,
         threshold=threshold,
-        details={"blocks": len(blocks), "mean_ones": mean},
+        details={"blocks": blocks, "mean_ones": ones_sum / blocks},
     )
 
 
+def chi_square_test(bits: BitSource, block_size: int = 32) -> TestOutcome:
+    """Chi-square test on fixed-size blocks."""
+    packed = as_packed_bits(bits)
+    if len(packed) < block_size:
+        raise SequenceTooShortError("sequence too short for chi-square test")
+    ones_counts = packed.block_ones(block_size)
+    square_sum = float(((ones_counts - block_size / 2) ** 2).sum())
+    return chi_square_outcome(square_sum, int(ones_counts.sum()), int(ones_counts.size), block_size)
+
+
 AVAILABLE_TESTS = {
     "frequency": frequency_test,
     "runs": runs_test,
     "chi_square": chi_square_test,
+    "block_frequency": nist.block_frequency_test,
+    "longest_run": nist.longest_run_test,
+    "matrix_rank": nist.matrix_rank_test,
+    "dft": nist.dft_test,
+    "non_overlapping_template": nist.non_overlapping_template_test,
+    "overlapping_template": nist.overlapping_template_test,
+    "universal": nist.universal_test,
+    "linear_complexity": nist.linear_complexity_test,
+    "serial": nist.serial_test,
+    "approximate_entropy": nist.approximate_entropy_test,
+    "cumulative_sums": nist.cumulative_sums_test,
+    "random_excursions": nist.random_excursions_test,
+    "random_excursions_variant": nist.random_excursions_variant_test,
 }
 
 
-def run_selected_tests(bits: Iterable[int], tests: Iterable[str] | None = None) -> list[TestOutcome]:
-    bit_list = list(bits)
+# Bump whenever a test's statistic or verdict changes, so results cached by older code are not reused.
+ANALYSIS_VERSION = 2
+
+
+def test_parameters(name: str) -> dict[str, object]:
+    """Keyword defaults the battery runs a test with (everything after the bit source)."""
+    signature = inspect.signature(AVAILABLE_TESTS[name])
+    return {
+        param.name: param.default
+        for param in list(signature.parameters.values())[1:]
+        if param.default is not inspect.Parameter.empty
+    }
+
+
+def run_selected_tests(bits: BitSource, tests: Iterable[str] | None = None) -> list[TestOutcome]:
+    # Pack once; every test shares the same uint8 buffer.
+    packed = as_packed_bits(bits)
     # Reject empty inputs early to avoid division errors in subsequent tests.
-    if not bit_list:
+    if not len(packed):
         raise ValueError("No bits provided for analysis")
     selected = tests or AVAILABLE_TESTS.keys()
     outcomes: list[TestOutcome] = []
@@ -107,7 +131,13 @@ def run_selected_tests(bits: Iterable[int], tests: Iterable[str] | None = None)
         if name not in AVAILABLE_TESTS:
             raise ValueError(f"unknown test: {name}")
         test_fn = AVAILABLE_TESTS[name]
-        outcome = test_fn(bit_list)
+        try:
+            outcome = test_fn(packed)
+        except SequenceTooShortError:
+            # The default battery skips tests the input is too short for; explicit requests fail.
+            if tests:
+                raise
+            continue
         # Collect normalized outcome objects for API serialization.
         outcomes.append(outcome)
     return outcomes
@@ -6,15 +6,29 @@ from typing import Annotated
 from fastapi import Depends, Request
 
 from randomtrust.core import (
+    ComputeExecutor,
     Settings,
+    create_compute_executor,
     create_engine,
     create_minio_client,
     create_session_factory,
     get_settings,
 )
-from randomtrust.entropy import EntropyMixer, LorenzChaosSimulator, NoiseSimulator
-from randomtrust.rng.generator import ChaCha20RNGFactory
-from randomtrust.services import AuditService, AnalysisService, EntropyService, RNGService, UnitOfWork
+from randomtrust.entropy import EntropyMixer, HealthTestConfig, LorenzChaosSimulator, NoiseSimulator
+from randomtrust.rng.generator import ChaCha20RNGFactory, ParallelKeystream
+from randomtrust.services import (
+    AuditService,
+    AnalysisJobQueue,
+    AnalysisResultCache,
+    AnalysisService,
+    EntropyService,
+    RNGService,
+    RunPayloadCache,
+    SeedReservoir,
+    UnitOfWork,
+    create_analysis_job_queue,
+    create_analysis_result_cache,
+)
 
 
 @lru_cache
@@ -42,8 +56,17 @@ def get_chaos_simulator() -> LorenzChaosSimulator:
 def get_entropy_mixer(
     noise_simulator: Annotated[NoiseSimulator, Depends(get_noise_simulator)],
     chaos_simulator: Annotated[LorenzChaosSimulator, Depends(get_chaos_simulator)],
+    settings: Annotated[Settings, Depends(get_settings_dep)],
 ) -> EntropyMixer:
-    return EntropyMixer(noise_simulator=noise_simulator, chaos_simulator=chaos_simulator)
+    return EntropyMixer(
+        noise_simulator=noise_simulator,
+        chaos_simulator=chaos_simulator,
+        health_config=HealthTestConfig(
+            min_entropy=settings.entropy_health_min_entropy,
+            alpha_exponent=settings.entropy_health_alpha_exponent,
+        ),
+        max_health_retries=settings.entropy_health_max_retries,
+    )
 
 
 def get_rng_factory(
@@ -80,18 +103,48 @@ def get_minio_client(request: Request, settings: Annotated[Settings, Depends(get
     return client
 
 
+def get_compute_executor(
+    request: Request,
+    settings: Annotated[Settings, Depends(get_settings_dep)],
+) -> ComputeExecutor:
+    executor = getattr(request.app.state, "compute_executor", None)
+    if executor is None:
+        executor = create_compute_executor(settings)
+        request.app.state.compute_executor = executor
+    return executor
+
+
 def get_entropy_service(
     mixer: Annotated[EntropyMixer, Depends(get_entropy_mixer)],
     settings: Annotated[Settings, Depends(get_settings_dep)],
+    executor: Annotated[ComputeExecutor, Depends(get_compute_executor)],
     minio = Depends(get_minio_client),
 ) -> EntropyService:
-    return EntropyService(mixer=mixer, storage=minio, settings=settings)
+    return EntropyService(mixer=mixer, storage=minio, settings=settings, executor=executor)
+
+
+def get_seed_reservoir(request: Request) -> SeedReservoir | None:
+    # The reservoir exists only when enabled and started by the application lifespan.
+    return getattr(request.app.state, "seed_reservoir", None)
+
+
+def get_keystream_pool(request: Request) -> ParallelKeystream | None:
+    # Created by the application lifespan only when more than one keystream worker is configured.
+    return getattr(request.app.state, "keystream_pool", None)
+
+
+def get_run_payload_cache(request: Request) -> RunPayloadCache | None:
+    # Created by the application lifespan, so background cache fills are shared by all requests.
+    return getattr(request.app.state, "payload_cache", None)
 
 
 def get_rng_service(
     entropy_service: Annotated[EntropyService, Depends(get_entropy_service)],
     rng_factory: Annotated[ChaCha20RNGFactory, Depends(get_rng_factory)],
     settings: Annotated[Settings, Depends(get_settings_dep)],
+    seed_reservoir: Annotated[SeedReservoir | None, Depends(get_seed_reservoir)],
+    keystream: Annotated[ParallelKeystream | None, Depends(get_keystream_pool)],
+    payload_cache: Annotated[RunPayloadCache | None, Depends(get_run_payload_cache)],
     minio = Depends(get_minio_client),
 ) -> RNGService:
     return RNGService(
@@ -99,6 +152,9 @@ def get_rng_service(
         rng_factory=rng_factory,
         storage=minio,
         settings=settings,
+        seed_reservoir=seed_reservoir,
+        keystream=keystream,
+        payload_cache=payload_cache,
     )
 
 
@@ -109,8 +165,33 @@ def get_audit_service(
     return AuditService(storage=minio, settings=settings)
 
 
+def get_analysis_result_cache(
+    request: Request,
+    settings: Annotated[Settings, Depends(get_settings_dep)],
+) -> AnalysisResultCache | None:
+    redis_client = getattr(request.app.state, "redis_client", None)
+    if redis_client is None:
+        return None
+    return create_analysis_result_cache(settings, redis_client=redis_client)
+
+
 def get_analysis_service(
     settings: Annotated[Settings, Depends(get_settings_dep)],
+    executor: Annotated[ComputeExecutor, Depends(get_compute_executor)],
+    cache: Annotated[AnalysisResultCache | None, Depends(get_analysis_result_cache)],
+    payload_cache: Annotated[RunPayloadCache | None, Depends(get_run_payload_cache)],
     minio = Depends(get_minio_client),
 ) -> AnalysisService:
-    return AnalysisService(storage=minio, settings=settings)
+    return AnalysisService(
+        storage=minio, settings=settings, executor=executor, cache=cache, payload_cache=payload_cache
+    )
+
+
+def get_analysis_job_queue(
+    request: Request,
+    settings: Annotated[Settings, Depends(get_settings_dep)],
+) -> AnalysisJobQueue:
+    redis_client = getattr(request.app.state, "redis_client", None)
+    if redis_client is None:
+        raise RuntimeError("Redis client is not initialized")
+    return create_analysis_job_queue(settings, redis_client=redis_client)
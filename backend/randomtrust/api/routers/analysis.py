@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import Iterable
 from uuid import UUID
 
@@ -7,17 +8,33 @@ from fastapi import APIRouter, Body, Depends, HTTPException
 
 from randomtrust.analysis import AVAILABLE_TESTS
 from randomtrust.api.dependencies import (
+    get_analysis_job_queue,
     get_analysis_service,
     get_unit_of_work,
 )
 from randomtrust.schemas.analysis import (
+    AnalysisBatchView,
+    AnalysisJobView,
     AnalysisRequest,
     AuditAnalysisResponse,
-    RunAnalysisResponse,
+    BatchAnalysisRequest,
+    BatchCheckView,
+    MinEntropyEstimateView,
+    MinEntropyRequest,
+    MinEntropyResponse,
+    SimulationMinEntropyView,
     TestOutcomeView,
+    TestTimingView,
+)
+from randomtrust.services import (
+    AnalysisJob,
+    AnalysisJobQueue,
+    AnalysisService,
+    SimulationEntropyResult,
+    UnitOfWork,
 )
-from randomtrust.services import AnalysisService, UnitOfWork
 from randomtrust.services.analysis_service import (
+    BatchSelectionError,
     SubjectDataUnavailableError,
     SubjectNotFoundError,
 )
@@ -48,17 +65,54 @@ def _serialize_outcomes(outcomes: Iterable) -> list[TestOutcomeView]:
     ]
 
 
+def _serialize_timings(timings: Iterable) -> list[TestTimingView]:
+    return [
+        TestTimingView(
+            name=timing.name,
+            segments=timing.segments,
+            wall_ms=timing.wall_ms,
+            compute_ms=timing.compute_ms,
+        )
+        for timing in timings
+    ]
+
+
+def _job_view(job: AnalysisJob) -> AnalysisJobView:
+    return AnalysisJobView(
+        job_id=job.job_id,
+        kind=job.kind,
+        run_id=job.run_id,
+        selection=job.selection,
+        tests=job.tests,
+        status=job.status,
+        progress=job.progress,
+        attempts=job.attempts,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        error=job.error,
+        outcomes=[TestOutcomeView(**outcome) for outcome in job.outcomes] if job.outcomes is not None else None,
+        timings=[TestTimingView(**timing) for timing in job.timings] if job.timings is not None else None,
+        cached_tests=job.cached_tests,
+        batch_id=job.batch_id,
+    )
+
+
 @router.post(
     "/runs/{run_id}",
-    response_model=RunAnalysisResponse,
-    summary="Запустить статистический анализ генерации",
-    description="Выполняет набор тестов случайности над сохранённой последовательностью генерации и сохраняет результаты в базе.",
+    response_model=AnalysisJobView,
+    status_code=202,
+    summary="Поставить статистический анализ генерации в очередь",
+    description="Создаёт задание анализа сохранённой последовательности и сразу возвращает его идентификатор."
+    " Задание выполняют отдельные процессы-обработчики (`python -m randomtrust.worker`), результаты сохраняются в базе;"
+    " ход выполнения доступен через `GET /api/analysis/jobs/{job_id}`.",
 )
 async def run_analysis_for_run(
     run_id: UUID,
     payload: AnalysisRequest = Body(
         ...,
-        description="Перечень тестов. Если `tests` не задан, выполняется полный набор (frequency, runs, chi_square).",
+        description="Перечень тестов. Если `tests` не задан, выполняется полный набор, включая батарею NIST SP 800-22;"
+        " тесты, для которых последовательность слишком коротка, при этом пропускаются.",
         examples={
             "all": {
                 "summary": "Полный анализ",
@@ -72,28 +126,117 @@ async def run_analysis_for_run(
     ),
     uow: UnitOfWork = Depends(get_unit_of_work),
     analysis_service: AnalysisService = Depends(get_analysis_service),
-) -> RunAnalysisResponse:
+    job_queue: AnalysisJobQueue = Depends(get_analysis_job_queue),
+) -> AnalysisJobView:
     async with uow:
         try:
-            result = await analysis_service.analyze_run(
-                uow=uow,
-                run_id=run_id,
-                tests=payload.tests,
-            )
+            # Missing runs and payloads are rejected now rather than surfacing later as failed jobs.
+            await analysis_service.get_analyzable_run(uow=uow, run_id=run_id)
         except SubjectNotFoundError as exc:
             raise HTTPException(status_code=404, detail=str(exc)) from exc
         except SubjectDataUnavailableError as exc:
             raise HTTPException(status_code=422, detail=str(exc)) from exc
-        except ValueError as exc:
+
+    job = await job_queue.enqueue(run_id=run_id, tests=payload.tests)
+    return _job_view(job)
+
+
+@router.post(
+    "/batches",
+    response_model=AnalysisJobView,
+    status_code=202,
+    summary="Поставить пакетный анализ нескольких генераций в очередь",
+    description="Анализирует набор генераций одинаковой длины как выборку последовательностей по NIST SP 800-22"
+    " (раздел 4.2): помимо результатов по каждой генерации вычисляются доля прошедших последовательностей"
+    " и равномерность распределения P-значений для каждого теста. Генерации задаются списком `run_ids`"
+    " либо интервалом времени создания `created_from`/`created_to`. После завершения задания"
+    " сводный отчёт доступен через `GET /api/analysis/batches/{batch_id}`.",
+)
+async def run_batch_analysis(
+    payload: BatchAnalysisRequest = Body(
+        ...,
+        examples={
+            "ids": {
+                "summary": "Явный список генераций",
+                "value": {"run_ids": ["8b0e4f9c-5d2a-4c1e-9f3b-2a7d6c5e4b3a"], "tests": None},
+            },
+            "window": {
+                "summary": "Генерации за сутки",
+                "value": {"created_from": "2026-10-16T00:00:00Z", "created_to": "2026-10-17T00:00:00Z"},
+            },
+        },
+    ),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    analysis_service: AnalysisService = Depends(get_analysis_service),
+    job_queue: AnalysisJobQueue = Depends(get_analysis_job_queue),
+) -> AnalysisJobView:
+    async with uow:
+        try:
+            # The selection is checked now; the worker selects again when the job runs.
+            await analysis_service.select_batch_runs(
+                uow=uow,
+                run_ids=payload.run_ids,
+                created_from=payload.created_from,
+                created_to=payload.created_to,
+            )
+        except SubjectNotFoundError as exc:
+            raise HTTPException(status_code=404, detail=str(exc)) from exc
+        except (SubjectDataUnavailableError, BatchSelectionError) as exc:
             raise HTTPException(status_code=422, detail=str(exc)) from exc
 
-    return RunAnalysisResponse(
-        run_id=result.run_id,
-        export_path=result.export_path,
-        outcomes=_serialize_outcomes(result.outcomes),
+    job = await job_queue.enqueue_batch(
+        run_ids=payload.run_ids,
+        created_from=payload.created_from,
+        created_to=payload.created_to,
+        tests=payload.tests,
+    )
+    return _job_view(job)
+
+
+@router.get(
+    "/batches/{batch_id}",
+    response_model=AnalysisBatchView,
+    summary="Сводный отчёт пакетного анализа",
+    description="Возвращает проверки доли прошедших последовательностей и равномерности P-значений по каждому тесту."
+    " Результаты по отдельным генерациям сохранены в их отчётах о тестах.",
+)
+async def get_analysis_batch(
+    batch_id: UUID,
+    uow: UnitOfWork = Depends(get_unit_of_work),
+) -> AnalysisBatchView:
+    async with uow:
+        batch = await uow.analysis_batches.get_batch(batch_id)
+    if batch is None:
+        raise HTTPException(status_code=404, detail=f"analysis batch {batch_id} not found")
+    checks = [BatchCheckView(**check) for check in batch.checks]
+    return AnalysisBatchView(
+        batch_id=batch.id,
+        created_at=batch.created_at,
+        tests=batch.tests,
+        run_ids=batch.run_ids,
+        sequence_bits=batch.sequence_bits,
+        passed=all(check.proportion_passed and check.uniformity_passed is not False for check in checks),
+        checks=checks,
     )
 
 
+@router.get(
+    "/jobs/{job_id}",
+    response_model=AnalysisJobView,
+    summary="Статус задания анализа",
+    description="Возвращает состояние задания (`queued`, `running`, `completed`, `failed`), долю выполненных тестов"
+    " и, после завершения, результаты с временем выполнения каждого теста.",
+)
+async def get_analysis_job(
+    job_id: UUID,
+    job_queue: AnalysisJobQueue = Depends(get_analysis_job_queue),
+) -> AnalysisJobView:
+    job = await job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"analysis job {job_id} not found")
+    return _job_view(job)
+
+
 @router.post(
     "/audits/{audit_id}",
     response_model=AuditAnalysisResponse,
@@ -137,4 +280,92 @@ async def run_analysis_for_audit(
         audit_id=result.audit_id,
         data_hash=result.data_hash,
         outcomes=_serialize_outcomes(result.outcomes),
+        timings=_serialize_timings(result.timings),
+        cached_tests=list(result.cached_tests),
     )
+
+
+def _min_entropy_response(results: list[SimulationEntropyResult]) -> MinEntropyResponse:
+    simulations = [
+        SimulationMinEntropyView(
+            simulation_id=result.simulation_id,
+            samples=result.report.samples,
+            bits_per_sample=result.report.bits_per_sample,
+            h_original=result.report.h_original,
+            h_bitstring=result.report.h_bitstring,
+            min_entropy=result.report.min_entropy,
+            original=[MinEntropyEstimateView(**asdict(estimate)) for estimate in result.report.original],
+            bitstring=[MinEntropyEstimateView(**asdict(estimate)) for estimate in result.report.bitstring],
+            cached=result.cached,
+        )
+        for result in results
+    ]
+    values = [view.min_entropy for view in simulations]
+    return MinEntropyResponse(
+        simulations=simulations,
+        min_entropy_min=min(values),
+        min_entropy_mean=sum(values) / len(values),
+    )
+
+
+async def _analyze_simulations(
+    uow: UnitOfWork,
+    analysis_service: AnalysisService,
+    simulation_ids: list[UUID] | None,
+    sample_size: int | None,
+) -> MinEntropyResponse:
+    async with uow:
+        try:
+            results = await analysis_service.analyze_simulations(
+                uow=uow,
+                simulation_ids=simulation_ids,
+                sample_size=sample_size,
+            )
+        except SubjectNotFoundError as exc:
+            raise HTTPException(status_code=404, detail=str(exc)) from exc
+        except (SubjectDataUnavailableError, BatchSelectionError, ValueError) as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return _min_entropy_response(results)
+
+
+@router.post(
+    "/simulations/min-entropy",
+    response_model=MinEntropyResponse,
+    summary="Оценка min-энтропии шума нескольких симуляций",
+    description="Применяет оценки min-энтропии NIST SP 800-90B для не-IID источников (MCV, collision, Markov,"
+    " compression, t-tuple, LRS) к сохранённому шуму симуляций, заданных списком `simulation_ids`,"
+    " либо к случайной выборке из `sample_size` симуляций. Результаты кэшируются по идентификатору симуляции.",
+)
+async def run_min_entropy_analysis(
+    payload: MinEntropyRequest = Body(
+        ...,
+        examples={
+            "ids": {
+                "summary": "Явный список симуляций",
+                "value": {"simulation_ids": ["3f1c2b7a-9d4e-4a6b-8c2d-1e5f7a9b0c3d"]},
+            },
+            "sample": {
+                "summary": "Случайная выборка",
+                "value": {"sample_size": 16},
+            },
+        },
+    ),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    analysis_service: AnalysisService = Depends(get_analysis_service),
+) -> MinEntropyResponse:
+    return await _analyze_simulations(uow, analysis_service, payload.simulation_ids, payload.sample_size)
+
+
+@router.post(
+    "/simulations/{simulation_id}/min-entropy",
+    response_model=MinEntropyResponse,
+    summary="Оценка min-энтропии шума симуляции",
+    description="Оценивает min-энтропию квантованного шума одной симуляции по NIST SP 800-90B"
+    " (раздел 6.3, оценки для не-IID источников).",
+)
+async def run_simulation_min_entropy(
+    simulation_id: UUID,
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    analysis_service: AnalysisService = Depends(get_analysis_service),
+) -> MinEntropyResponse:
+    return await _analyze_simulations(uow, analysis_service, [simulation_id], None)
@@ -1,49 +1,62 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Body, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
 from randomtrust.api.dependencies import get_audit_service, get_unit_of_work
-from randomtrust.schemas.audit import AuditSequenceRequest, AuditSequenceResponse
-from randomtrust.services import AuditService, UnitOfWork
+from randomtrust.schemas.audit import AuditSequenceResponse
+from randomtrust.services import AuditService, AuditUploadError, UnitOfWork
 
 router = APIRouter()
 
+_UPLOAD_MEDIA_TYPE = "application/octet-stream"
+
 
 @router.post(
     "/upload",
     response_model=AuditSequenceResponse,
     summary="Загрузить внешнюю последовательность",
-    description="Принимает hex-последовательность для последующего статистического анализа и хранения артефактов.",
+    description="Принимает последовательность в теле запроса как `application/octet-stream`. Тело читается потоково:"
+    " каждый блок хэшируется BLAKE2s и сразу передаётся в multipart-загрузку MinIO, поэтому размер выборки"
+    " не ограничен памятью сервера.",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {_UPLOAD_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}}},
+        }
+    },
+    responses={415: {"description": "Тело передано не как application/octet-stream"}},
 )
 async def upload_sequence(
-    payload: AuditSequenceRequest = Body(
-        ...,
-        description="Метаданные и hex-последовательность. Длина ограничена размером принимаемого JSON.",
-        examples={
-            "sample": {
-                "summary": "Короткая последовательность",
-                "value": {
-                    "name": "external-generator",
-                    "description": "Тестовая выборка внешнего генератора",
-                    "data": "deadbeefcafebabe",
-                },
-            }
-        },
-    ),
+    request: Request,
+    name: str = Query(..., min_length=3, max_length=255, description="Название выборки"),
+    description: str | None = Query(default=None, max_length=1_024, description="Описание выборки"),
     uow: UnitOfWork = Depends(get_unit_of_work),
     audit_service: AuditService = Depends(get_audit_service),
 ) -> AuditSequenceResponse:
+    content_type = request.headers.get("content-type", "").split(";", 1)[0].strip().lower()
+    if content_type != _UPLOAD_MEDIA_TYPE:
+        raise HTTPException(status_code=415, detail=f"body must be sent as {_UPLOAD_MEDIA_TYPE}")
+    content_length = request.headers.get("content-length")
     try:
-        bytes.fromhex(payload.data)
+        length = int(content_length) if content_length is not None else -1
     except ValueError as exc:
-        raise HTTPException(status_code=422, detail="data must be hex-encoded") from exc
+        raise HTTPException(status_code=400, detail="invalid Content-Length header") from exc
 
     async with uow:
-        record = await audit_service.store_sequence(
-            uow=uow,
-            name=payload.name,
-            description=payload.description,
-            hex_payload=payload.data,
-        )
-
-    return AuditSequenceResponse(audit_id=record.audit_id, status=record.status)
+        try:
+            record = await audit_service.store_sequence(
+                uow=uow,
+                name=name,
+                description=description,
+                chunks=request.stream(),
+                length=length,
+            )
+        except AuditUploadError as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+    return AuditSequenceResponse(
+        audit_id=record.audit_id,
+        status=record.status,
+        data_hash=record.data_hash,
+        size=record.size,
+    )
@@ -3,10 +3,18 @@ from uuid import UUID
 from fastapi import APIRouter, Body, Depends, HTTPException, Query
 
 from randomtrust.api.dependencies import (
+    get_compute_executor,
     get_entropy_service,
     get_unit_of_work,
 )
-from randomtrust.schemas.entropy import EntropyMixRequest, EntropyMixResponse, EntropyMetrics
+from randomtrust.core import ComputeExecutor
+from randomtrust.entropy import EntropyHealthError
+from randomtrust.schemas.entropy import (
+    EntropyMetrics,
+    EntropyMixRequest,
+    EntropyMixResponse,
+    ExecutorStatsResponse,
+)
 from randomtrust.schemas.entropy_read import (
     ChaosRunInfo,
     EntropySimulationDetail,
@@ -49,16 +57,23 @@ async def mix_entropy(
 ) -> EntropyMixResponse:
     overrides = payload.parameters.model_dump(exclude_none=True) if payload.parameters else None
     async with uow:
-        stored = await entropy_service.create_entropy(
-            uow=uow,
-            noise_seed=payload.noise_seed,
-            overrides=overrides,
-        )
+        try:
+            stored = await entropy_service.create_entropy(
+                uow=uow,
+                noise_seed=payload.noise_seed,
+                overrides=overrides,
+            )
+        except EntropyHealthError as exc:
+            # A source that keeps failing its health tests must not seed anything.
+            raise HTTPException(status_code=503, detail=str(exc)) from exc
 
     metrics = EntropyMetrics(
         snr_db=stored.metrics["snr_db"],
         spectral_deviation_percent=stored.metrics["spectral_deviation_percent"],
         lyapunov_exponent=stored.metrics["lyapunov_exponent"],
+        health_max_repetition=int(stored.metrics["health_max_repetition"]),
+        health_max_proportion=int(stored.metrics["health_max_proportion"]),
+        health_retries=int(stored.metrics["health_retries"]),
     )
 
     return EntropyMixResponse(
@@ -68,6 +83,30 @@ async def mix_entropy(
     )
 
 
+@router.get(
+    "/executor/stats",
+    response_model=ExecutorStatsResponse,
+    summary="Статистика вычислительного пула",
+    description="Возвращает глубину очереди, время ожидания и время выполнения задач смешивания энтропии"
+    " для подбора количества воркеров.",
+)
+async def get_executor_stats(
+    executor: ComputeExecutor = Depends(get_compute_executor),
+) -> ExecutorStatsResponse:
+    stats = executor.stats()
+    return ExecutorStatsResponse(
+        kind=stats.kind,
+        max_workers=stats.max_workers,
+        pending=stats.pending,
+        queued=stats.queued,
+        completed=stats.completed,
+        failed=stats.failed,
+        avg_wait_ms=stats.avg_wait_ms,
+        max_wait_ms=stats.max_wait_ms,
+        avg_run_ms=stats.avg_run_ms,
+    )
+
+
 def _serialize_chaos_run(chaos_run) -> ChaosRunInfo:
     return ChaosRunInfo(
         id=chaos_run.id,
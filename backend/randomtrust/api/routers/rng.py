@@ -1,17 +1,21 @@
 from __future__ import annotations
 
-import io
 from uuid import UUID
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Query
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
 
-from randomtrust.api.dependencies import get_rng_service, get_unit_of_work
+from randomtrust.api.dependencies import get_rng_service, get_settings_dep, get_unit_of_work
+from randomtrust.core import Settings
+from randomtrust.entropy import EntropyHealthError
+from randomtrust.rng.export import ExportFormatName
 from randomtrust.rng.generator import RNGOutputFormat
-from randomtrust.schemas.rng import RNGGenerateRequest, RNGGenerateResponse
-from randomtrust.schemas.rng_read import RNGRunDetail, RNGRunSummary, TestReportView
+from randomtrust.schemas.rng import CorpusSelection, RNGGenerateRequest, RNGGenerateResponse, RNGStreamRequest
+from randomtrust.schemas.rng_read import CorpusEntryView, CorpusManifest, RNGRunDetail, RNGRunSummary, TestReportView
 from randomtrust.services import RNGService, UnitOfWork
 from randomtrust.services.rng_service import (
+    CorpusSelectionError,
+    ExportRangeError,
     InsufficientBitsError,
     RunDataUnavailableError,
     RunNotFoundError,
@@ -25,7 +29,8 @@ router = APIRouter()
     response_model=RNGGenerateResponse,
     summary="Сгенерировать последовательность ChaCha20",
     description="Инициирует запуск ChaCha20 на основе только что полученной энтропии."
-    " Позволяет выбрать формат ответа (hex или байтовый массив).",
+    " Позволяет выбрать формат ответа: hex, байтовый массив, целые числа из диапазона, числа с плавающей"
+    " точкой, перестановку или выборку без повторений.",
 )
 async def generate_rng(
     payload: RNGGenerateRequest = Body(
@@ -56,11 +61,21 @@ async def generate_rng(
                     },
                 },
             },
+            "range": {
+                "summary": "Целые числа из диапазона [low, high) (format=range или sample)",
+                "value": {
+                    "length": 10,
+                    "low": 1,
+                    "high": 7,
+                },
+            },
         },
     ),
     format: RNGOutputFormat = Query(
         default="hex",
-        description="Желаемый формат ответа: `hex` (строка) или `ints` (список байтов).",
+        description="Желаемый формат ответа: `hex` (строка), `ints` (список байтов), `range` (целые из [low, high)),"
+        " `floats` (числа из [0, 1)), `permutation` (перестановка low..low+length-1)"
+        " или `sample` (length различных чисел из [low, high)).",
     ),
     uow: UnitOfWork = Depends(get_unit_of_work),
     rng_service: RNGService = Depends(get_rng_service),
@@ -71,13 +86,21 @@ async def generate_rng(
         raise HTTPException(status_code=422, detail="length must be between 1 and 1_000_000")
 
     async with uow:
-        generated = await rng_service.generate(
-            uow=uow,
-            length=payload.length,
-            fmt=format,
-            noise_seed=payload.noise_seed,
-            overrides=overrides,
-        )
+        try:
+            generated = await rng_service.generate(
+                uow=uow,
+                length=payload.length,
+                fmt=format,
+                noise_seed=payload.noise_seed,
+                overrides=overrides,
+                low=payload.low,
+                high=payload.high,
+                storage=payload.storage,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
+        except EntropyHealthError as exc:
+            raise HTTPException(status_code=503, detail=str(exc)) from exc
 
     return RNGGenerateResponse(
         run_id=generated.run_id,
@@ -87,6 +110,56 @@ async def generate_rng(
     )
 
 
+@router.post(
+    "/generate/stream",
+    response_class=StreamingResponse,
+    summary="Потоковая генерация больших последовательностей",
+    description="Отдаёт сырой поток ChaCha20 (`application/octet-stream`) произвольной длины без лимита в 1 000 000 байт."
+    " Поток формируется блоками, контрольная сумма BLAKE2s считается инкрементально, а multipart-загрузка в MinIO"
+    " идёт параллельно с ответом. Идентификатор запуска возвращается в заголовке `X-Run-Id`.",
+)
+async def generate_rng_stream(
+    payload: RNGStreamRequest = Body(
+        ...,
+        description="Длина потока в байтах и параметры шума.",
+        examples={
+            "gigabyte": {
+                "summary": "1 ГиБ для внешних тестовых батарей",
+                "value": {"length": 1_073_741_824},
+            }
+        },
+    ),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    rng_service: RNGService = Depends(get_rng_service),
+    settings: Settings = Depends(get_settings_dep),
+):
+    if payload.length > settings.rng_stream_max_bytes:
+        raise HTTPException(
+            status_code=422,
+            detail=f"length must not exceed {settings.rng_stream_max_bytes} bytes",
+        )
+    overrides = payload.parameters.model_dump(exclude_none=True) if payload.parameters else None
+
+    async with uow:
+        try:
+            stream = await rng_service.open_stream(
+                uow=uow,
+                length=payload.length,
+                noise_seed=payload.noise_seed,
+                overrides=overrides,
+                storage=payload.storage,
+            )
+        except EntropyHealthError as exc:
+            raise HTTPException(status_code=503, detail=str(exc)) from exc
+
+    headers = {
+        "Content-Disposition": f'attachment; filename="{stream.run_id}.bin"',
+        "Content-Length": str(stream.length),
+        "X-Run-Id": str(stream.run_id),
+    }
+    return StreamingResponse(stream.chunks, media_type="application/octet-stream", headers=headers)
+
+
 def _serialize_run_summary(record) -> RNGRunSummary:
     return RNGRunSummary(
         id=record.id,
@@ -96,6 +169,8 @@ def _serialize_run_summary(record) -> RNGRunSummary:
         entropy_metrics=record.entropy_metrics,
         seed_hash=record.seed_hash,
         export_path=record.export_path,
+        output_params=record.output_params,
+        storage_mode=record.storage_mode,
         created_at=record.created_at,
         updated_at=record.updated_at,
     )
@@ -164,12 +239,28 @@ async def get_run(
     return _serialize_run_detail(record)
 
 
+def _parse_range(value: str | None) -> tuple[int | None, int | None] | None:
+    """Single `bytes=first-last` range; anything else is ignored and the full export is sent."""
+    if not value:
+        return None
+    unit, _, spec = value.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    if not sep or not (first or last) or (first and not first.isdigit()) or (last and not last.isdigit()):
+        return None
+    return (int(first) if first else None, int(last) if last else None)
+
+
 @router.get(
     "/runs/{run_id}/export",
     response_class=StreamingResponse,
     summary="Выгрузить битовую последовательность",
-    description="Отдаёт сохранённую последовательность в виде текстового файла, содержащего битовую строку."
-    " Используется для передачи в тестовые батареи NIST STS / Dieharder.",
+    description="Отдаёт сохранённую последовательность в выбранном формате: `ascii` — битовая строка из символов"
+    " 0/1 для NIST STS, `raw` — исходные байты, `dieharder` — файл для `dieharder -g 202` (заголовок и по одному"
+    " 32-битному слову в десятичной записи на строку). Поддерживается заголовок `Range` (один диапазон байт):"
+    " ответ 206 содержит только запрошенный фрагмент, поэтому выгрузку можно возобновлять и делить между процессами.",
+    responses={206: {"description": "Запрошенный диапазон байт"}, 416: {"description": "Диапазон вне выгрузки"}},
 )
 async def export_run_bits(
     run_id: UUID,
@@ -178,16 +269,31 @@ async def export_run_bits(
         ge=1,
         description="Минимальное количество бит, требуемое в файле. Ошибка 422, если доступно меньше.",
     ),
+    export_format: ExportFormatName = Query(
+        default="ascii",
+        alias="format",
+        description="Формат выгрузки: `ascii`, `raw` или `dieharder`.",
+    ),
+    range_header: str | None = Header(default=None, alias="Range"),
     uow: UnitOfWork = Depends(get_unit_of_work),
     rng_service: RNGService = Depends(get_rng_service),
 ):
+    byte_range = _parse_range(range_header)
     async with uow:
         try:
-            export = await rng_service.export_bits(uow=uow, run_id=run_id, min_bits=min_bits)
+            export = await rng_service.export_bits(
+                uow=uow,
+                run_id=run_id,
+                min_bits=min_bits,
+                export_format=export_format,
+                byte_range=byte_range,
+            )
         except RunNotFoundError as exc:
             raise HTTPException(status_code=404, detail=str(exc)) from exc
         except RunDataUnavailableError as exc:
             raise HTTPException(status_code=422, detail=str(exc)) from exc
+        except ExportRangeError as exc:
+            return Response(status_code=416, headers={"Content-Range": f"bytes */{exc.size}"})
         except InsufficientBitsError as exc:
             detail = {
                 "error": str(exc),
@@ -196,6 +302,125 @@ async def export_run_bits(
             }
             raise HTTPException(status_code=422, detail=detail) from exc
 
-    headers = {"Content-Disposition": f'attachment; filename="{export.filename}"'}
-    stream = io.BytesIO(export.content)
-    return StreamingResponse(stream, media_type="text/plain", headers=headers)
+    headers = {
+        "Content-Disposition": f'attachment; filename="{export.filename}"',
+        "Content-Length": str(export.stop - export.start),
+        "Accept-Ranges": "bytes",
+    }
+    status_code = 200
+    if byte_range is not None:
+        status_code = 206
+        headers["Content-Range"] = f"bytes {export.start}-{export.stop - 1}/{export.size}"
+    return StreamingResponse(export.chunks, status_code=status_code, media_type=export.media_type, headers=headers)
+
+
+async def _select_corpus(uow: UnitOfWork, rng_service: RNGService, selection: CorpusSelection):
+    try:
+        return await rng_service.select_corpus(
+            uow=uow,
+            run_ids=selection.run_ids,
+            created_from=selection.created_from,
+            created_to=selection.created_to,
+            metric=selection.metric,
+            metric_min=selection.metric_min,
+            metric_max=selection.metric_max,
+        )
+    except RunNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except (RunDataUnavailableError, CorpusSelectionError) as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
+_CORPUS_EXAMPLES = {
+    "ids": {
+        "summary": "Явный список генераций",
+        "value": {"run_ids": ["8b0e4f9c-5d2a-4c1e-9f3b-2a7d6c5e4b3a", "0c9d8e7f-6a5b-4c3d-2e1f-0a9b8c7d6e5f"]},
+    },
+    "filter": {
+        "summary": "Генерации за сутки с SNR не ниже 10 дБ",
+        "value": {
+            "created_from": "2026-10-16T00:00:00Z",
+            "created_to": "2026-10-17T00:00:00Z",
+            "metric": "snr_db",
+            "metric_min": 10.0,
+        },
+    },
+}
+
+
+@router.post(
+    "/corpus/manifest",
+    response_model=CorpusManifest,
+    summary="Манифест корпуса генераций",
+    description="Возвращает генерации, которые войдут в выгрузку корпуса с теми же параметрами отбора,"
+    " и смещение полезной нагрузки каждой из них в склеенной последовательности.",
+)
+async def get_corpus_manifest(
+    selection: CorpusSelection = Body(..., examples=_CORPUS_EXAMPLES),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    rng_service: RNGService = Depends(get_rng_service),
+) -> CorpusManifest:
+    async with uow:
+        runs = await _select_corpus(uow, rng_service, selection)
+    entries = rng_service.corpus_manifest(runs)
+    total_bytes = sum(entry.length for entry in entries)
+    return CorpusManifest(
+        total_bytes=total_bytes,
+        total_bits=total_bytes * 8,
+        runs=[
+            CorpusEntryView(
+                run_id=entry.run_id,
+                offset=entry.offset,
+                length=entry.length,
+                created_at=entry.created_at,
+                run_checksum=entry.run_checksum.hex() if entry.run_checksum else None,
+            )
+            for entry in entries
+        ],
+    )
+
+
+@router.post(
+    "/corpus/export",
+    response_class=StreamingResponse,
+    summary="Выгрузить корпус генераций одной последовательностью",
+    description="Склеивает полезную нагрузку отобранных генераций (список `run_ids` или фильтры по времени создания"
+    " и метрике энтропии) в одну последовательность и отдаёт её потоком в формате `ascii`, `raw` или `dieharder`."
+    " Объекты читаются из MinIO параллельно с ограниченным упреждением; порядок и смещения генераций"
+    " совпадают с `POST /api/rng/corpus/manifest`.",
+)
+async def export_corpus(
+    selection: CorpusSelection = Body(..., examples=_CORPUS_EXAMPLES),
+    min_bits: int = Query(
+        default=1_000_000,
+        ge=1,
+        description="Минимальное суммарное количество бит. Ошибка 422, если доступно меньше.",
+    ),
+    export_format: ExportFormatName = Query(
+        default="ascii",
+        alias="format",
+        description="Формат выгрузки: `ascii`, `raw` или `dieharder`.",
+    ),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    rng_service: RNGService = Depends(get_rng_service),
+):
+    async with uow:
+        runs = await _select_corpus(uow, rng_service, selection)
+    try:
+        export = await rng_service.export_corpus(runs=runs, min_bits=min_bits, export_format=export_format)
+    except RunDataUnavailableError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    except InsufficientBitsError as exc:
+        detail = {
+            "error": str(exc),
+            "available_bits": exc.available,
+            "required_bits": exc.required,
+        }
+        raise HTTPException(status_code=422, detail=detail) from exc
+
+    headers = {
+        "Content-Disposition": f'attachment; filename="{export.filename}"',
+        "Content-Length": str(export.size),
+        "X-Corpus-Runs": str(len(export.entries)),
+    }
+    return StreamingResponse(export.chunks, media_type=export.media_type, headers=headers)
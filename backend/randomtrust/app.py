@@ -4,9 +4,12 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from randomtrust.api import api_router
+from randomtrust.entropy import EntropyMixer, HealthTestConfig, LorenzChaosSimulator, NoiseSimulator
+from randomtrust.rng.generator import ParallelKeystream
 from randomtrust.core import (
     Settings,
     close_redis,
+    create_compute_executor,
     create_engine,
     create_minio_client,
     create_redis,
@@ -15,6 +18,46 @@ from randomtrust.core import (
     get_settings,
     setup_logging,
 )
+from randomtrust.services import EntropyService, SeedReservoir, SeedReservoirWorker, create_run_payload_cache
+
+
+def _create_seed_reservoir_worker(
+    settings: Settings,
+    *,
+    redis_client,
+    session_factory,
+    minio_client,
+    compute_executor,
+) -> tuple[SeedReservoir, SeedReservoirWorker]:
+    reservoir = SeedReservoir(
+        redis_client=redis_client,
+        key=f"seed_reservoir:{settings.environment}",
+        low_watermark=settings.seed_reservoir_low_watermark,
+        high_watermark=settings.seed_reservoir_high_watermark,
+    )
+    entropy_service = EntropyService(
+        mixer=EntropyMixer(
+            noise_simulator=NoiseSimulator(),
+            chaos_simulator=LorenzChaosSimulator(),
+            health_config=HealthTestConfig(
+                min_entropy=settings.entropy_health_min_entropy,
+                alpha_exponent=settings.entropy_health_alpha_exponent,
+            ),
+            max_health_retries=settings.entropy_health_max_retries,
+        ),
+        storage=minio_client,
+        settings=settings,
+        executor=compute_executor,
+    )
+    worker = SeedReservoirWorker(
+        reservoir=reservoir,
+        entropy_service=entropy_service,
+        session_factory=session_factory,
+        redis_client=redis_client,
+        batch_size=settings.seed_reservoir_batch_size,
+        poll_interval=settings.seed_reservoir_poll_seconds,
+    )
+    return reservoir, worker
 
 
 @asynccontextmanager
@@ -25,15 +68,45 @@ async def lifespan(app: FastAPI):
     engine = create_engine(settings)
     session_factory = create_session_factory(engine)
     minio_client = create_minio_client(settings)
+    compute_executor = create_compute_executor(settings)
 
     app.state.redis_client = redis_client
     app.state.engine = engine
     app.state.session_factory = session_factory
     app.state.minio_client = minio_client
+    app.state.compute_executor = compute_executor
+
+    payload_cache = create_run_payload_cache(settings, storage=minio_client)
+    if payload_cache is not None:
+        app.state.payload_cache = payload_cache
+
+    keystream_pool = None
+    if settings.rng_keystream_workers > 1:
+        keystream_pool = ParallelKeystream(max_workers=settings.rng_keystream_workers)
+        app.state.keystream_pool = keystream_pool
+
+    reservoir_worker = None
+    if settings.seed_reservoir_enabled:
+        reservoir, reservoir_worker = _create_seed_reservoir_worker(
+            settings,
+            redis_client=redis_client,
+            session_factory=session_factory,
+            minio_client=minio_client,
+            compute_executor=compute_executor,
+        )
+        app.state.seed_reservoir = reservoir
+        reservoir_worker.start()
 
     try:
         yield
     finally:
+        if reservoir_worker is not None:
+            await reservoir_worker.stop()
+        compute_executor.shutdown()
+        if payload_cache is not None:
+            payload_cache.shutdown()
+        if keystream_pool is not None:
+            keystream_pool.shutdown()
         if redis_client is not None:
             await close_redis(redis_client)
         if engine is not None:
@@ -1,8 +1,9 @@
 from .config import Settings, get_settings
 from .database import create_engine, create_session_factory, get_session, dispose_engine
+from .executor import ComputeExecutor, ExecutorStats, create_compute_executor
 from .logging import setup_logging
 from .redis import close_redis, create_redis
-from .storage import create_minio_client
+from .storage import StreamingUpload, StreamingUploadError, create_minio_client
 
 __all__ = [
     "Settings",
@@ -15,4 +16,9 @@ __all__ = [
     "create_redis",
     "close_redis",
     "create_minio_client",
+    "StreamingUpload",
+    "StreamingUploadError",
+    "ComputeExecutor",
+    "ExecutorStats",
+    "create_compute_executor",
 ]
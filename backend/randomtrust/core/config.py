@@ -1,6 +1,6 @@
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import AnyUrl, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -32,6 +32,43 @@ class Settings(BaseSettings):
     minio_bucket: str = Field(default="entropy-artifacts")
 
     rng_export_path: Path = Field(default=Path("/data/runs"))
+    rng_export_cache_enabled: bool = Field(default=True)
+    rng_export_cache_max_bytes: int = Field(default=8 * 1024**3, ge=0)
+    rng_stream_max_bytes: int = Field(default=64 * 1024**3, ge=1)
+    rng_stream_chunk_size: int = Field(default=1024**2, ge=64)
+    rng_keystream_workers: int = Field(default=1, ge=1)
+    rng_export_chunk_size: int = Field(default=64 * 1024, ge=64)
+    rng_corpus_max_runs: int = Field(default=10_000, ge=1)
+    rng_corpus_read_ahead: int = Field(default=4, ge=1)
+
+    analysis_chunk_size: int = Field(default=256 * 1024, ge=64)
+    analysis_parallel_max_bytes: int = Field(default=64 * 1024**2, ge=0)
+    analysis_segment_bits: int = Field(default=1 << 20, ge=1024)
+    analysis_batch_max_runs: int = Field(default=1000, ge=1)
+    analysis_batch_max_bytes: int = Field(default=128 * 1024**2, ge=1)
+    analysis_batch_concurrency: int = Field(default=8, ge=1)
+    analysis_min_entropy_max_simulations: int = Field(default=64, ge=1)
+    analysis_cache_enabled: bool = Field(default=True)
+    analysis_cache_ttl_seconds: int = Field(default=30 * 24 * 3600, ge=60)
+    analysis_job_group: str = Field(default="analysis-workers")
+    analysis_job_ttl_seconds: int = Field(default=7 * 24 * 3600, ge=60)
+    analysis_job_block_seconds: float = Field(default=5.0, gt=0)
+    analysis_job_claim_idle_seconds: float = Field(default=300.0, gt=0)
+    analysis_job_max_attempts: int = Field(default=3, ge=1)
+    analysis_job_progress_seconds: float = Field(default=1.0, gt=0)
+    analysis_job_events_maxlen: int = Field(default=10_000, ge=1)
+
+    compute_executor_kind: Literal["thread", "process"] = Field(default="process")
+    compute_executor_workers: int = Field(default=2, ge=1)
+
+    entropy_health_min_entropy: float = Field(default=0.1, gt=0, le=8)
+    entropy_health_alpha_exponent: int = Field(default=20, ge=20, le=40)
+    entropy_health_max_retries: int = Field(default=3, ge=0)
+    seed_reservoir_enabled: bool = Field(default=True)
+    seed_reservoir_low_watermark: int = Field(default=16, ge=0)
+    seed_reservoir_high_watermark: int = Field(default=64, ge=1)
+    seed_reservoir_batch_size: int = Field(default=16, ge=1)
+    seed_reservoir_poll_seconds: float = Field(default=5.0, gt=0)
 
     cors_allow_origins: list[str] = Field(default_factory=lambda: ["*"])
     cors_allow_methods: list[str] = Field(default_factory=lambda: ["*"])
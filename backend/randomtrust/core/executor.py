@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Literal, TypeVar
+
+from .config import Settings
+
+ExecutorKind = Literal["thread", "process"]
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class ExecutorStats:
+    kind: str
+    max_workers: int
+    pending: int
+    queued: int
+    completed: int
+    failed: int
+    avg_wait_ms: float
+    max_wait_ms: float
+    avg_run_ms: float
+
+
+def _timed_call(fn: Callable[..., T], args: tuple[Any, ...], kwargs: dict[str, Any]) -> tuple[float, float, T]:
+    # Runs inside the worker; wall-clock stamps stay comparable across processes.
+    started_at = time.time()
+    result = fn(*args, **kwargs)
+    return started_at, time.time(), result
+
+
+class ComputeExecutor:
+    """Runs CPU-bound callables off the event loop and tracks queueing statistics."""
+
+    def __init__(self, *, kind: ExecutorKind, max_workers: int) -> None:
+        if kind == "process":
+            # Spawned workers avoid forking a process that already runs the event loop and its threads.
+            self._executor: Executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        elif kind == "thread":
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="randomtrust-compute")
+        else:
+            raise ValueError(f"unknown executor kind: {kind}")
+        self._kind = kind
+        self._max_workers = max_workers
+        self._pending = 0
+        self._completed = 0
+        self._failed = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._run_total = 0.0
+
+    @property
+    def kind(self) -> str:
+        return self._kind
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        submitted_at = time.time()
+        self._pending += 1
+        try:
+            started_at, finished_at, result = await loop.run_in_executor(
+                self._executor,
+                partial(_timed_call, fn, args, kwargs),
+            )
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._pending -= 1
+
+        wait = max(started_at - submitted_at, 0.0)
+        self._completed += 1
+        self._wait_total += wait
+        self._wait_max = max(self._wait_max, wait)
+        self._run_total += max(finished_at - started_at, 0.0)
+        return result
+
+    def stats(self) -> ExecutorStats:
+        completed = self._completed
+        return ExecutorStats(
+            kind=self._kind,
+            max_workers=self._max_workers,
+            pending=self._pending,
+            # Work beyond the worker count has not been picked up yet.
+            queued=max(self._pending - self._max_workers, 0),
+            completed=completed,
+            failed=self._failed,
+            avg_wait_ms=(self._wait_total / completed * 1_000.0) if completed else 0.0,
+            max_wait_ms=self._wait_max * 1_000.0,
+            avg_run_ms=(self._run_total / completed * 1_000.0) if completed else 0.0,
+        )
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def create_compute_executor(settings: Settings) -> ComputeExecutor:
+    return ComputeExecutor(
+        kind=settings.compute_executor_kind,
+        max_workers=settings.compute_executor_workers,
+    )
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Final
+import asyncio
+from contextlib import suppress
+from typing import Any, Final
 
 from minio import Minio
 
@@ -23,3 +25,100 @@ def create_minio_client(settings: Settings) -> Minio:
         client.make_bucket(settings.minio_bucket)
 
     return client
+
+
+_STREAM_END: Final[object] = object()
+_STREAM_ABORT: Final[object] = object()
+_DEFAULT_PART_SIZE: Final[int] = 16 * 1024 * 1024
+
+
+class StreamingUploadError(RuntimeError):
+    """Raised when a background multipart upload fails or is aborted."""
+
+
+class StreamingUpload:
+    """Feeds chunks produced on the event loop into a multipart `put_object` running in a thread.
+
+    The bounded queue applies backpressure to the producer, so memory stays at roughly
+    `max_pending` chunks plus one multipart part regardless of the object size.
+    """
+
+    def __init__(
+        self,
+        client: Minio,
+        bucket: str,
+        path: str,
+        *,
+        length: int = -1,
+        part_size: int = _DEFAULT_PART_SIZE,
+        max_pending: int = 4,
+        content_type: str = "application/octet-stream",
+    ) -> None:
+        self._client = client
+        self._bucket = bucket
+        self._path = path
+        self._length = length
+        # minio derives the part size itself when the total length is known.
+        self._part_size = 0 if length >= 0 else part_size
+        self._content_type = content_type
+        self._queue: asyncio.Queue[object] = asyncio.Queue(maxsize=max_pending)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Future[Any] | None = None
+        self._buffer = b""
+        self._finished = False
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.ensure_future(asyncio.to_thread(self._upload))
+
+    async def write(self, chunk: bytes) -> None:
+        assert self._task is not None, "upload not started"
+        put = asyncio.ensure_future(self._queue.put(chunk))
+        done, _ = await asyncio.wait({put, self._task}, return_when=asyncio.FIRST_COMPLETED)
+        if put not in done:
+            # The upload thread stopped while the producer was waiting for queue space.
+            put.cancel()
+            await self._task
+            raise StreamingUploadError(f"upload of {self._path} stopped early")
+
+    async def close(self) -> None:
+        assert self._task is not None, "upload not started"
+        await self._queue.put(_STREAM_END)
+        await self._task
+
+    async def abort(self) -> None:
+        if self._task is None or self._task.done():
+            return
+        # Drop queued chunks so the sentinel always fits, then let minio abort the multipart upload.
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(_STREAM_ABORT)
+        with suppress(Exception):
+            await self._task
+
+    def _upload(self) -> None:
+        self._client.put_object(
+            self._bucket,
+            self._path,
+            data=self,
+            length=self._length,
+            part_size=self._part_size,
+            num_parallel_uploads=1,
+            content_type=self._content_type,
+        )
+
+    def read(self, size: int = -1) -> bytes:
+        # Called from the upload thread by minio; short reads are fine since minio keeps reading.
+        if not self._buffer and not self._finished:
+            assert self._loop is not None
+            item = asyncio.run_coroutine_threadsafe(self._queue.get(), self._loop).result()
+            if item is _STREAM_ABORT:
+                raise StreamingUploadError(f"upload of {self._path} aborted")
+            if item is _STREAM_END:
+                self._finished = True
+            else:
+                self._buffer = item  # type: ignore[assignment]
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
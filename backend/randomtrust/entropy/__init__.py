@@ -1,6 +1,7 @@
 from .simulator import NoiseConfig, NoiseSample, NoiseSimulator
-from .chaos import LorenzChaosSimulator, LorenzConfig
-from .mixer import EntropyMixer, EntropyMetricsData, EntropyMixResult
+from .chaos import LorenzChaosSimulator, LorenzConfig, LorenzIntegrator
+from .health import EntropyHealthError, HealthTestConfig, HealthTestResult, run_health_tests
+from .mixer import EntropyMixer, EntropyMetricsData, EntropyMixResult, quantize_noise
 
 __all__ = [
     "NoiseConfig",
@@ -8,7 +9,13 @@ __all__ = [
     "NoiseSimulator",
     "LorenzConfig",
     "LorenzChaosSimulator",
+    "LorenzIntegrator",
     "EntropyMixer",
     "EntropyMetricsData",
     "EntropyMixResult",
+    "EntropyHealthError",
+    "HealthTestConfig",
+    "HealthTestResult",
+    "run_health_tests",
+    "quantize_noise",
 ]
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Callable, Literal, Sequence
 
 import numpy as np
 
+LorenzIntegrator = Literal["euler", "rk4"]
+
+# Below this batch size plain Python floats beat per-step numpy calls on tiny arrays.
+_SCALAR_BATCH_LIMIT = 8
+
 
 @dataclass(frozen=True)
 class LorenzConfig:
@@ -12,6 +18,40 @@ class LorenzConfig:
     beta: float = 8.0 / 3.0
     dt: float = 1e-3
     steps: int = 10_000
+    integrator: LorenzIntegrator = "euler"
+
+
+def _lorenz_field(x, y, z, sigma: float, rho: float, beta: float):
+    # Works for Python floats and (N,) arrays alike, keeping the operation order identical.
+    dx = sigma * (y - x)
+    dy = x * (rho - z) - y
+    dz = x * y - beta * z
+    return dx, dy, dz
+
+
+def _euler_step(x, y, z, sigma: float, rho: float, beta: float, dt: float):
+    dx, dy, dz = _lorenz_field(x, y, z, sigma, rho, beta)
+    return x + dt * dx, y + dt * dy, z + dt * dz
+
+
+def _rk4_step(x, y, z, sigma: float, rho: float, beta: float, dt: float):
+    half = 0.5 * dt
+    k1x, k1y, k1z = _lorenz_field(x, y, z, sigma, rho, beta)
+    k2x, k2y, k2z = _lorenz_field(x + half * k1x, y + half * k1y, z + half * k1z, sigma, rho, beta)
+    k3x, k3y, k3z = _lorenz_field(x + half * k2x, y + half * k2y, z + half * k2z, sigma, rho, beta)
+    k4x, k4y, k4z = _lorenz_field(x + dt * k3x, y + dt * k3y, z + dt * k3z, sigma, rho, beta)
+    sixth = dt / 6.0
+    return (
+        x + sixth * (k1x + 2.0 * k2x + 2.0 * k3x + k4x),
+        y + sixth * (k1y + 2.0 * k2y + 2.0 * k3y + k4y),
+        z + sixth * (k1z + 2.0 * k2z + 2.0 * k3z + k4z),
+    )
+
+
+_INTEGRATORS: dict[str, Callable] = {
+    "euler": _euler_step,
+    "rk4": _rk4_step,
+}
 
 
 class LorenzChaosSimulator:
@@ -23,19 +63,50 @@ class LorenzChaosSimulator:
         return self._config
 
     def run(self, seed_vector: np.ndarray | None = None, overrides: LorenzConfig | None = None) -> np.ndarray:
-        cfg = overrides or self._config
         state = self._initial_state(seed_vector)
-        trajectory = np.empty((cfg.steps, 3), dtype=np.float64)
+        return self._integrate(state[np.newaxis, :], overrides or self._config)[0]
+
+    def run_batch(
+        self,
+        seed_vectors: Sequence[np.ndarray | None] | np.ndarray,
+        overrides: LorenzConfig | None = None,
+    ) -> np.ndarray:
+        """Integrate one trajectory per seed vector and return an (N, steps, 3) array."""
+        states = np.empty((len(seed_vectors), 3), dtype=np.float64)
+        for idx, vector in enumerate(seed_vectors):
+            states[idx] = self._initial_state(vector)
+        return self._integrate(states, overrides or self._config)
+
+    def _integrate(self, states: np.ndarray, cfg: LorenzConfig) -> np.ndarray:
+        if cfg.integrator not in _INTEGRATORS:
+            raise ValueError(f"unknown integrator: {cfg.integrator}")
+        step = _INTEGRATORS[cfg.integrator]
+        params = (cfg.sigma, cfg.rho, cfg.beta, cfg.dt)
+        count = states.shape[0]
+        trajectories = np.empty((count, cfg.steps, 3), dtype=np.float64)
+        if count == 0 or cfg.steps <= 0:
+            return trajectories
+
+        if count <= _SCALAR_BATCH_LIMIT:
+            for idx in range(count):
+                x, y, z = (float(v) for v in states[idx])
+                rows: list[tuple[float, float, float]] = []
+                for _ in range(cfg.steps):
+                    x, y, z = step(x, y, z, *params)
+                    rows.append((x, y, z))
+                trajectories[idx] = rows
+            return trajectories
 
+        # Time-major buffer keeps every step write contiguous across the whole batch.
+        columns = np.empty((cfg.steps, 3, count), dtype=np.float64)
+        x, y, z = (states[:, axis].copy() for axis in range(3))
         for i in range(cfg.steps):
-            x, y, z = state
-            dx = cfg.sigma * (y - x)
-            dy = x * (cfg.rho - z) - y
-            dz = x * y - cfg.beta * z
-            state = state + cfg.dt * np.array([dx, dy, dz])
-            trajectory[i] = state
-
-        return trajectory
+            x, y, z = step(x, y, z, *params)
+            columns[i, 0] = x
+            columns[i, 1] = y
+            columns[i, 2] = z
+        trajectories[...] = columns.transpose(2, 0, 1)
+        return trajectories
 
     def _initial_state(self, seed_vector: np.ndarray | None) -> np.ndarray:
         if seed_vector is None:
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from math import ceil, exp, lgamma, log
+
+import numpy as np
+
+
+class EntropyHealthError(RuntimeError):
+    """Источник шума не прошёл непрерывные тесты работоспособности SP 800-90B."""
+
+
+@dataclass(frozen=True)
+class HealthTestConfig:
+    # Assessed min-entropy of one quantized noise sample, in bits (H in SP 800-90B §4.4).
+    # The simulated noise is heavily oversampled, so neighbouring samples repeat often.
+    min_entropy: float = 0.1
+    # False positive probability of each test is 2**-alpha_exponent.
+    alpha_exponent: int = 20
+    # Adaptive proportion window for non-binary samples.
+    window: int = 512
+
+    @property
+    def repetition_cutoff(self) -> int:
+        return repetition_count_cutoff(self.min_entropy, self.alpha_exponent)
+
+    @property
+    def proportion_cutoff(self) -> int:
+        return adaptive_proportion_cutoff(self.min_entropy, self.alpha_exponent, self.window)
+
+
+@dataclass(frozen=True)
+class HealthTestResult:
+    """Per-row health statistics of a (rows, samples) block of quantized noise."""
+
+    # Longest run of identical consecutive samples.
+    max_repetition: np.ndarray
+    # Highest count of a window's first sample within that window.
+    max_proportion: np.ndarray
+    repetition_cutoff: int
+    proportion_cutoff: int
+
+    @property
+    def passed(self) -> np.ndarray:
+        return (self.max_repetition < self.repetition_cutoff) & (self.max_proportion < self.proportion_cutoff)
+
+
+def repetition_count_cutoff(min_entropy: float, alpha_exponent: int = 20) -> int:
+    """Repetition Count Test cutoff C = 1 + ceil(-log2(alpha) / H) (SP 800-90B §4.4.1)."""
+    return 1 + ceil(alpha_exponent / min_entropy)
+
+
+@lru_cache
+def adaptive_proportion_cutoff(min_entropy: float, alpha_exponent: int = 20, window: int = 512) -> int:
+    """Adaptive Proportion Test cutoff C = 1 + CRITBINOM(W, 2**-H, 1 - alpha) (SP 800-90B §4.4.2)."""
+    p = 2.0 ** -min_entropy
+    alpha = 2.0 ** -alpha_exponent
+
+    def pmf(k: int) -> float:
+        if p >= 1.0:
+            return 1.0 if k == window else 0.0
+        log_pmf = lgamma(window + 1) - lgamma(k + 1) - lgamma(window - k + 1)
+        return exp(log_pmf + k * log(p) + (window - k) * log(1.0 - p))
+
+    # Lower k from W while the upper tail P[X > k - 1] stays within alpha.
+    k, tail = window, 0.0
+    while k > 0 and tail + pmf(k) <= alpha:
+        tail += pmf(k)
+        k -= 1
+    return 1 + k
+
+
+def max_repetitions(samples: np.ndarray) -> np.ndarray:
+    """Longest run of equal consecutive values in every row of a 2-D array."""
+    rows, count = samples.shape
+    if count == 0:
+        return np.zeros(rows, dtype=np.int64)
+    flat = samples.reshape(-1)
+    starts = np.empty(flat.size, dtype=bool)
+    starts[0] = True
+    np.not_equal(flat[1:], flat[:-1], out=starts[1:])
+    # Every row starts a new run, so runs never span rows.
+    starts[::count] = True
+    positions = np.flatnonzero(starts)
+    lengths = np.diff(positions, append=flat.size)
+    first_runs = np.searchsorted(positions, np.arange(rows) * count)
+    return np.maximum.reduceat(lengths, first_runs)
+
+
+def max_proportions(samples: np.ndarray, window: int) -> np.ndarray:
+    """Highest count of each window's first value inside the window, over complete windows."""
+    rows, count = samples.shape
+    windows = count // window
+    if windows == 0:
+        return np.zeros(rows, dtype=np.int64)
+    blocks = samples[:, : windows * window].reshape(rows, windows, window)
+    matches = np.count_nonzero(blocks == blocks[:, :, :1], axis=2)
+    return matches.max(axis=1)
+
+
+def run_health_tests(samples: np.ndarray, config: HealthTestConfig) -> HealthTestResult:
+    """SP 800-90B Repetition Count and Adaptive Proportion tests over every row of `samples`."""
+    return HealthTestResult(
+        max_repetition=max_repetitions(samples),
+        max_proportion=max_proportions(samples, config.window),
+        repetition_cutoff=config.repetition_cutoff,
+        proportion_cutoff=config.proportion_cutoff,
+    )
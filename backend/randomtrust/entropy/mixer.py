@@ -1,23 +1,41 @@
 from __future__ import annotations
 
 from dataclasses import asdict, dataclass, replace
-from typing import Any
+from typing import Any, Sequence
 
 import numpy as np
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
 from .chaos import LorenzChaosSimulator, LorenzConfig
+from .health import EntropyHealthError, HealthTestConfig, HealthTestResult, run_health_tests
 from .simulator import NoiseConfig, NoiseSample, NoiseSimulator
 
 _EPS = 1e-12
 
 
+def _retry_seed(seed: int | None, attempt: int) -> int | None:
+    if seed is None:
+        return None
+    return int(np.random.SeedSequence([seed, attempt]).generate_state(1, np.uint64)[0])
+
+
+def quantize_noise(signals: np.ndarray) -> np.ndarray:
+    """Byte samples the mixer feeds into the pool; also used to re-derive them from stored artifacts."""
+    # Normalize noise samples into byte range before they enter the pool.
+    return np.clip((signals + 1.0) * 127.5, 0, 255).astype(np.uint8)
+
+
 @dataclass(frozen=True)
 class EntropyMetricsData:
     snr_db: float
     spectral_deviation_percent: float
     lyapunov_exponent: float
+    # SP 800-90B health statistics of the accepted noise sample.
+    health_max_repetition: int = 0
+    health_max_proportion: int = 0
+    # Noise samples rejected by the health tests before this one was accepted.
+    health_retries: int = 0
 
 
 @dataclass(frozen=True)
@@ -37,43 +55,100 @@ class EntropyMixer:
         self,
         noise_simulator: NoiseSimulator,
         chaos_simulator: LorenzChaosSimulator,
+        health_config: HealthTestConfig | None = None,
+        max_health_retries: int = 3,
     ) -> None:
         self._noise_simulator = noise_simulator
         self._chaos_simulator = chaos_simulator
+        self._health_config = health_config or HealthTestConfig()
+        self._max_health_retries = max_health_retries
 
     def mix_entropy(
         self,
         noise_seed: int | None = None,
         parameter_overrides: dict[str, Any] | None = None,
     ) -> EntropyMixResult:
-        # Tune the noise generator with caller overrides while preserving defaults.
-        noise_config = self._build_noise_config(parameter_overrides)
-        # Produce stochastic wire-hum sample along with intermediate components.
-        noise_sample = self._noise_simulator.generate(seed=noise_seed, overrides=noise_config)
+        return self.mix_entropy_batch([(noise_seed, parameter_overrides)])[0]
+
+    def mix_entropy_batch(
+        self,
+        requests: Sequence[tuple[int | None, dict[str, Any] | None]],
+    ) -> list[EntropyMixResult]:
+        results: list[EntropyMixResult | None] = [None] * len(requests)
+        # Requests sharing a noise configuration produce equally sized signals and are stacked together.
+        groups: dict[NoiseConfig, list[int]] = {}
+        for idx, (_, overrides) in enumerate(requests):
+            # Tune the noise generator with caller overrides while preserving defaults.
+            groups.setdefault(self._build_noise_config(overrides), []).append(idx)
 
-        # Derive a deterministic vector that seeds the chaotic attractor.
-        seed_vector = self._build_seed_vector(noise_sample.signal)
         chaos_cfg = self._chaos_simulator.config
-        # Run Lorenz system using noise derived state to obtain chaotic trajectory.
-        chaos_trajectory = self._chaos_simulator.run(seed_vector=seed_vector, overrides=None)
-
-        # Combine both sources into a high-entropy pool and capture integrity checksums.
-        pool_hash, chaos_checksum = self._combine_entropy(noise_sample, chaos_trajectory)
-        # Final ChaCha20 seed originates from HKDF expansion of the mixed pool.
-        seed = self._derive_seed(pool_hash)
-        # Metrics describe statistical properties of the produced datasets.
-        metrics = self._calculate_metrics(noise_sample, chaos_trajectory, chaos_cfg)
-
-        return EntropyMixResult(
-            seed=seed,
-            pool_hash=pool_hash,
-            chaos_checksum=chaos_checksum,
-            noise_config=asdict(noise_config),
-            chaos_config=asdict(chaos_cfg),
-            metrics=metrics,
-            noise_sample=noise_sample,
-            chaos_trajectory=chaos_trajectory,
-        )
+        for noise_config, indices in groups.items():
+            # Produce stochastic wire-hum samples along with intermediate components, one row per request.
+            seeds = [requests[idx][0] for idx in indices]
+            noise_batch = self._noise_simulator.generate_batch(seeds, overrides=noise_config)
+            # Samples failing the continuous health tests are replaced before anything is hashed.
+            noise_bytes, health, retries = self._screen_noise(noise_batch, seeds, noise_config)
+
+            # Derive deterministic vectors that seed the chaotic attractor.
+            seed_vectors = self._build_seed_vectors(noise_batch.signal)
+            # Run Lorenz system using noise derived states to obtain chaotic trajectories.
+            chaos_trajectories = self._chaos_simulator.run_batch(seed_vectors)
+            # Metrics describe statistical properties of the produced datasets.
+            metrics = self._calculate_metrics_batch(noise_batch, chaos_trajectories, chaos_cfg, health, retries)
+
+            chaos_bytes = chaos_trajectories.astype(np.float32)
+            noise_config_dict = asdict(noise_config)
+            chaos_config_dict = asdict(chaos_cfg)
+            for row, idx in enumerate(indices):
+                # Combine both sources into a high-entropy pool and capture integrity checksums.
+                pool_hash, chaos_checksum = self._combine_entropy(noise_bytes[row].tobytes(), chaos_bytes[row].tobytes())
+                # Final ChaCha20 seed originates from HKDF expansion of the mixed pool.
+                seed = self._derive_seed(pool_hash)
+                results[idx] = EntropyMixResult(
+                    seed=seed,
+                    pool_hash=pool_hash,
+                    chaos_checksum=chaos_checksum,
+                    noise_config=dict(noise_config_dict),
+                    chaos_config=dict(chaos_config_dict),
+                    metrics=metrics[row],
+                    noise_sample=noise_batch.row(row),
+                    chaos_trajectory=chaos_trajectories[row],
+                )
+
+        return [result for result in results if result is not None]
+
+    def _screen_noise(
+        self,
+        noise_batch: NoiseSample,
+        seeds: Sequence[int | None],
+        noise_config: NoiseConfig,
+    ) -> tuple[np.ndarray, HealthTestResult, np.ndarray]:
+        noise_bytes = quantize_noise(noise_batch.signal)
+        health = run_health_tests(noise_bytes, self._health_config)
+        retries = np.zeros(len(seeds), dtype=np.int64)
+        for attempt in range(1, self._max_health_retries + 1):
+            failed = np.flatnonzero(~health.passed)
+            if failed.size == 0:
+                return noise_bytes, health, retries
+            retries[failed] += 1
+            # Retry seeds derive from the caller's seed, so seeded requests stay reproducible.
+            redrawn = self._noise_simulator.generate_batch(
+                [_retry_seed(seeds[row], attempt) for row in failed],
+                overrides=noise_config,
+            )
+            for component in ("signal", "hum_component", "noise_component", "spike_component"):
+                getattr(noise_batch, component)[failed] = getattr(redrawn, component)
+            noise_bytes[failed] = quantize_noise(redrawn.signal)
+            retested = run_health_tests(noise_bytes[failed], self._health_config)
+            health.max_repetition[failed] = retested.max_repetition
+            health.max_proportion[failed] = retested.max_proportion
+        if not health.passed.all():
+            raise EntropyHealthError(
+                f"noise source failed SP 800-90B health tests after {self._max_health_retries} retries"
+                f" (repetition {int(health.max_repetition.max())}/{health.repetition_cutoff},"
+                f" proportion {int(health.max_proportion.max())}/{health.proportion_cutoff})"
+            )
+        return noise_bytes, health, retries
 
     def _build_noise_config(self, overrides: dict[str, Any] | None) -> NoiseConfig:
         if not overrides:
@@ -84,19 +159,17 @@ class EntropyMixer:
         filtered: dict[str, Any] = {k: v for k, v in overrides.items() if k in valid_keys and v is not None}
         return replace(self._noise_simulator.config, **filtered)
 
-    def _build_seed_vector(self, signal: np.ndarray) -> np.ndarray:
-        if signal.size < 6:
-            padded = np.pad(signal, (0, 6 - signal.size), mode="wrap")
+    def _build_seed_vectors(self, signals: np.ndarray) -> np.ndarray:
+        if signals.shape[1] < 6:
+            padded = np.pad(signals, ((0, 0), (0, 6 - signals.shape[1])), mode="wrap")
         else:
-            padded = signal[:6]
-        reshaped = padded.reshape(2, 3).mean(axis=0)
+            padded = signals[:, :6]
+        reshaped = padded.reshape(-1, 2, 3).mean(axis=1)
         reshaped = np.where(np.abs(reshaped) < 1e-6, 1e-6, reshaped)
         return reshaped.astype(np.float64)
 
-    def _combine_entropy(self, noise_sample: NoiseSample, chaos_trajectory: np.ndarray) -> tuple[bytes, str]:
-        # Normalize noise sample into byte range and append chaotic trajectory snapshot.
-        noise_bytes = np.clip((noise_sample.signal + 1.0) * 127.5, 0, 255).astype(np.uint8).tobytes()
-        chaos_bytes = chaos_trajectory.astype(np.float32).tobytes()
+    def _combine_entropy(self, noise_bytes: bytes, chaos_bytes: bytes) -> tuple[bytes, str]:
+        # Append chaotic trajectory snapshot to the quantized noise.
         mix_buffer = noise_bytes + chaos_bytes
         # SHA3-512 provides collision resistance for the final entropy pool hash.
         digest = hashes.Hash(hashes.SHA3_512())
@@ -120,39 +193,47 @@ class EntropyMixer:
         )
         return hkdf.derive(pool_hash)
 
-    def _calculate_metrics(
+    def _calculate_metrics_batch(
         self,
-        noise_sample: NoiseSample,
-        chaos_trajectory: np.ndarray,
+        noise_batch: NoiseSample,
+        chaos_trajectories: np.ndarray,
         chaos_config: LorenzConfig,
-    ) -> EntropyMetricsData:
+        health: HealthTestResult,
+        retries: np.ndarray,
+    ) -> list[EntropyMetricsData]:
         # Signal-to-noise ratio evaluates how pronounced the base hum remains.
-        signal_power = float(np.mean(np.square(noise_sample.signal)) + _EPS)
-        noise_power = float(
-            np.mean(np.square(noise_sample.noise_component + noise_sample.spike_component)) + _EPS
+        signal_power = np.mean(np.square(noise_batch.signal), axis=1) + _EPS
+        noise_power = (
+            np.mean(np.square(noise_batch.noise_component + noise_batch.spike_component), axis=1) + _EPS
         )
-        snr_db = 10.0 * np.log10(signal_power / noise_power)
+        snr_db = 10.0 * np.log10(signal_power.astype(np.float64) / noise_power.astype(np.float64))
 
         # Spectral deviation highlights flatness of the spectrum after mixing.
-        spectrum = np.abs(np.fft.rfft(noise_sample.signal))
-        avg_magnitude = np.mean(spectrum) + _EPS
-        spectral_deviation_percent = float(np.mean(np.abs(spectrum - avg_magnitude) / avg_magnitude) * 100.0)
+        spectrum = np.abs(np.fft.rfft(noise_batch.signal, axis=1))
+        avg_magnitude = np.mean(spectrum, axis=1, keepdims=True) + _EPS
+        spectral_deviation_percent = np.mean(np.abs(spectrum - avg_magnitude) / avg_magnitude, axis=1) * 100.0
 
         # Lyapunov exponent approximates divergence of nearby chaotic trajectories.
-        lyapunov = self._estimate_lyapunov(chaos_trajectory, chaos_config.dt)
-
-        return EntropyMetricsData(
-            snr_db=float(snr_db),
-            spectral_deviation_percent=spectral_deviation_percent,
-            lyapunov_exponent=lyapunov,
-        )
-
-    def _estimate_lyapunov(self, trajectory: np.ndarray, dt: float) -> float:
-        shifted = trajectory[:-1]
-        next_state = trajectory[1:]
-        if shifted.size == 0:
-            return 0.0
-        diffs = np.linalg.norm(next_state - shifted, axis=1)
+        lyapunov = self._estimate_lyapunov(chaos_trajectories, chaos_config.dt)
+
+        return [
+            EntropyMetricsData(
+                snr_db=float(snr_db[row]),
+                spectral_deviation_percent=float(spectral_deviation_percent[row]),
+                lyapunov_exponent=float(lyapunov[row]),
+                health_max_repetition=int(health.max_repetition[row]),
+                health_max_proportion=int(health.max_proportion[row]),
+                health_retries=int(retries[row]),
+            )
+            for row in range(len(noise_batch))
+        ]
+
+    def _estimate_lyapunov(self, trajectories: np.ndarray, dt: float) -> np.ndarray:
+        shifted = trajectories[:, :-1]
+        next_state = trajectories[:, 1:]
+        if shifted.shape[1] == 0:
+            return np.zeros(trajectories.shape[0], dtype=np.float64)
+        diffs = np.linalg.norm(next_state - shifted, axis=2)
         diffs = np.where(diffs <= _EPS, _EPS, diffs)
-        lyapunov = np.mean(np.log(diffs / dt))
-        return float(max(lyapunov, 0.0))
+        lyapunov = np.mean(np.log(diffs / dt), axis=1)
+        return np.maximum(lyapunov, 0.0)
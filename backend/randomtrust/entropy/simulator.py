@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Sequence
 
 import numpy as np
 
@@ -19,11 +20,24 @@ class NoiseConfig:
 
 @dataclass(frozen=True)
 class NoiseSample:
+    """Noise components; batch generation stacks one sample per row."""
+
     signal: np.ndarray
     hum_component: np.ndarray
     noise_component: np.ndarray
     spike_component: np.ndarray
 
+    def __len__(self) -> int:
+        return self.signal.shape[0] if self.signal.ndim == 2 else 1
+
+    def row(self, index: int) -> NoiseSample:
+        return NoiseSample(
+            signal=self.signal[index],
+            hum_component=self.hum_component[index],
+            noise_component=self.noise_component[index],
+            spike_component=self.spike_component[index],
+        )
+
 
 class NoiseSimulator:
     def __init__(self, config: NoiseConfig | None = None) -> None:
@@ -37,42 +51,55 @@ class NoiseSimulator:
         self,
         seed: int | None = None,
         overrides: NoiseConfig | None = None,
+    ) -> NoiseSample:
+        return self.generate_batch([seed], overrides=overrides).row(0)
+
+    def generate_batch(
+        self,
+        seeds: Sequence[int | None],
+        overrides: NoiseConfig | None = None,
     ) -> NoiseSample:
         cfg = overrides or self._config
-        rng = np.random.default_rng(seed)
+        batch = len(seeds)
         sample_count = max(int(cfg.sample_rate * cfg.duration_ms / 1_000), 1)
+        spike_count = int(cfg.spike_density * sample_count)
+
+        # Random draws stay per seed and in the original order so every row is reproducible alone.
+        phases = np.empty((batch, len(cfg.hum_frequencies)), dtype=np.float64)
+        white_noise = np.empty((batch, sample_count), dtype=np.float64)
+        spikes = np.zeros((batch, sample_count), dtype=np.float64)
+        for row, seed in enumerate(seeds):
+            rng = np.random.default_rng(seed)
+            for k in range(len(cfg.hum_frequencies)):
+                phases[row, k] = rng.uniform(0, 2 * np.pi)
+            white_noise[row] = rng.standard_normal(sample_count)
+            if spike_count > 0:
+                spike_positions = rng.choice(sample_count, size=spike_count, replace=False)
+                spikes[row, spike_positions] = cfg.spike_amplitude * rng.uniform(-1.0, 1.0, size=spike_count)
 
         t = np.linspace(0, cfg.duration_ms / 1_000, sample_count, endpoint=False)
-        hum = np.zeros_like(t)
-        for freq in cfg.hum_frequencies:
-            phase = rng.uniform(0, 2 * np.pi)
-            hum += cfg.hum_amplitude * np.sin(2 * np.pi * freq * t + phase)
+        hum = np.zeros((batch, sample_count), dtype=np.float64)
+        for k, freq in enumerate(cfg.hum_frequencies):
+            hum += cfg.hum_amplitude * np.sin(2 * np.pi * freq * t + phases[:, k : k + 1])
 
         # Band-limited white noise via frequency domain shaping
-        white_noise = rng.standard_normal(sample_count)
-        spectrum = np.fft.rfft(white_noise)
+        spectrum = np.fft.rfft(white_noise, axis=1)
         freqs = np.fft.rfftfreq(sample_count, d=1 / cfg.sample_rate)
         band_mask = (freqs >= cfg.noise_bandwidth[0]) & (freqs <= cfg.noise_bandwidth[1])
         spectrum *= band_mask.astype(float)
-        shaped_noise = np.fft.irfft(spectrum, n=sample_count)
-        shaped_noise = cfg.noise_amplitude * shaped_noise / (np.linalg.norm(shaped_noise) + 1e-12)
-
-        spikes = np.zeros_like(t)
-
-        spike_count = int(cfg.spike_density * sample_count)
-        if spike_count > 0:
-            spike_positions = rng.choice(sample_count, size=spike_count, replace=False)
-            spike_values = cfg.spike_amplitude * rng.uniform(-1.0, 1.0, size=spike_count)
-            spikes[spike_positions] = spike_values
+        shaped_noise = np.fft.irfft(spectrum, n=sample_count, axis=1)
+        # Row-wise norm matches the single-sample reduction bit for bit.
+        norms = np.array([np.linalg.norm(row) for row in shaped_noise], dtype=np.float64).reshape(batch, 1)
+        shaped_noise = cfg.noise_amplitude * shaped_noise / (norms + 1e-12)
 
         signal = hum + shaped_noise + spikes
 
-        max_val = np.max(np.abs(signal))
-        if max_val > 0:
-            signal = signal / max_val
-            hum = hum / max_val
-            shaped_noise = shaped_noise / max_val
-            spikes = spikes / max_val
+        max_val = np.max(np.abs(signal), axis=1, keepdims=True) if sample_count else np.zeros((batch, 1))
+        scale = np.where(max_val > 0, max_val, 1.0)
+        signal = signal / scale
+        hum = hum / scale
+        shaped_noise = shaped_noise / scale
+        spikes = spikes / scale
 
         return NoiseSample(
             signal=signal.astype(np.float32),
@@ -3,6 +3,7 @@ from .entropy import EntropySimulation, ChaosRun
 from .rng_run import RNGRun
 from .test_report import TestReport
 from .audit import AuditUpload
+from .analysis_batch import AnalysisBatch
 
 __all__ = [
     "Base",
@@ -12,4 +13,5 @@ __all__ = [
     "RNGRun",
     "TestReport",
     "AuditUpload",
+    "AnalysisBatch",
 ]
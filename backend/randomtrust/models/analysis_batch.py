@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import uuid
+from typing import Any
+
+from sqlalchemy import BigInteger, JSON
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from .base import Base, TimestampMixin
+
+
+class AnalysisBatch(TimestampMixin, Base):
+    __tablename__ = "analysis_batches"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    tests: Mapped[list[str]] = mapped_column(JSON, nullable=False)
+    run_ids: Mapped[list[str]] = mapped_column(JSON, nullable=False)
+    sequence_bits: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    checks: Mapped[list[dict[str, Any]]] = mapped_column(JSON, nullable=False)
+
+    test_reports = relationship("TestReport", back_populates="batch")
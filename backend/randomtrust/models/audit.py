@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import uuid
 
-from sqlalchemy import LargeBinary, String
+from sqlalchemy import String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -17,4 +17,3 @@ class AuditUpload(TimestampMixin, Base):
     description: Mapped[str | None] = mapped_column(String(1024), nullable=True)
     data_hash: Mapped[str] = mapped_column(String(128), nullable=False)
     result_path: Mapped[str | None] = mapped_column(String(512), nullable=True)
-    raw_payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import uuid
+from typing import Any
 
-from sqlalchemy import ForeignKey, Integer, JSON, LargeBinary, String
+from sqlalchemy import BigInteger, ForeignKey, JSON, LargeBinary, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -17,11 +18,17 @@ class RNGRun(TimestampMixin, Base):
         UUID(as_uuid=True), ForeignKey("entropy_simulations.id", ondelete="SET NULL"), nullable=True
     )
     run_format: Mapped[str] = mapped_column(String(16), nullable=False)
-    length: Mapped[int] = mapped_column(Integer, nullable=False)
+    length: Mapped[int] = mapped_column(BigInteger, nullable=False)
     entropy_metrics: Mapped[dict[str, float]] = mapped_column(JSON, nullable=False)
     seed_hash: Mapped[str] = mapped_column(String(128), nullable=False)
     export_path: Mapped[str | None] = mapped_column(String(512), nullable=True)
     run_checksum: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    output_params: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    storage_mode: Mapped[str] = mapped_column(String(16), nullable=False, default="object", server_default="object")
+    key_hex: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    nonce_hex: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    counter_start: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    counter_end: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
 
     entropy_simulation = relationship("EntropySimulation")
     test_reports = relationship("TestReport", back_populates="rng_run", cascade="all, delete-orphan")
@@ -20,5 +20,9 @@ class TestReport(TimestampMixin, Base):
     status: Mapped[str] = mapped_column(String(32), nullable=False)
     metrics: Mapped[dict[str, float]] = mapped_column(JSON, nullable=False)
     report_path: Mapped[str | None] = mapped_column(String(512), nullable=True)
+    batch_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("analysis_batches.id", ondelete="SET NULL"), nullable=True, index=True
+    )
 
     rng_run = relationship("RNGRun", back_populates="test_reports")
+    batch = relationship("AnalysisBatch", back_populates="test_reports")
@@ -2,10 +2,12 @@ from .entropy import EntropyRepository
 from .rng import RNGRepository
 from .audit import AuditRepository
 from .test_report import TestReportRepository
+from .analysis_batch import AnalysisBatchRepository
 
 __all__ = [
     "EntropyRepository",
     "RNGRepository",
     "AuditRepository",
     "TestReportRepository",
+    "AnalysisBatchRepository",
 ]
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import uuid
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from randomtrust.models import AnalysisBatch
+
+
+class AnalysisBatchRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def add_batch(
+        self,
+        *,
+        batch_id: uuid.UUID,
+        tests: list[str],
+        run_ids: list[str],
+        sequence_bits: int,
+        checks: list[dict[str, Any]],
+    ) -> AnalysisBatch:
+        record = AnalysisBatch(
+            id=batch_id,
+            tests=tests,
+            run_ids=run_ids,
+            sequence_bits=sequence_bits,
+            checks=checks,
+        )
+        self._session.add(record)
+        return record
+
+    async def get_batch(self, batch_id: uuid.UUID) -> AnalysisBatch | None:
+        stmt = select(AnalysisBatch).where(AnalysisBatch.id == batch_id)
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
@@ -20,7 +20,6 @@ class AuditRepository:
         description: str | None,
         data_hash: str,
         result_path: str | None,
-        raw_payload: bytes,
     ) -> AuditUpload:
         record = AuditUpload(
             id=audit_id,
@@ -28,7 +27,6 @@ class AuditRepository:
             description=description,
             data_hash=data_hash,
             result_path=result_path,
-            raw_payload=raw_payload,
         )
         self._session.add(record)
         return record
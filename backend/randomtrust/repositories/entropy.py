@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import uuid
+from typing import Iterable
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -76,3 +77,14 @@ class EntropyRepository:
         )
         result = await self._session.execute(stmt)
         return list(result.scalars())
+
+    async def get_simulations(self, simulation_ids: Iterable[uuid.UUID]) -> list[EntropySimulation]:
+        stmt = select(EntropySimulation).where(EntropySimulation.id.in_(list(simulation_ids)))
+        result = await self._session.execute(stmt)
+        return list(result.scalars())
+
+    async def sample_simulations(self, size: int) -> list[EntropySimulation]:
+        # ORDER BY random() scans the table, which is fine for the simulation volumes kept here.
+        stmt = select(EntropySimulation).order_by(func.random()).limit(size)
+        result = await self._session.execute(stmt)
+        return list(result.scalars())
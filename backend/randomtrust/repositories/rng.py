@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import uuid
+from datetime import datetime
+from typing import Any, Iterable
 
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
@@ -24,6 +26,12 @@ class RNGRepository:
         seed_hash: str,
         export_path: str | None,
         run_checksum: bytes | None,
+        output_params: dict[str, Any] | None = None,
+        storage_mode: str = "object",
+        key_hex: str | None = None,
+        nonce_hex: str | None = None,
+        counter_start: int | None = None,
+        counter_end: int | None = None,
     ) -> RNGRun:
         record = RNGRun(
             id=run_id,
@@ -34,6 +42,12 @@ class RNGRepository:
             seed_hash=seed_hash,
             export_path=export_path,
             run_checksum=run_checksum,
+            output_params=output_params,
+            storage_mode=storage_mode,
+            key_hex=key_hex,
+            nonce_hex=nonce_hex,
+            counter_start=counter_start,
+            counter_end=counter_end,
         )
         self._session.add(record)
         return record
@@ -52,3 +66,49 @@ class RNGRepository:
         )
         result = await self._session.execute(stmt)
         return list(result.scalars())
+
+    async def get_runs(self, run_ids: Iterable[uuid.UUID]) -> list[RNGRun]:
+        stmt = select(RNGRun).where(RNGRun.id.in_(list(run_ids)))
+        result = await self._session.execute(stmt)
+        return list(result.scalars())
+
+    async def list_runs_created_between(
+        self,
+        *,
+        created_from: datetime,
+        created_to: datetime,
+        limit: int,
+    ) -> list[RNGRun]:
+        stmt = (
+            select(RNGRun)
+            .where(RNGRun.created_at >= created_from, RNGRun.created_at < created_to)
+            .order_by(RNGRun.created_at)
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars())
+
+    async def list_runs_matching(
+        self,
+        *,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        metric: str | None = None,
+        metric_min: float | None = None,
+        metric_max: float | None = None,
+        limit: int,
+    ) -> list[RNGRun]:
+        stmt = select(RNGRun)
+        if created_from is not None:
+            stmt = stmt.where(RNGRun.created_at >= created_from)
+        if created_to is not None:
+            stmt = stmt.where(RNGRun.created_at < created_to)
+        if metric is not None:
+            value = RNGRun.entropy_metrics[metric].as_float()
+            if metric_min is not None:
+                stmt = stmt.where(value >= metric_min)
+            if metric_max is not None:
+                stmt = stmt.where(value <= metric_max)
+        stmt = stmt.order_by(RNGRun.created_at, RNGRun.id).limit(limit)
+        result = await self._session.execute(stmt)
+        return list(result.scalars())
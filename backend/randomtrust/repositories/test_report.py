@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import uuid
+from typing import Any, Iterable
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from randomtrust.models import TestReport
@@ -43,3 +44,13 @@ class TestReportRepository:
     async def delete_for_run(self, run_id: uuid.UUID) -> None:
         stmt = delete(TestReport).where(TestReport.run_id == run_id)
         await self._session.execute(stmt)
+
+    async def delete_for_runs(self, run_ids: Iterable[uuid.UUID]) -> None:
+        stmt = delete(TestReport).where(TestReport.run_id.in_(list(run_ids)))
+        await self._session.execute(stmt)
+
+    async def add_reports_bulk(self, rows: list[dict[str, Any]]) -> None:
+        """Insert many reports in executemany batches, bypassing per-object unit-of-work tracking."""
+        if not rows:
+            return
+        await self._session.execute(insert(TestReport), rows)
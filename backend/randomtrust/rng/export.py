@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, Literal
+
+import numpy as np
+
+
+def _encode_raw(data: np.ndarray) -> bytes:
+    return data.tobytes()
+
+
+def _encode_ascii(data: np.ndarray) -> bytes:
+    text = np.unpackbits(data)
+    text += ord("0")
+    return text.tobytes()
+
+
+# Right-aligned so every line has the same width and byte ranges map to whole words.
+_WORD_WIDTH = 10
+_DIGITS = np.frombuffer(b"0123456789", dtype=np.uint8)
+
+
+def _encode_words(data: np.ndarray) -> bytes:
+    words = data.view(">u4").astype(np.int64)
+    lines = np.full((words.size, _WORD_WIDTH + 1), ord(" "), dtype=np.uint8)
+    lines[:, -1] = ord("\n")
+    remaining = words.copy()
+    for column in range(_WORD_WIDTH - 1, -1, -1):
+        # Leading zeros stay blank; the last column always holds a digit.
+        digits = _DIGITS[remaining % 10]
+        lines[:, column] = np.where((remaining > 0) | (column == _WORD_WIDTH - 1), digits, ord(" "))
+        remaining //= 10
+    return lines.tobytes()
+
+
+def _dieharder_header(label: str, payload_bytes: int) -> bytes:
+    rule = "#" + "=" * 66
+    lines = [rule, f"# generator chacha20  {label}", rule, "type: d", f"count: {payload_bytes // 4}", "numbit: 32"]
+    return ("\n".join(lines) + "\n").encode("ascii")
+
+
+@dataclass(frozen=True, slots=True)
+class ExportFormat:
+    name: str
+    media_type: str
+    extension: str
+    # Whole units of `unit_bytes` payload bytes become `unit_size` output bytes; a trailing partial unit is dropped.
+    unit_bytes: int
+    unit_size: int
+    encode: Callable[[np.ndarray], bytes]
+    header: Callable[[str, int], bytes] | None = None
+
+    def render_header(self, label: str, payload_bytes: int) -> bytes:
+        return self.header(label, payload_bytes) if self.header is not None else b""
+
+    def size(self, header: bytes, payload_bytes: int) -> int:
+        return len(header) + payload_bytes // self.unit_bytes * self.unit_size
+
+    def source_range(self, header: bytes, start: int, stop: int) -> tuple[int, int]:
+        """Payload bytes [first, last) that encode output bytes [start, stop)."""
+        begin = max(start - len(header), 0)
+        end = max(stop - len(header), 0)
+        return begin // self.unit_size * self.unit_bytes, -(-end // self.unit_size) * self.unit_bytes
+
+
+ExportFormatName = Literal["ascii", "raw", "dieharder"]
+
+EXPORT_FORMATS: dict[str, ExportFormat] = {
+    # NIST STS reads ASCII '0'/'1' characters, MSB of every byte first.
+    "ascii": ExportFormat("ascii", "text/plain", "txt", 1, 8, _encode_ascii),
+    "raw": ExportFormat("raw", "application/octet-stream", "bin", 1, 1, _encode_raw),
+    # dieharder `-g 202` file input: a header, then one big-endian 32-bit word per line in decimal.
+    "dieharder": ExportFormat("dieharder", "text/plain", "dieharder.txt", 4, _WORD_WIDTH + 1, _encode_words, _dieharder_header),
+}
+
+
+class ExportRenderer:
+    """Incremental encoder of output bytes [start, stop) from the payload chunks covering that range."""
+
+    def __init__(self, export_format: ExportFormat, header: bytes, start: int, stop: int) -> None:
+        self._format = export_format
+        self._head = header[start:stop]
+        body_start = max(start - len(header), 0)
+        self._remaining = max(stop - len(header), 0) - body_start
+        # Output of the first encoded unit that precedes `start`.
+        self._skip = body_start % export_format.unit_size
+        self._carry = b""
+
+    @property
+    def head(self) -> bytes:
+        return self._head
+
+    @property
+    def done(self) -> bool:
+        return self._remaining <= 0
+
+    def feed(self, chunk: bytes) -> bytes:
+        data = self._carry + chunk if self._carry else chunk
+        whole = len(data) - len(data) % self._format.unit_bytes
+        self._carry = bytes(data[whole:])
+        if not whole or self._remaining <= 0:
+            return b""
+        encoded = self._format.encode(np.frombuffer(data, dtype=np.uint8, count=whole))
+        piece = encoded[self._skip : self._skip + self._remaining]
+        self._skip = 0
+        self._remaining -= len(piece)
+        return piece
+
+
+def render_export(
+    export_format: ExportFormat,
+    header: bytes,
+    chunks: Iterable[bytes],
+    start: int,
+    stop: int,
+) -> Iterator[bytes]:
+    """Output bytes [start, stop) from the payload chunks covering `export_format.source_range`."""
+    renderer = ExportRenderer(export_format, header, start, stop)
+    if renderer.head:
+        yield renderer.head
+    for chunk in chunks:
+        if renderer.done:
+            break
+        piece = renderer.feed(chunk)
+        if piece:
+            yield piece
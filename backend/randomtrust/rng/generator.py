@@ -1,46 +1,236 @@
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from hashlib import blake2s
-from typing import Literal
+from typing import Any, Literal
 from uuid import UUID
 
+import numpy as np
+import numpy.typing as npt
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms
 
 
+_BLOCK_SIZE = 64
+# cryptography/OpenSSL read the first 4 nonce bytes as the little-endian block counter and
+# carry its overflow into the next 4 bytes, i.e. nonce[:8] behaves as a 64-bit counter.
+_COUNTER_WORD_SPAN = 1 << 32
+_COUNTER_SPAN = 1 << 64
+# Zero plaintext consumed in fixed-size slices so keystream lands directly in the caller's buffer.
+_ZERO_CHUNK = bytes(1 << 16)
+_ZERO_VIEW = memoryview(_ZERO_CHUNK)
+
+_UINT32_SPAN = 1 << 32
+_UINT64_SPAN = 1 << 64
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+_INT64_LE = np.dtype("<i8")
+_FLOAT64_LE = np.dtype("<f8")
+_FLOAT53_SCALE = 1.0 / (1 << 53)
+
+
+def _check_int64_bounds(low: int, high: int) -> None:
+    if low >= high:
+        raise ValueError("low must be less than high")
+    if low < _INT64_MIN or high - 1 > _INT64_MAX:
+        raise ValueError("range bounds must fit into signed 64-bit integers")
+
+
 @dataclass(slots=True)
 class ChaCha20RNG:
     key: bytes
     nonce: bytes
     counter: int = 0
+    _encryptor: Any = field(default=None, init=False, repr=False, compare=False)
+    _encryptor_block: int = field(default=-1, init=False, repr=False, compare=False)
+    _blocks_until_wrap: int = field(default=0, init=False, repr=False, compare=False)
+
+    def seek(self, block: int) -> None:
+        if block < 0:
+            raise ValueError("block position must be non-negative")
+        self.counter = block
 
     def random_bytes(self, length: int) -> bytes:
         if length <= 0:
             return b""
-        # cryptography's ChaCha20 implementation always starts from counter 0, so we
-        # simulate an arbitrary starting counter by consuming blocks equal to the
-        # current counter and discarding the bytes.
-        algorithm = algorithms.ChaCha20(self.key, self.nonce)
-        cipher = Cipher(algorithm, mode=None)
-        encryptor = cipher.encryptor()
-
-        if self.counter:
-            # Consume previous blocks so that the next output aligns with the stored counter.
-            discard = encryptor.update(b"\x00" * (self.counter * 64))
-            # Ensure the discard occurs even if not used, satisfying counter advance.
-            _ = discard
-
-        data = encryptor.update(b"\x00" * length) + encryptor.finalize()
-        blocks = math.ceil(length / 64)
-        self.counter += blocks
-        return data
+        buffer = bytearray(length)
+        self.random_into(buffer)
+        return bytes(buffer)
+
+    def random_into(self, buffer: Any) -> int:
+        """Fill a writable buffer (bytearray, memoryview, numpy array) with keystream in place."""
+        view = memoryview(buffer).cast("B")
+        length = view.nbytes
+        if length == 0:
+            return 0
+        full = length - length % _BLOCK_SIZE
+        self._fill(view[:full])
+        if full < length:
+            # Every call starts on a block boundary, so the tail of the last block is dropped.
+            tail = bytearray(_BLOCK_SIZE)
+            self._fill(memoryview(tail))
+            view[full:] = tail[: length - full]
+        return length
+
+    def random_array(self, dtype: npt.DTypeLike, length: int) -> np.ndarray:
+        """Return `length` unsigned integers of `dtype` read little-endian from the keystream."""
+        resolved = np.dtype(dtype)
+        if resolved.kind != "u":
+            raise ValueError(f"unsupported dtype for random_array: {resolved}")
+        array = np.empty(max(length, 0), dtype=resolved.newbyteorder("<"))
+        self.random_into(array)
+        return array
+
+    def _fill(self, view: memoryview) -> None:
+        # `view` is block aligned; the encryptor is rebuilt only on seeks and counter-word wraps.
+        offset = 0
+        while offset < len(view):
+            encryptor = self._encryptor_for(self.counter)
+            size = min(len(view) - offset, self._blocks_until_wrap * _BLOCK_SIZE, len(_ZERO_CHUNK))
+            encryptor.update_into(_ZERO_VIEW[:size], view[offset : offset + size])
+            blocks = size // _BLOCK_SIZE
+            self._encryptor_block += blocks
+            self._blocks_until_wrap -= blocks
+            self.counter += blocks
+            offset += size
+
+    def _encryptor_for(self, block: int) -> Any:
+        # Sequential draws keep using the live encryptor; any other position is a direct seek.
+        if self._encryptor is not None and self._encryptor_block == block and self._blocks_until_wrap:
+            return self._encryptor
+        position = (int.from_bytes(self.nonce[:8], "little") + block) % _COUNTER_SPAN
+        nonce = position.to_bytes(8, "little") + self.nonce[8:]
+        algorithm = algorithms.ChaCha20(self.key, nonce)
+        self._encryptor = Cipher(algorithm, mode=None).encryptor()
+        self._encryptor_block = block
+        self._blocks_until_wrap = _COUNTER_WORD_SPAN - position % _COUNTER_WORD_SPAN
+        return self._encryptor
 
     def random_hex(self, length: int) -> str:
         return self.random_bytes(length).hex()
 
     def random_ints(self, length: int) -> list[int]:
-        return list(self.random_bytes(length))
+        return self.random_array(np.uint8, length).tolist()
+
+    def random_below(self, span: int, length: int) -> np.ndarray:
+        """Return `length` unbiased uint64 values in [0, span) via bulk rejection sampling."""
+        if not 0 < span <= _UINT64_SPAN:
+            raise ValueError("span must be within 1..2**64")
+        result = np.empty(max(length, 0), dtype=np.uint64)
+        if span & (span - 1) == 0:
+            # Powers of two need no rejection: masking keeps every candidate uniform.
+            result[:] = self.random_array(np.uint64, length) & np.uint64(span - 1)
+            return result
+
+        word, bits = (np.uint32, 32) if span < _UINT32_SPAN else (np.uint64, 64)
+        # Accept only candidates below the largest multiple of `span`, so the modulo is exact.
+        limit = (1 << bits) - (1 << bits) % span
+        acceptance = limit / (1 << bits)
+        filled = 0
+        while filled < result.size:
+            need = result.size - filled
+            candidates = self.random_array(word, int(need / acceptance * 1.02) + 16)
+            accepted = candidates[candidates < word(limit)][:need]
+            result[filled : filled + accepted.size] = accepted % word(span)
+            filled += accepted.size
+        return result
+
+    def random_range(self, low: int, high: int, length: int) -> np.ndarray:
+        """Return `length` uniform int64 values in [low, high)."""
+        _check_int64_bounds(low, high)
+        offsets = self.random_below(high - low, length)
+        # Two's complement wrap-around maps the unsigned offsets back onto [low, high).
+        return (offsets + np.uint64(low % _UINT64_SPAN)).view(_INT64_LE)
+
+    def random_floats(self, length: int) -> np.ndarray:
+        """Return `length` uniform float64 values in [0, 1) with 53 bits of precision."""
+        words = self.random_array(np.uint64, length)
+        return (words >> np.uint64(11)).astype(_FLOAT64_LE) * _FLOAT53_SCALE
+
+    def random_permutation(self, length: int, low: int = 0) -> np.ndarray:
+        """Return a uniformly shuffled int64 array of low..low+length-1."""
+        _check_int64_bounds(low, low + length)
+        while True:
+            # Sorting by random 64-bit keys is a uniform shuffle as long as no two keys tie.
+            keys = self.random_array(np.uint64, length)
+            order = np.argsort(keys, kind="stable")
+            sorted_keys = keys[order]
+            if not np.any(sorted_keys[1:] == sorted_keys[:-1]):
+                return (order + low).astype(_INT64_LE)
+
+    def random_sample(self, low: int, high: int, length: int) -> np.ndarray:
+        """Return `length` distinct int64 values from [low, high) in draw order."""
+        _check_int64_bounds(low, high)
+        population = high - low
+        if length > population:
+            raise ValueError("sample length exceeds population size")
+        if length * 2 >= population:
+            # Dense samples are cheaper as a prefix of a full shuffle.
+            return self.random_permutation(population, low=low)[:length].copy()
+
+        # Oversample by the expected collision rate so one round usually yields enough distinct values.
+        draw = int(-population * math.log1p(-length / population) * 1.02) + 16
+        chosen = np.empty(0, dtype=np.uint64)
+        while chosen.size < length:
+            candidates = np.concatenate([chosen, self.random_below(population, draw)])
+            # Keep first occurrences only, preserving the order in which values were drawn.
+            _, first_seen = np.unique(candidates, return_index=True)
+            chosen = candidates[np.sort(first_seen)[:length]]
+            draw = 2 * (length - chosen.size) + 16
+        return (chosen + np.uint64(low % _UINT64_SPAN)).view(_INT64_LE)
+
+
+class ParallelKeystream:
+    """Fills large buffers by partitioning the ChaCha20 block range across a thread pool.
+
+    Blocks are independent, so each worker seeks its own generator to the first block of its
+    slice; cryptography releases the GIL inside `update_into`, letting slices run on separate
+    cores while writing straight into the shared output buffer.
+    """
+
+    def __init__(self, *, max_workers: int, min_slice_bytes: int = 1 << 18) -> None:
+        self._max_workers = max(max_workers, 1)
+        # Slices stay block aligned so every worker starts exactly at a block boundary.
+        self._min_slice_bytes = max(min_slice_bytes // _BLOCK_SIZE, 1) * _BLOCK_SIZE
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="randomtrust-keystream")
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def fill(self, rng: ChaCha20RNG, buffer: Any) -> int:
+        view = memoryview(buffer).cast("B")
+        length = view.nbytes
+        workers = min(self._max_workers, length // self._min_slice_bytes)
+        if workers <= 1:
+            return rng.random_into(view)
+
+        start_block = rng.counter
+        slice_bytes = (length // workers) // _BLOCK_SIZE * _BLOCK_SIZE
+        bounds = [index * slice_bytes for index in range(workers)] + [length]
+        futures = [
+            self._executor.submit(
+                self._fill_slice,
+                rng.key,
+                rng.nonce,
+                start_block + bounds[index] // _BLOCK_SIZE,
+                view[bounds[index] : bounds[index + 1]],
+            )
+            for index in range(workers)
+        ]
+        for future in futures:
+            future.result()
+        # Leave the caller's generator exactly where a serial random_into would have.
+        rng.counter = start_block + math.ceil(length / _BLOCK_SIZE)
+        return length
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    @staticmethod
+    def _fill_slice(key: bytes, nonce: bytes, block: int, view: memoryview) -> None:
+        ChaCha20RNG(key=key, nonce=nonce, counter=block).random_into(view)
 
 
 class ChaCha20RNGFactory:
@@ -79,4 +269,25 @@ class ChaCha20RNGFactory:
         await self._redis.hincrby(key, "counter", blocks)
 
 
-RNGOutputFormat = Literal["hex", "ints"]
+def draw_output(
+    rng: ChaCha20RNG,
+    fmt: str,
+    length: int,
+    low: int | None = None,
+    high: int | None = None,
+) -> np.ndarray:
+    """Draw a run's values; every mode reads the keystream from the RNG's current block."""
+    if fmt == "range":
+        return rng.random_range(low, high, length)
+    if fmt == "floats":
+        return rng.random_floats(length)
+    if fmt == "permutation":
+        return rng.random_permutation(length, low=low or 0)
+    if fmt == "sample":
+        return rng.random_sample(low, high, length)
+    return rng.random_array(np.uint8, length)
+
+
+RNGOutputFormat = Literal["hex", "ints", "range", "floats", "permutation", "sample"]
+# `object` keeps the output in MinIO, `virtual` keeps only key material and replays it on demand.
+RNGStorageMode = Literal["object", "virtual"]
@@ -1,6 +1,6 @@
 from .entropy import EntropyMixRequest, EntropyMixResponse, NoiseParameters
-from .rng import RNGGenerateRequest, RNGGenerateResponse
-from .audit import AuditSequenceRequest, AuditSequenceResponse
+from .rng import RNGGenerateRequest, RNGGenerateResponse, RNGStreamRequest
+from .audit import AuditSequenceResponse
 
 __all__ = [
     "EntropyMixRequest",
@@ -8,6 +8,6 @@ __all__ = [
     "NoiseParameters",
     "RNGGenerateRequest",
     "RNGGenerateResponse",
-    "AuditSequenceRequest",
+    "RNGStreamRequest",
     "AuditSequenceResponse",
 ]
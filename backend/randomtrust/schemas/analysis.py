@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from datetime import datetime
+from typing import Any, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 from randomtrust.analysis import AVAILABLE_TESTS
 
@@ -21,6 +23,35 @@ class AnalysisRequest(BaseModel):
         return value
 
 
+class BatchAnalysisRequest(AnalysisRequest):
+    run_ids: list[UUID] | None = Field(default=None, description="Runs to analyze together")
+    created_from: datetime | None = Field(default=None, description="Start of the creation time window (inclusive)")
+    created_to: datetime | None = Field(default=None, description="End of the creation time window (exclusive)")
+
+    @model_validator(mode="after")
+    def validate_selection(self) -> BatchAnalysisRequest:
+        window = self.created_from is not None or self.created_to is not None
+        if bool(self.run_ids) == window:
+            raise ValueError("provide either run_ids or created_from/created_to")
+        if window:
+            if self.created_from is None or self.created_to is None:
+                raise ValueError("created_from and created_to must be provided together")
+            if self.created_from >= self.created_to:
+                raise ValueError("created_from must be earlier than created_to")
+        return self
+
+
+class MinEntropyRequest(BaseModel):
+    simulation_ids: list[UUID] | None = Field(default=None, description="Simulations whose noise is assessed")
+    sample_size: int | None = Field(default=None, ge=1, description="Number of randomly sampled stored simulations")
+
+    @model_validator(mode="after")
+    def validate_selection(self) -> MinEntropyRequest:
+        if bool(self.simulation_ids) == (self.sample_size is not None):
+            raise ValueError("provide either simulation_ids or sample_size")
+        return self
+
+
 class TestOutcomeView(BaseModel):
     name: str
     passed: bool
@@ -29,13 +60,84 @@ class TestOutcomeView(BaseModel):
     details: dict[str, float]
 
 
-class RunAnalysisResponse(BaseModel):
-    run_id: UUID
-    export_path: str
-    outcomes: list[TestOutcomeView]
+class TestTimingView(BaseModel):
+    name: str
+    segments: int = Field(description="Number of sequence segments the test was split into")
+    wall_ms: float = Field(description="Wall-clock time from the first segment start to the last segment end")
+    compute_ms: float = Field(description="Summed run time of all segments across workers")
+
+
+class AnalysisJobView(BaseModel):
+    job_id: UUID
+    kind: Literal["run", "batch"] = "run"
+    run_id: UUID | None = Field(default=None, description="Analyzed run of a single-run job")
+    selection: dict[str, Any] | None = Field(default=None, description="Run ids or time window of a batch job")
+    tests: list[str] | None
+    status: Literal["queued", "running", "completed", "failed"]
+    progress: float = Field(description="Fraction of the battery finished, from 0 to 1")
+    attempts: int = Field(description="Number of times a worker has picked the job up")
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    error: str | None = None
+    outcomes: list[TestOutcomeView] | None = Field(default=None, description="Set once the job has completed")
+    timings: list[TestTimingView] | None = None
+    cached_tests: list[str] | None = Field(default=None, description="Tests served from the result cache")
+    batch_id: UUID | None = Field(default=None, description="Aggregate report of a completed batch job")
+
+
+class BatchCheckView(BaseModel):
+    test: str
+    series: str = Field(description="P-value series of the test, e.g. `p_value_forward`, or `verdict`")
+    sequences: int
+    passed: int
+    proportion: float
+    proportion_min: float
+    proportion_max: float
+    proportion_passed: bool
+    uniformity_p_value: float | None = Field(
+        default=None, description="Chi-square P-value of the P-value histogram; requires at least 55 sequences"
+    )
+    uniformity_passed: bool | None = None
+
+
+class AnalysisBatchView(BaseModel):
+    batch_id: UUID
+    created_at: datetime
+    tests: list[str]
+    run_ids: list[UUID]
+    sequence_bits: int
+    passed: bool = Field(description="Every proportion and uniformity check passed")
+    checks: list[BatchCheckView]
+
+
+class MinEntropyEstimateView(BaseModel):
+    name: str
+    min_entropy: float | None = Field(description="Estimated min-entropy; `null` when the estimator does not apply")
+    p_max: float | None = Field(description="Upper bound on the probability of the most likely value")
+
+
+class SimulationMinEntropyView(BaseModel):
+    simulation_id: UUID
+    samples: int = Field(description="Number of quantized noise samples")
+    bits_per_sample: int
+    h_original: float = Field(description="Min-entropy per sample from the estimators over the samples")
+    h_bitstring: float = Field(description="Min-entropy per bit from the estimators over the bitstring")
+    min_entropy: float = Field(description="Assessed min-entropy per sample, min(h_original, bits_per_sample * h_bitstring)")
+    original: list[MinEntropyEstimateView]
+    bitstring: list[MinEntropyEstimateView]
+    cached: bool = Field(description="The report was served from the result cache")
+
+
+class MinEntropyResponse(BaseModel):
+    simulations: list[SimulationMinEntropyView]
+    min_entropy_min: float = Field(description="Lowest assessed min-entropy per sample across the simulations")
+    min_entropy_mean: float = Field(description="Mean assessed min-entropy per sample across the simulations")
 
 
 class AuditAnalysisResponse(BaseModel):
     audit_id: UUID
     data_hash: str
     outcomes: list[TestOutcomeView]
+    timings: list[TestTimingView] = Field(default_factory=list)
+    cached_tests: list[str] = Field(default_factory=list, description="Tests served from the result cache")
@@ -22,9 +22,28 @@ class EntropyMetrics(BaseModel):
     snr_db: float = Field(...)
     spectral_deviation_percent: float = Field(...)
     lyapunov_exponent: float = Field(...)
+    health_max_repetition: int = Field(
+        default=0, description="Longest run of identical noise samples (SP 800-90B repetition count test)"
+    )
+    health_max_proportion: int = Field(
+        default=0, description="Highest repeat count of a value in a 512-sample window (adaptive proportion test)"
+    )
+    health_retries: int = Field(default=0, description="Noise samples rejected by the health tests before this one")
 
 
 class EntropyMixResponse(BaseModel):
     simulation_id: UUID
     seed_hex: str
     metrics: EntropyMetrics
+
+
+class ExecutorStatsResponse(BaseModel):
+    kind: str
+    max_workers: int
+    pending: int = Field(..., description="Submitted tasks that have not finished yet")
+    queued: int = Field(..., description="Pending tasks waiting for a free worker")
+    completed: int
+    failed: int
+    avg_wait_ms: float
+    max_wait_ms: float
+    avg_run_ms: float
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+from randomtrust.rng.generator import RNGStorageMode
 
 from .entropy import NoiseParameters
 
@@ -11,10 +15,63 @@ class RNGGenerateRequest(BaseModel):
     length: int = Field(..., ge=1, le=1_000_000)
     noise_seed: int | None = Field(default=None, ge=0)
     parameters: NoiseParameters | None = None
+    low: int | None = Field(
+        default=None,
+        ge=-(2**63),
+        le=2**63 - 1,
+        description="Inclusive lower bound for `range`/`sample` (required) and `permutation` (default 0)",
+    )
+    high: int | None = Field(
+        default=None,
+        ge=-(2**63) + 1,
+        le=2**63,
+        description="Exclusive upper bound for `range` and `sample`",
+    )
+    storage: RNGStorageMode = Field(
+        default="object",
+        description="`object` stores the output in MinIO, `virtual` keeps key material and replays it on demand",
+    )
+
+
+class RNGStreamRequest(BaseModel):
+    length: int = Field(..., ge=1, description="Number of raw keystream bytes to stream")
+    noise_seed: int | None = Field(default=None, ge=0)
+    parameters: NoiseParameters | None = None
+    storage: RNGStorageMode = Field(default="object", description="`virtual` skips the MinIO upload")
 
 
 class RNGGenerateResponse(BaseModel):
     run_id: UUID
     format: str
-    data: str | list[int]
+    data: str | list[int] | list[float]
     entropy_metrics: dict[str, float]
+
+
+EntropyMetricName = Literal[
+    "snr_db",
+    "spectral_deviation_percent",
+    "lyapunov_exponent",
+    "health_max_repetition",
+    "health_max_proportion",
+    "health_retries",
+]
+
+
+class CorpusSelection(BaseModel):
+    run_ids: list[UUID] | None = Field(default=None, description="Runs to concatenate, in this order")
+    created_from: datetime | None = Field(default=None, description="Start of the creation time window (inclusive)")
+    created_to: datetime | None = Field(default=None, description="End of the creation time window (exclusive)")
+    metric: EntropyMetricName | None = Field(default=None, description="Entropy metric the runs are filtered by")
+    metric_min: float | None = Field(default=None, description="Inclusive lower bound of `metric`")
+    metric_max: float | None = Field(default=None, description="Inclusive upper bound of `metric`")
+
+    @model_validator(mode="after")
+    def validate_selection(self) -> CorpusSelection:
+        filtered = self.created_from is not None or self.created_to is not None or self.metric is not None
+        if bool(self.run_ids) == filtered:
+            raise ValueError("provide either run_ids or filters")
+        if self.created_from is not None and self.created_to is not None and self.created_from >= self.created_to:
+            raise ValueError("created_from must be earlier than created_to")
+        if (self.metric_min is not None or self.metric_max is not None) and self.metric is None:
+            raise ValueError("metric_min and metric_max require metric")
+        return self
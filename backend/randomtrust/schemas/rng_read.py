@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from uuid import UUID
-
 from datetime import datetime
+from typing import Any
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
@@ -25,6 +25,8 @@ class RNGRunSummary(BaseModel):
     entropy_metrics: dict[str, float]
     seed_hash: str
     export_path: str | None
+    output_params: dict[str, Any] | None = None
+    storage_mode: str = "object"
     created_at: datetime
     updated_at: datetime
 
@@ -32,3 +34,17 @@ class RNGRunSummary(BaseModel):
 class RNGRunDetail(RNGRunSummary):
     run_checksum: str | None = Field(default=None, description="Hex-encoded checksum")
     test_reports: list[TestReportView]
+
+
+class CorpusEntryView(BaseModel):
+    run_id: UUID
+    offset: int = Field(description="Byte offset of the run's payload in the concatenated corpus")
+    length: int = Field(description="Payload size in bytes")
+    created_at: datetime
+    run_checksum: str | None = Field(default=None, description="Hex-encoded checksum")
+
+
+class CorpusManifest(BaseModel):
+    total_bytes: int
+    total_bits: int
+    runs: list[CorpusEntryView]
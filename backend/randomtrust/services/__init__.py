@@ -1,29 +1,57 @@
 from .unit_of_work import UnitOfWork
 from .entropy_service import EntropyService, StoredEntropy
+from .seed_reservoir import SeedReservoir, SeedReservoirWorker
 from .rng_service import (
     RNGService,
     GeneratedSequence,
+    SequenceStream,
     RunBitsExport,
     RunExportError,
+    ExportRangeError,
+    CorpusSelectionError,
+    CorpusEntry,
+    CorpusExport,
     RunNotFoundError,
     RunDataUnavailableError,
     InsufficientBitsError,
 )
-from .audit_service import AuditService, AuditRecord
-from .analysis_service import AnalysisService
+from .audit_service import AuditService, AuditRecord, AuditUploadError
+from .analysis_service import AnalysisService, BatchAnalysisResult, SimulationEntropyResult
+from .analysis_cache import AnalysisResultCache, create_analysis_result_cache
+from .payload_cache import PayloadChecksumError, RunPayloadCache, create_run_payload_cache
+from .analysis_jobs import AnalysisJob, AnalysisJobQueue, AnalysisJobWorker, create_analysis_job_queue
 
 __all__ = [
     "UnitOfWork",
     "EntropyService",
     "StoredEntropy",
+    "SeedReservoir",
+    "SeedReservoirWorker",
     "RNGService",
     "GeneratedSequence",
+    "SequenceStream",
     "RunBitsExport",
     "RunExportError",
+    "ExportRangeError",
+    "CorpusSelectionError",
+    "CorpusEntry",
+    "CorpusExport",
     "RunNotFoundError",
     "RunDataUnavailableError",
     "InsufficientBitsError",
     "AuditService",
     "AuditRecord",
+    "AuditUploadError",
     "AnalysisService",
+    "BatchAnalysisResult",
+    "SimulationEntropyResult",
+    "AnalysisResultCache",
+    "create_analysis_result_cache",
+    "RunPayloadCache",
+    "PayloadChecksumError",
+    "create_run_payload_cache",
+    "AnalysisJob",
+    "AnalysisJobQueue",
+    "AnalysisJobWorker",
+    "create_analysis_job_queue",
 ]
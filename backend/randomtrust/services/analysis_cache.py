@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from typing import Iterable, Sequence
+from uuid import UUID
+
+from randomtrust.analysis import (
+    ANALYSIS_VERSION,
+    MIN_ENTROPY_VERSION,
+    MinEntropyEstimate,
+    MinEntropyReport,
+    TestOutcome,
+    test_parameters,
+)
+from randomtrust.core import Settings
+
+# Stored for default-battery tests the payload is too short for, so repeat batteries skip them too.
+_SKIPPED = b"skipped"
+
+
+class AnalysisResultCache:
+    """Per-test outcomes in Redis, keyed by payload digest, test parameters and analysis version.
+
+    Every hit renews the key's TTL, so entries that keep being read stay while idle ones expire;
+    with a `volatile-lru` maxmemory policy Redis also evicts the least recently read first.
+    """
+
+    def __init__(self, *, redis_client, key_prefix: str, ttl_seconds: int) -> None:
+        self._redis = redis_client
+        self._key_prefix = key_prefix
+        self._ttl_seconds = ttl_seconds
+
+    async def lookup(self, digest: str, tests: Iterable[str]) -> dict[str, TestOutcome | None]:
+        """Cached results by test name; `None` marks a test the payload was too short for."""
+        names = list(dict.fromkeys(tests))
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for name in names:
+                pipe.getex(self._key(digest, name), ex=self._ttl_seconds)
+            values = await pipe.execute()
+        hits: dict[str, TestOutcome | None] = {}
+        for name, value in zip(names, values):
+            if value is None:
+                continue
+            hits[name] = None if value == _SKIPPED else self._decode(value)
+        return hits
+
+    async def store(
+        self,
+        digest: str,
+        outcomes: Sequence[TestOutcome],
+        skipped: Iterable[str] = (),
+    ) -> None:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for outcome in outcomes:
+                pipe.set(self._key(digest, outcome.name), self._encode(outcome), ex=self._ttl_seconds)
+            for name in skipped:
+                pipe.set(self._key(digest, name), _SKIPPED, ex=self._ttl_seconds)
+            await pipe.execute()
+
+    async def lookup_min_entropy(self, simulation_ids: Iterable[UUID]) -> dict[UUID, MinEntropyReport]:
+        """Cached SP 800-90B reports of noise artifacts, which never change once a simulation is stored."""
+        ids = list(dict.fromkeys(simulation_ids))
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for simulation_id in ids:
+                pipe.getex(self._min_entropy_key(simulation_id), ex=self._ttl_seconds)
+            values = await pipe.execute()
+        return {
+            simulation_id: self._decode_min_entropy(value)
+            for simulation_id, value in zip(ids, values)
+            if value is not None
+        }
+
+    async def store_min_entropy(self, reports: dict[UUID, MinEntropyReport]) -> None:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for simulation_id, report in reports.items():
+                pipe.set(
+                    self._min_entropy_key(simulation_id),
+                    json.dumps(asdict(report)).encode("utf-8"),
+                    ex=self._ttl_seconds,
+                )
+            await pipe.execute()
+
+    def _min_entropy_key(self, simulation_id: UUID) -> str:
+        return f"{self._key_prefix}:min_entropy:v{MIN_ENTROPY_VERSION}:{simulation_id}"
+
+    def _key(self, digest: str, name: str) -> str:
+        params = ",".join(f"{key}={value}" for key, value in sorted(test_parameters(name).items())) or "-"
+        return f"{self._key_prefix}:v{ANALYSIS_VERSION}:{digest}:{name}:{params}"
+
+    @staticmethod
+    def _encode(outcome: TestOutcome) -> bytes:
+        payload = {
+            "name": outcome.name,
+            "passed": bool(outcome.passed),
+            "metric": float(outcome.metric),
+            "threshold": float(outcome.threshold),
+            "details": {k: float(v) for k, v in outcome.details.items()},
+        }
+        return json.dumps(payload).encode("utf-8")
+
+    @staticmethod
+    def _decode(raw: bytes) -> TestOutcome:
+        payload = json.loads(raw)
+        return TestOutcome(
+            name=payload["name"],
+            passed=payload["passed"],
+            metric=payload["metric"],
+            threshold=payload["threshold"],
+            details=payload["details"],
+        )
+
+    @staticmethod
+    def _decode_min_entropy(raw: bytes) -> MinEntropyReport:
+        payload = json.loads(raw)
+        payload["original"] = [MinEntropyEstimate(**estimate) for estimate in payload["original"]]
+        payload["bitstring"] = [MinEntropyEstimate(**estimate) for estimate in payload["bitstring"]]
+        return MinEntropyReport(**payload)
+
+
+def create_analysis_result_cache(settings: Settings, *, redis_client) -> AnalysisResultCache | None:
+    if not settings.analysis_cache_enabled:
+        return None
+    return AnalysisResultCache(
+        redis_client=redis_client,
+        key_prefix=f"analysis_cache:{settings.environment}",
+        ttl_seconds=settings.analysis_cache_ttl_seconds,
+    )
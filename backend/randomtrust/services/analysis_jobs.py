@@ -0,0 +1,447 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import uuid
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Iterable, Literal, Sequence
+
+from redis.exceptions import ResponseError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from randomtrust.analysis import TestOutcome, TestTiming
+from randomtrust.core import Settings
+from randomtrust.core.logging import get_logger
+
+from .analysis_service import AnalysisError, AnalysisService, BatchAnalysisResult, RunAnalysisResult
+from .unit_of_work import UnitOfWork
+
+logger = get_logger(__name__)
+
+AnalysisJobStatus = Literal["queued", "running", "completed", "failed"]
+AnalysisJobKind = Literal["run", "batch"]
+
+
+@dataclass(slots=True)
+class AnalysisJob:
+    job_id: uuid.UUID
+    kind: AnalysisJobKind
+    # Set for single-run jobs; batch jobs carry their run ids or time window in `selection`.
+    run_id: uuid.UUID | None
+    selection: dict[str, Any] | None
+    tests: list[str] | None
+    status: AnalysisJobStatus
+    progress: float
+    attempts: int
+    created_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
+    error: str | None
+    # Serialized outcomes and timings once the job has completed.
+    outcomes: list[dict[str, Any]] | None
+    timings: list[dict[str, Any]] | None
+    cached_tests: list[str] | None
+    # Aggregate report of a completed batch job, readable through the batch endpoint.
+    batch_id: uuid.UUID | None
+
+
+def _serialize_timings(timings: Sequence[TestTiming]) -> str:
+    return json.dumps(
+        [
+            {
+                "name": timing.name,
+                "segments": timing.segments,
+                "wall_ms": timing.wall_ms,
+                "compute_ms": timing.compute_ms,
+            }
+            for timing in timings
+        ]
+    )
+
+
+def _text(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class AnalysisJobQueue:
+    """Analysis jobs on a Redis stream; each job's state lives in a hash that expires with it."""
+
+    def __init__(
+        self,
+        *,
+        redis_client,
+        stream: str,
+        events_stream: str,
+        key_prefix: str,
+        ttl_seconds: int,
+        events_maxlen: int,
+    ) -> None:
+        self._redis = redis_client
+        self._stream = stream
+        self._events_stream = events_stream
+        self._key_prefix = key_prefix
+        self._ttl_seconds = ttl_seconds
+        self._events_maxlen = events_maxlen
+
+    async def enqueue(self, *, run_id: uuid.UUID, tests: Iterable[str] | None) -> AnalysisJob:
+        return await self._enqueue(kind="run", tests=tests, run_id=str(run_id))
+
+    async def enqueue_batch(
+        self,
+        *,
+        run_ids: Sequence[uuid.UUID] | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        tests: Iterable[str] | None,
+    ) -> AnalysisJob:
+        if run_ids:
+            selection: dict[str, Any] = {"run_ids": [str(run_id) for run_id in run_ids]}
+        else:
+            selection = {"created_from": created_from.isoformat(), "created_to": created_to.isoformat()}
+        return await self._enqueue(kind="batch", tests=tests, selection=json.dumps(selection))
+
+    async def _enqueue(self, *, kind: AnalysisJobKind, tests: Iterable[str] | None, **extra: str) -> AnalysisJob:
+        job_id = uuid.uuid4()
+        fields = {
+            "job_id": str(job_id),
+            "kind": kind,
+            **extra,
+            "tests": json.dumps(list(tests) if tests else None),
+            "status": "queued",
+            "progress": "0",
+            "attempts": "0",
+            "created_at": repr(time.time()),
+        }
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(self._key(job_id), mapping=fields)
+            pipe.expire(self._key(job_id), self._ttl_seconds)
+            pipe.xadd(self._stream, {"job_id": str(job_id)})
+            self._add_event(pipe, job_id, "queued")
+            await pipe.execute()
+        return self._decode(fields)
+
+    async def get(self, job_id: uuid.UUID) -> AnalysisJob | None:
+        raw = await self._redis.hgetall(self._key(job_id))
+        return self._decode(raw) if raw else None
+
+    async def ensure_group(self, group: str) -> None:
+        try:
+            # Starting from 0 picks up jobs enqueued before the first worker created the group.
+            await self._redis.xgroup_create(self._stream, group, id="0", mkstream=True)
+        except ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+
+    async def claim_next(
+        self,
+        *,
+        group: str,
+        consumer: str,
+        min_idle_ms: int,
+        block_ms: int,
+    ) -> tuple[bytes, uuid.UUID] | None:
+        # Entries left pending by a consumer that died are taken over before new work is read.
+        _, claimed, *_ = await self._redis.xautoclaim(
+            self._stream, group, consumer, min_idle_time=min_idle_ms, start_id="0-0", count=1
+        )
+        entries = claimed
+        if not entries:
+            response = await self._redis.xreadgroup(group, consumer, {self._stream: ">"}, count=1, block=block_ms)
+            entries = response[0][1] if response else []
+        if not entries:
+            return None
+        entry_id, fields = entries[0]
+        return entry_id, uuid.UUID(fields[b"job_id"].decode())
+
+    async def touch(self, *, group: str, consumer: str, entry_id: bytes) -> None:
+        # Re-claiming our own entry resets its idle time, so live jobs are never taken over.
+        await self._redis.xclaim(self._stream, group, consumer, min_idle_time=0, message_ids=[entry_id], justid=True)
+
+    async def ack(self, *, group: str, entry_id: bytes) -> None:
+        # Finished entries are removed so the stream only holds outstanding work.
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.xack(self._stream, group, entry_id)
+            pipe.xdel(self._stream, entry_id)
+            await pipe.execute()
+
+    async def start(self, job_id: uuid.UUID, *, consumer: str) -> AnalysisJob | None:
+        key = self._key(job_id)
+        if not await self._redis.exists(key):
+            return None
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hincrby(key, "attempts", 1)
+            pipe.hset(key, mapping={"status": "running", "consumer": consumer, "started_at": repr(time.time())})
+            pipe.expire(key, self._ttl_seconds)
+            self._add_event(pipe, job_id, "running")
+            pipe.hgetall(key)
+            *_, raw = await pipe.execute()
+        return self._decode(raw)
+
+    async def report_progress(self, job_id: uuid.UUID, progress: float) -> None:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(self._key(job_id), "progress", repr(progress))
+            self._add_event(pipe, job_id, "running", progress=repr(progress))
+            await pipe.execute()
+
+    async def complete(
+        self,
+        job_id: uuid.UUID,
+        *,
+        outcomes: Sequence[TestOutcome],
+        timings: Sequence[TestTiming],
+        cached_tests: Sequence[str] = (),
+    ) -> None:
+        serialized_outcomes = [
+            {
+                "name": outcome.name,
+                "passed": bool(outcome.passed),
+                "statistic": float(outcome.metric),
+                "threshold": float(outcome.threshold),
+                "details": {k: float(v) for k, v in outcome.details.items()},
+            }
+            for outcome in outcomes
+        ]
+        await self._finish(
+            job_id,
+            "completed",
+            progress="1",
+            outcomes=json.dumps(serialized_outcomes),
+            timings=_serialize_timings(timings),
+            cached_tests=json.dumps(list(cached_tests)),
+        )
+
+    async def complete_batch(
+        self,
+        job_id: uuid.UUID,
+        *,
+        batch_id: uuid.UUID,
+        timings: Sequence[TestTiming],
+    ) -> None:
+        await self._finish(
+            job_id,
+            "completed",
+            progress="1",
+            batch_id=str(batch_id),
+            timings=_serialize_timings(timings),
+        )
+
+    async def fail(self, job_id: uuid.UUID, error: str) -> None:
+        await self._finish(job_id, "failed", error=error)
+
+    async def _finish(self, job_id: uuid.UUID, status: AnalysisJobStatus, **fields: str) -> None:
+        key = self._key(job_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={"status": status, "finished_at": repr(time.time()), **fields})
+            pipe.expire(key, self._ttl_seconds)
+            self._add_event(pipe, job_id, status)
+            await pipe.execute()
+
+    def _add_event(self, pipe, job_id: uuid.UUID, status: str, **fields: str) -> None:
+        # The results stream is a capped feed for subscribers; the job hash stays authoritative.
+        pipe.xadd(
+            self._events_stream,
+            {"job_id": str(job_id), "status": status, **fields},
+            maxlen=self._events_maxlen,
+            approximate=True,
+        )
+
+    def _key(self, job_id: uuid.UUID) -> str:
+        return f"{self._key_prefix}:{job_id}"
+
+    @staticmethod
+    def _decode(raw: dict[bytes, bytes] | dict[str, str]) -> AnalysisJob:
+        fields = {_text(key): _text(value) for key, value in raw.items()}
+
+        def timestamp(name: str) -> datetime | None:
+            value = fields.get(name)
+            return datetime.fromtimestamp(float(value), tz=timezone.utc) if value else None
+
+        def loaded(name: str) -> Any:
+            value = fields.get(name)
+            return json.loads(value) if value else None
+
+        def identifier(name: str) -> uuid.UUID | None:
+            value = fields.get(name)
+            return uuid.UUID(value) if value else None
+
+        return AnalysisJob(
+            job_id=uuid.UUID(fields["job_id"]),
+            # Jobs enqueued before batches existed have no kind and are single-run jobs.
+            kind=fields.get("kind", "run"),  # type: ignore[arg-type]
+            run_id=identifier("run_id"),
+            selection=loaded("selection"),
+            tests=loaded("tests"),
+            status=fields["status"],  # type: ignore[arg-type]
+            progress=float(fields.get("progress", 0.0)),
+            attempts=int(fields.get("attempts", 0)),
+            created_at=timestamp("created_at"),  # type: ignore[arg-type]
+            started_at=timestamp("started_at"),
+            finished_at=timestamp("finished_at"),
+            error=fields.get("error"),
+            outcomes=loaded("outcomes"),
+            timings=loaded("timings"),
+            cached_tests=loaded("cached_tests"),
+            batch_id=identifier("batch_id"),
+        )
+
+
+def create_analysis_job_queue(settings: Settings, *, redis_client) -> AnalysisJobQueue:
+    return AnalysisJobQueue(
+        redis_client=redis_client,
+        stream=settings.redis_stream_entropy,
+        events_stream=settings.redis_stream_results,
+        key_prefix=f"analysis_jobs:{settings.environment}",
+        ttl_seconds=settings.analysis_job_ttl_seconds,
+        events_maxlen=settings.analysis_job_events_maxlen,
+    )
+
+
+@dataclass(slots=True)
+class _ProgressCell:
+    value: float = 0.0
+
+    def update(self, value: float) -> None:
+        # Called from analysis threads; the heartbeat only ever reads the latest value.
+        self.value = value
+
+
+class AnalysisJobWorker:
+    """Consumes analysis jobs as one member of the stream's consumer group."""
+
+    def __init__(
+        self,
+        *,
+        queue: AnalysisJobQueue,
+        analysis_service: AnalysisService,
+        session_factory: async_sessionmaker[AsyncSession],
+        group: str,
+        consumer: str,
+        block_seconds: float,
+        claim_idle_seconds: float,
+        max_attempts: int,
+        progress_interval: float,
+    ) -> None:
+        self._queue = queue
+        self._analysis_service = analysis_service
+        self._session_factory = session_factory
+        self._group = group
+        self._consumer = consumer
+        self._block_ms = int(block_seconds * 1_000)
+        self._claim_idle_ms = int(claim_idle_seconds * 1_000)
+        self._max_attempts = max_attempts
+        self._progress_interval = progress_interval
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=f"analysis-job-worker:{self._consumer}")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        # A job interrupted here stays pending and is claimed by another consumer once idle.
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def process_next(self) -> bool:
+        claimed = await self._queue.claim_next(
+            group=self._group,
+            consumer=self._consumer,
+            min_idle_ms=self._claim_idle_ms,
+            block_ms=self._block_ms,
+        )
+        if claimed is None:
+            return False
+        entry_id, job_id = claimed
+        job = await self._queue.start(job_id, consumer=self._consumer)
+        if job is None:
+            logger.warning("analysis_job_expired", job_id=str(job_id))
+        elif job.attempts > self._max_attempts:
+            # Repeated redelivery means earlier workers died mid-job; stop retrying it.
+            await self._queue.fail(job_id, f"job abandoned after {self._max_attempts} attempts")
+        else:
+            await self._execute(entry_id, job)
+        await self._queue.ack(group=self._group, entry_id=entry_id)
+        return True
+
+    async def _execute(self, entry_id: bytes, job: AnalysisJob) -> None:
+        cell = _ProgressCell()
+        heartbeat = asyncio.create_task(self._heartbeat(entry_id, job.job_id, cell))
+        try:
+            async with UnitOfWork(self._session_factory) as uow:
+                result = await self._analyze(uow, job, cell)
+        except (AnalysisError, ValueError) as exc:
+            await self._queue.fail(job.job_id, str(exc))
+        except Exception as exc:  # noqa: BLE001 - the job fails, the worker keeps consuming
+            logger.warning("analysis_job_crashed", job_id=str(job.job_id), error=str(exc))
+            await self._queue.fail(job.job_id, f"internal error: {exc}")
+        else:
+            if isinstance(result, BatchAnalysisResult):
+                await self._queue.complete_batch(job.job_id, batch_id=result.batch_id, timings=result.timings)
+                logger.info("analysis_job_completed", job_id=str(job.job_id), batch_id=str(result.batch_id))
+            else:
+                await self._queue.complete(
+                    job.job_id,
+                    outcomes=result.outcomes,
+                    timings=result.timings,
+                    cached_tests=result.cached_tests,
+                )
+                logger.info("analysis_job_completed", job_id=str(job.job_id), run_id=str(job.run_id))
+        finally:
+            heartbeat.cancel()
+            with suppress(asyncio.CancelledError):
+                await heartbeat
+
+    async def _analyze(
+        self,
+        uow: UnitOfWork,
+        job: AnalysisJob,
+        cell: _ProgressCell,
+    ) -> RunAnalysisResult | BatchAnalysisResult:
+        if job.kind != "batch":
+            return await self._analysis_service.analyze_run(
+                uow=uow,
+                run_id=job.run_id,
+                tests=job.tests,
+                progress=cell.update,
+            )
+        selection = job.selection or {}
+        run_ids = selection.get("run_ids")
+        created_from = selection.get("created_from")
+        created_to = selection.get("created_to")
+        return await self._analysis_service.analyze_batch(
+            uow=uow,
+            run_ids=[uuid.UUID(run_id) for run_id in run_ids] if run_ids else None,
+            created_from=datetime.fromisoformat(created_from) if created_from else None,
+            created_to=datetime.fromisoformat(created_to) if created_to else None,
+            tests=job.tests,
+            progress=cell.update,
+        )
+
+    async def _heartbeat(self, entry_id: bytes, job_id: uuid.UUID, cell: _ProgressCell) -> None:
+        reported = 0.0
+        while True:
+            await asyncio.sleep(self._progress_interval)
+            try:
+                await self._queue.touch(group=self._group, consumer=self._consumer, entry_id=entry_id)
+                if cell.value != reported:
+                    reported = cell.value
+                    await self._queue.report_progress(job_id, reported)
+            except Exception as exc:  # noqa: BLE001 - progress is best effort
+                logger.warning("analysis_job_heartbeat_failed", job_id=str(job_id), error=str(exc))
+
+    async def _run(self) -> None:
+        await self._queue.ensure_group(self._group)
+        while True:
+            try:
+                await self.process_next()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001 - keep consuming after transient failures
+                logger.warning("analysis_job_worker_failed", error=str(exc), consumer=self._consumer)
+                await asyncio.sleep(self._block_ms / 1_000)
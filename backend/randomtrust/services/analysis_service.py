@@ -1,18 +1,46 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, Sequence
-from uuid import UUID
+import asyncio
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Iterable, Iterator, Sequence
+from uuid import UUID, uuid4
 
+import numpy as np
 from minio import Minio
 from minio.error import S3Error
 
-from randomtrust.analysis import TestOutcome, run_selected_tests
-from randomtrust.core import Settings
+from randomtrust.analysis import (
+    AVAILABLE_TESTS,
+    BatchCheck,
+    MinEntropyReport,
+    ParallelReport,
+    SharedBits,
+    SharedMemoryExhaustedError,
+    TestOutcome,
+    TestTiming,
+    aggregate_checks,
+    estimate_min_entropy,
+    run_batch_tests,
+    run_parallel_tests,
+    run_streaming_tests,
+    shared_memory_available,
+)
+from randomtrust.core import ComputeExecutor, Settings
+from randomtrust.entropy import quantize_noise
+from randomtrust.models import EntropySimulation, RNGRun
 
+from .analysis_cache import AnalysisResultCache
+from .payload_cache import PayloadChecksumError, RunPayloadCache
+from .rng_service import RunDataUnavailableError, is_keystream_run, iter_run_payload, run_payload_size
 from .unit_of_work import UnitOfWork
 
 
+ProgressCallback = Callable[[float], None]
+
+
 class AnalysisError(RuntimeError):
     """Базовая ошибка анализа."""
 
@@ -25,11 +53,19 @@ class SubjectDataUnavailableError(AnalysisError):
     """У объекта отсутствуют данные для анализа."""
 
 
+class BatchSelectionError(AnalysisError):
+    """Выбранные прогоны нельзя проанализировать одним пакетом."""
+
+
 @dataclass(slots=True)
 class RunAnalysisResult:
     run_id: UUID
-    export_path: str
+    export_path: str | None
     outcomes: Sequence[TestOutcome]
+    # Empty when the run was too large for the shared buffer and went through the streaming path.
+    timings: Sequence[TestTiming] = field(default_factory=list)
+    # Tests whose outcomes came from the result cache rather than being recomputed.
+    cached_tests: Sequence[str] = field(default_factory=list)
 
 
 @dataclass(slots=True)
@@ -37,6 +73,45 @@ class AuditAnalysisResult:
     audit_id: UUID
     data_hash: str
     outcomes: Sequence[TestOutcome]
+    timings: Sequence[TestTiming] = field(default_factory=list)
+    cached_tests: Sequence[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class BatchAnalysisResult:
+    batch_id: UUID
+    run_ids: Sequence[UUID]
+    sequence_bits: int
+    checks: Sequence[BatchCheck]
+    timings: Sequence[TestTiming] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class SimulationEntropyResult:
+    simulation_id: UUID
+    report: MinEntropyReport
+    # Served from the result cache rather than being re-estimated.
+    cached: bool = False
+
+
+@dataclass(slots=True)
+class _BatteryResult:
+    outcomes: list[TestOutcome]
+    timings: list[TestTiming]
+    cached_tests: list[str]
+
+
+def _estimate_noise_artifact(raw: bytes) -> MinEntropyReport:
+    # Noise artifacts hold the float32 signal; the estimate covers the bytes the mixer pooled from it.
+    return estimate_min_entropy(quantize_noise(np.frombuffer(raw, dtype="<f4")))
+
+
+def _track_chunks(chunks: Iterable[bytes], total_bytes: int, progress: ProgressCallback) -> Iterator[bytes]:
+    consumed = 0
+    for chunk in chunks:
+        yield chunk
+        consumed += len(chunk)
+        progress(consumed / total_bytes)
 
 
 class AnalysisService:
@@ -45,9 +120,15 @@ class AnalysisService:
         *,
         storage: Minio,
         settings: Settings,
+        executor: ComputeExecutor,
+        cache: AnalysisResultCache | None = None,
+        payload_cache: RunPayloadCache | None = None,
     ) -> None:
         self._storage = storage
         self._settings = settings
+        self._executor = executor
+        self._cache = cache
+        self._payload_cache = payload_cache
 
     async def analyze_run(
         self,
@@ -55,19 +136,20 @@ class AnalysisService:
         uow: UnitOfWork,
         run_id: UUID,
         tests: Iterable[str] | None = None,
+        progress: ProgressCallback | None = None,
     ) -> RunAnalysisResult:
-        run = await uow.rng.get_run(run_id)
-        if run is None:
-            raise SubjectNotFoundError(f"run {run_id} not found")
-        if not run.export_path:
-            raise SubjectDataUnavailableError("run has no persisted payload")
-
-        payload = self._download_bytes(run.export_path)
-        bits = self._bytes_to_bits(payload)
-        outcomes = run_selected_tests(bits, tests)
+        run = await self.get_analyzable_run(uow=uow, run_id=run_id)
+        digest = run.run_checksum.hex() if run.run_checksum else None
+        battery = await self._cached_battery(
+            digest,
+            tests,
+            lambda selected: self._compute_run(run, selected, progress),
+        )
+        if progress is not None:
+            progress(1.0)
 
         await uow.test_reports.delete_for_run(run_id)
-        for outcome in outcomes:
+        for outcome in battery.outcomes:
             metrics = self._build_metrics_payload(outcome)
             status = "passed" if outcome.passed else "failed"
             await uow.test_reports.add_report(
@@ -78,7 +160,157 @@ class AnalysisService:
                 report_path=None,
             )
 
-        return RunAnalysisResult(run_id=run_id, export_path=run.export_path, outcomes=outcomes)
+        return RunAnalysisResult(
+            run_id=run_id,
+            export_path=run.export_path,
+            outcomes=battery.outcomes,
+            timings=battery.timings,
+            cached_tests=battery.cached_tests,
+        )
+
+    async def get_analyzable_run(self, *, uow: UnitOfWork, run_id: UUID) -> RNGRun:
+        run = await uow.rng.get_run(run_id)
+        if run is None:
+            raise SubjectNotFoundError(f"run {run_id} not found")
+        if run.storage_mode != "virtual" and not run.export_path:
+            raise SubjectDataUnavailableError("run has no persisted payload")
+        if not is_keystream_run(run):
+            # The statistical tests assume uniform bits; float64/int64 words fail them by construction.
+            raise SubjectDataUnavailableError(f"run {run_id} stores {run.run_format} values, not a bitstream")
+        return run
+
+    async def select_batch_runs(
+        self,
+        *,
+        uow: UnitOfWork,
+        run_ids: Sequence[UUID] | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> list[RNGRun]:
+        """Runs named explicitly, or every analyzable run created in [created_from, created_to)."""
+        max_runs = self._settings.analysis_batch_max_runs
+        if run_ids:
+            unique_ids = list(dict.fromkeys(run_ids))
+            if len(unique_ids) > max_runs:
+                raise BatchSelectionError(f"batch is limited to {max_runs} runs")
+            found = {run.id: run for run in await uow.rng.get_runs(unique_ids)}
+            missing = [str(run_id) for run_id in unique_ids if run_id not in found]
+            if missing:
+                raise SubjectNotFoundError(f"runs not found: {', '.join(missing)}")
+            runs = [found[run_id] for run_id in unique_ids]
+            for run in runs:
+                if run.storage_mode != "virtual" and not run.export_path:
+                    raise SubjectDataUnavailableError(f"run {run.id} has no persisted payload")
+                if not is_keystream_run(run):
+                    raise SubjectDataUnavailableError(f"run {run.id} stores {run.run_format} values, not a bitstream")
+        elif created_from is not None and created_to is not None:
+            window = await uow.rng.list_runs_created_between(
+                created_from=created_from,
+                created_to=created_to,
+                limit=max_runs + 1,
+            )
+            runs = [
+                run
+                for run in window
+                if is_keystream_run(run) and (run.storage_mode == "virtual" or run.export_path)
+            ]
+            if len(window) > max_runs:
+                raise BatchSelectionError(f"time window selects more than {max_runs} runs")
+        else:
+            raise BatchSelectionError("either run ids or a creation time window is required")
+
+        if not runs:
+            raise BatchSelectionError("no analyzable runs selected")
+        sizes = {run_payload_size(run) for run in runs}
+        if len(sizes) > 1:
+            # The proportion and uniformity checks assume sequences of one length.
+            raise BatchSelectionError("batch runs must have equal payload sizes")
+        row_bytes = sizes.pop()
+        if row_bytes > self._settings.analysis_parallel_max_bytes:
+            # Longer sequences are only analyzed through the streaming path, one run at a time.
+            raise BatchSelectionError(
+                f"batch runs of {row_bytes} bytes exceed the per-sequence limit of"
+                f" {self._settings.analysis_parallel_max_bytes} bytes"
+            )
+        stack_bytes = row_bytes * len(runs)
+        if stack_bytes > self._settings.analysis_batch_max_bytes:
+            raise BatchSelectionError("batch payload exceeds the configured limit")
+        # The whole stack is one shared memory segment; overfilling /dev/shm kills the worker with SIGBUS.
+        available = shared_memory_available()
+        if available is not None and stack_bytes > available:
+            raise BatchSelectionError(
+                f"batch payload of {stack_bytes} bytes exceeds the {available} bytes of free shared memory"
+            )
+        return runs
+
+    async def analyze_batch(
+        self,
+        *,
+        uow: UnitOfWork,
+        run_ids: Sequence[UUID] | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        tests: Iterable[str] | None = None,
+        progress: ProgressCallback | None = None,
+    ) -> BatchAnalysisResult:
+        runs = await self.select_batch_runs(
+            uow=uow,
+            run_ids=run_ids,
+            created_from=created_from,
+            created_to=created_to,
+        )
+        selected = list(tests) if tests else None
+        row_bytes = run_payload_size(runs[0])
+        try:
+            stack = SharedBits(len(runs) * row_bytes * 8)
+        except SharedMemoryExhaustedError as exc:
+            raise BatchSelectionError(str(exc)) from exc
+        try:
+            await self._load_rows(stack, runs, row_bytes, progress)
+            report = await run_batch_tests(
+                stack,
+                len(runs),
+                selected,
+                executor=self._executor,
+                # Loading covers the first half of the progress range, the battery the second.
+                progress=None if progress is None else lambda value: progress(0.5 + value / 2),
+            )
+        finally:
+            stack.close()
+        checks = aggregate_checks(report.rows)
+        if progress is not None:
+            progress(1.0)
+
+        batch_id = uuid4()
+        await uow.analysis_batches.add_batch(
+            batch_id=batch_id,
+            tests=selected or list(AVAILABLE_TESTS.keys()),
+            run_ids=[str(run.id) for run in runs],
+            sequence_bits=row_bytes * 8,
+            checks=[asdict(check) for check in checks],
+        )
+        await uow.test_reports.delete_for_runs(run.id for run in runs)
+        await uow.test_reports.add_reports_bulk(
+            [
+                {
+                    "run_id": run.id,
+                    "batch_id": batch_id,
+                    "test_name": outcome.name,
+                    "status": "passed" if outcome.passed else "failed",
+                    "metrics": self._build_metrics_payload(outcome),
+                    "report_path": None,
+                }
+                for run, outcomes in zip(runs, report.rows)
+                for outcome in outcomes
+            ]
+        )
+        return BatchAnalysisResult(
+            batch_id=batch_id,
+            run_ids=[run.id for run in runs],
+            sequence_bits=row_bytes * 8,
+            checks=checks,
+            timings=report.timings,
+        )
 
     async def analyze_audit(
         self,
@@ -91,15 +323,240 @@ class AnalysisService:
         if audit is None:
             raise SubjectNotFoundError(f"audit upload {audit_id} not found")
 
-        bits = self._bytes_to_bits(audit.raw_payload)
-        outcomes = run_selected_tests(bits, tests)
-        return AuditAnalysisResult(audit_id=audit_id, data_hash=audit.data_hash, outcomes=outcomes)
+        if not audit.result_path:
+            raise SubjectDataUnavailableError(f"audit upload {audit_id} has no stored payload")
+        path = audit.result_path
+
+        # Audits hash their payload with BLAKE2s like run checksums, so identical data shares entries.
+        battery = await self._cached_battery(
+            audit.data_hash,
+            tests,
+            lambda selected: self._compute_object(path, selected),
+        )
+        return AuditAnalysisResult(
+            audit_id=audit_id,
+            data_hash=audit.data_hash,
+            outcomes=battery.outcomes,
+            timings=battery.timings,
+            cached_tests=battery.cached_tests,
+        )
+
+    async def analyze_simulations(
+        self,
+        *,
+        uow: UnitOfWork,
+        simulation_ids: Sequence[UUID] | None = None,
+        sample_size: int | None = None,
+    ) -> list[SimulationEntropyResult]:
+        """SP 800-90B min-entropy of stored noise artifacts, for given simulations or a random sample."""
+        max_simulations = self._settings.analysis_min_entropy_max_simulations
+        if simulation_ids:
+            unique_ids = list(dict.fromkeys(simulation_ids))
+            if len(unique_ids) > max_simulations:
+                raise BatchSelectionError(f"min-entropy analysis is limited to {max_simulations} simulations")
+            found = {simulation.id: simulation for simulation in await uow.entropy.get_simulations(unique_ids)}
+            missing = [str(simulation_id) for simulation_id in unique_ids if simulation_id not in found]
+            if missing:
+                raise SubjectNotFoundError(f"simulations not found: {', '.join(missing)}")
+            simulations = [found[simulation_id] for simulation_id in unique_ids]
+        elif sample_size is not None:
+            if sample_size > max_simulations:
+                raise BatchSelectionError(f"min-entropy analysis is limited to {max_simulations} simulations")
+            simulations = await uow.entropy.sample_simulations(sample_size)
+            if not simulations:
+                raise BatchSelectionError("no simulations stored")
+        else:
+            raise BatchSelectionError("either simulation ids or a sample size is required")
+
+        hits: dict[UUID, MinEntropyReport] = {}
+        if self._cache is not None:
+            hits = await self._cache.lookup_min_entropy(simulation.id for simulation in simulations)
+        pending = [simulation for simulation in simulations if simulation.id not in hits]
+        semaphore = asyncio.Semaphore(self._settings.analysis_batch_concurrency)
 
-    def _download_bytes(self, path: str) -> bytes:
+        async def estimate(simulation: EntropySimulation) -> MinEntropyReport:
+            async with semaphore:
+                raw = await asyncio.to_thread(self._fetch_object, simulation.noise_raw_path)
+            return await self._executor.run(_estimate_noise_artifact, raw)
+
+        estimated = await asyncio.gather(*(estimate(simulation) for simulation in pending))
+        reports = {simulation.id: report for simulation, report in zip(pending, estimated)}
+        if self._cache is not None and reports:
+            await self._cache.store_min_entropy(reports)
+        return [
+            SimulationEntropyResult(
+                simulation_id=simulation.id,
+                report=hits.get(simulation.id) or reports[simulation.id],
+                cached=simulation.id in hits,
+            )
+            for simulation in simulations
+        ]
+
+    async def _cached_battery(
+        self,
+        digest: str | None,
+        tests: Iterable[str] | None,
+        compute: Callable[[list[str] | None], Awaitable[ParallelReport]],
+    ) -> _BatteryResult:
+        explicit = list(tests) if tests else None
+        selected = explicit or list(AVAILABLE_TESTS.keys())
+        if self._cache is None or digest is None:
+            report = await compute(explicit)
+            return _BatteryResult(outcomes=report.outcomes, timings=report.timings, cached_tests=[])
+
+        hits = await self._cache.lookup(digest, selected)
+        if explicit:
+            # A cached skip is not reused here: explicit requests must fail with the test's own error.
+            missing = [name for name in dict.fromkeys(explicit) if hits.get(name) is None]
+            report = await compute(missing) if missing else ParallelReport(outcomes=[], timings=[])
+            skipped: list[str] = []
+        else:
+            missing = [name for name in selected if name not in hits]
+            # The default battery is recomputed whole on any miss so its skip rules stay in one place.
+            report = await compute(None) if missing else ParallelReport(outcomes=[], timings=[])
+            computed_names = {outcome.name for outcome in report.outcomes}
+            skipped = [name for name in selected if name not in computed_names] if missing else []
+        if missing:
+            await self._cache.store(digest, report.outcomes, skipped)
+
+        computed = {outcome.name: outcome for outcome in report.outcomes}
+        outcomes: list[TestOutcome] = []
+        cached_tests: list[str] = []
+        for name in selected:
+            if name in computed:
+                outcomes.append(computed[name])
+            elif hits.get(name) is not None:
+                outcomes.append(hits[name])
+                cached_tests.append(name)
+        return _BatteryResult(outcomes=outcomes, timings=report.timings, cached_tests=cached_tests)
+
+    async def _compute_run(
+        self,
+        run: RNGRun,
+        tests: list[str] | None,
+        progress: ProgressCallback | None,
+    ) -> ParallelReport:
+        if self._fits_shared(run_payload_size(run)):
+            try:
+                shared = await asyncio.to_thread(self._load_shared, run)
+            except SharedMemoryExhaustedError:
+                # A concurrent analysis took the space since the check; stream instead.
+                pass
+            else:
+                try:
+                    return await self._run_parallel(shared, tests, progress)
+                finally:
+                    shared.close()
+        # Chunks flow through online accumulators, so memory does not grow with the run size.
+        outcomes = await asyncio.to_thread(self._analyze_run_stream, run, tests, progress)
+        return ParallelReport(outcomes=outcomes, timings=[])
+
+    async def _compute_object(self, path: str, tests: list[str] | None) -> ParallelReport:
+        size = await asyncio.to_thread(self._object_size, path)
+        if self._fits_shared(size):
+            try:
+                shared = await asyncio.to_thread(self._load_object_shared, path)
+            except SharedMemoryExhaustedError:
+                pass
+            else:
+                try:
+                    return await self._run_parallel(shared, tests)
+                finally:
+                    shared.close()
+        outcomes = await asyncio.to_thread(self._analyze_object_stream, path, tests)
+        return ParallelReport(outcomes=outcomes, timings=[])
+
+    def _fits_shared(self, nbytes: int) -> bool:
+        if nbytes > self._settings.analysis_parallel_max_bytes:
+            return False
+        available = shared_memory_available()
+        return available is None or nbytes <= available
+
+    async def _run_parallel(
+        self,
+        shared: SharedBits,
+        tests: Iterable[str] | None,
+        progress: ProgressCallback | None = None,
+    ) -> ParallelReport:
+        return await run_parallel_tests(
+            shared,
+            tests,
+            executor=self._executor,
+            min_segment_bits=self._settings.analysis_segment_bits,
+            progress=progress,
+        )
+
+    def _analyze_run_stream(
+        self,
+        run: RNGRun,
+        tests: Iterable[str] | None,
+        progress: ProgressCallback | None,
+    ) -> list[TestOutcome]:
+        with self._open_payload(run) as (total_bytes, chunks):
+            if progress is not None:
+                chunks = _track_chunks(chunks, total_bytes, progress)
+            return run_streaming_tests(chunks, total_bytes * 8, tests)
+
+    def _analyze_object_stream(self, path: str, tests: Iterable[str] | None) -> list[TestOutcome]:
+        with self._open_object(path) as (total_bytes, chunks):
+            return run_streaming_tests(chunks, total_bytes * 8, tests)
+
+    async def _load_rows(
+        self,
+        stack: SharedBits,
+        runs: Sequence[RNGRun],
+        row_bytes: int,
+        progress: ProgressCallback | None,
+    ) -> None:
+        # Payloads are fetched or replayed on threads, each into its own row of the stack.
+        semaphore = asyncio.Semaphore(self._settings.analysis_batch_concurrency)
+        loaded = 0
+
+        async def load(row: int, run: RNGRun) -> None:
+            nonlocal loaded
+            async with semaphore:
+                await asyncio.to_thread(self._load_row, stack, row * row_bytes, row_bytes, run)
+            loaded += 1
+            if progress is not None:
+                progress(loaded / len(runs) / 2)
+
+        await asyncio.gather(*(load(row, run) for row, run in enumerate(runs)))
+
+    def _load_row(self, stack: SharedBits, offset: int, row_bytes: int, run: RNGRun) -> None:
+        with self._open_payload(run) as (total_bytes, chunks):
+            if total_bytes != row_bytes:
+                raise SubjectDataUnavailableError(f"run {run.id} payload size does not match its metadata")
+            position = offset
+            for chunk in chunks:
+                if position + len(chunk) > offset + row_bytes:
+                    raise SubjectDataUnavailableError(f"run {run.id} payload exceeds its declared size")
+                position += stack.write_at(position, chunk)
+
+    def _load_shared(self, run: RNGRun) -> SharedBits:
+        with self._open_payload(run) as (total_bytes, chunks):
+            return self._fill_shared(total_bytes, chunks)
+
+    def _load_object_shared(self, path: str) -> SharedBits:
+        with self._open_object(path) as (total_bytes, chunks):
+            return self._fill_shared(total_bytes, chunks)
+
+    @staticmethod
+    def _fill_shared(total_bytes: int, chunks: Iterable[bytes]) -> SharedBits:
+        # Chunks are copied straight into the segment the pool workers attach to.
+        shared = SharedBits(total_bytes * 8)
+        try:
+            for chunk in chunks:
+                shared.write(chunk)
+        except BaseException:
+            shared.close()
+            raise
+        return shared
+
+    def _fetch_object(self, path: str) -> bytes:
         obj = None
         try:
             obj = self._storage.get_object(self._settings.minio_bucket, path)
-            data = obj.read()
+            return obj.read()
         except S3Error as exc:
             raise SubjectDataUnavailableError(f"failed to fetch object {path}: {exc}") from exc
         finally:
@@ -109,15 +566,59 @@ class AnalysisService:
                     obj.release_conn()
                 except Exception:
                     pass
-        return data
 
-    @staticmethod
-    def _bytes_to_bits(payload: bytes) -> list[int]:
-        bits: list[int] = []
-        for byte in payload:
-            for shift in range(7, -1, -1):
-                bits.append((byte >> shift) & 1)
-        return bits
+    @contextmanager
+    def _open_payload(self, run: RNGRun) -> Iterator[tuple[int, Iterable[bytes]]]:
+        chunk_size = self._settings.analysis_chunk_size
+        if run.storage_mode == "virtual":
+            # Replaying the keystream locally is cheaper than an object storage round trip.
+            try:
+                yield run_payload_size(run), iter_run_payload(run, chunk_size)
+            except RunDataUnavailableError as exc:
+                raise SubjectDataUnavailableError(str(exc)) from exc
+            return
+        path = run.export_path
+        cached = self._cached_payload(run)
+        # An entry evicted after the fetch is read from object storage instead.
+        mapped = None if cached is None else self._payload_cache.open(cached)
+        if mapped is not None:
+            with mapped as view:
+                yield len(view), (bytes(view[offset : offset + chunk_size]) for offset in range(0, len(view), chunk_size))
+            return
+        with self._open_object(path) as payload:
+            yield payload
+
+    def _object_size(self, path: str) -> int:
+        try:
+            return self._storage.stat_object(self._settings.minio_bucket, path).size
+        except S3Error as exc:
+            raise SubjectDataUnavailableError(f"failed to fetch object {path}: {exc}") from exc
+
+    @contextmanager
+    def _open_object(self, path: str) -> Iterator[tuple[int, Iterable[bytes]]]:
+        obj = None
+        try:
+            obj = self._storage.get_object(self._settings.minio_bucket, path)
+            yield int(obj.headers["Content-Length"]), obj.stream(self._settings.analysis_chunk_size)
+        except S3Error as exc:
+            raise SubjectDataUnavailableError(f"failed to fetch object {path}: {exc}") from exc
+        finally:
+            if obj is not None:
+                try:
+                    obj.close()
+                    obj.release_conn()
+                except Exception:
+                    pass
+
+    def _cached_payload(self, run: RNGRun) -> Path | None:
+        if self._payload_cache is None:
+            return None
+        try:
+            return self._payload_cache.fetch(str(run.id), run.export_path, run_payload_size(run), run.run_checksum)
+        except S3Error as exc:
+            raise SubjectDataUnavailableError(f"failed to fetch object {run.export_path}: {exc}") from exc
+        except PayloadChecksumError as exc:
+            raise SubjectDataUnavailableError(str(exc)) from exc
 
     @staticmethod
     def _build_metrics_payload(outcome: TestOutcome) -> dict[str, float]:
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
-import io
 import uuid
 from hashlib import blake2s
+from typing import AsyncIterable
 
 from minio import Minio
 
-from randomtrust.core import Settings
+from randomtrust.core import Settings, StreamingUpload
 
 from .unit_of_work import UnitOfWork
 
 
+class AuditUploadError(RuntimeError):
+    """Raised when an uploaded sequence cannot be stored."""
+
+
 class AuditRecord:
     def __init__(
         self,
@@ -18,10 +22,12 @@ class AuditRecord:
         audit_id: uuid.UUID,
         status: str,
         data_hash: str,
+        size: int,
     ) -> None:
         self.audit_id = audit_id
         self.status = status
         self.data_hash = data_hash
+        self.size = size
 
 
 class AuditService:
@@ -35,31 +41,40 @@ class AuditService:
         uow: UnitOfWork,
         name: str,
         description: str | None,
-        hex_payload: str,
+        chunks: AsyncIterable[bytes],
+        length: int = -1,
     ) -> AuditRecord:
-        payload = bytes.fromhex(hex_payload)
+        """Hash and upload `chunks` as they arrive; only the row metadata is kept in the database."""
         audit_id = uuid.uuid4()
-
         path = f"audit/{audit_id}.bin"
-        stream = io.BytesIO(payload)
-        self._storage.put_object(
-            self._settings.minio_bucket,
-            path,
-            data=stream,
-            length=len(payload),
-            content_type="application/octet-stream",
-        )
-
-        data_hash = blake2s(payload).hexdigest()
+        upload = StreamingUpload(self._storage, self._settings.minio_bucket, path, length=length)
+        upload.start()
+        digest = blake2s()
+        size = 0
+        try:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                digest.update(chunk)
+                await upload.write(chunk)
+                size += len(chunk)
+            if size == 0:
+                raise AuditUploadError("sequence is empty")
+            if length >= 0 and size != length:
+                raise AuditUploadError(f"received {size} bytes, expected {length}")
+            await upload.close()
+        except BaseException:
+            # A rejected or interrupted upload must not leave a partial object behind.
+            await upload.abort()
+            raise
 
-        repo = uow.audit
-        await repo.add_upload(
+        data_hash = digest.hexdigest()
+        await uow.audit.add_upload(
             audit_id=audit_id,
             name=name,
             description=description,
             data_hash=data_hash,
             result_path=path,
-            raw_payload=payload,
         )
 
-        return AuditRecord(audit_id=audit_id, status="stored", data_hash=data_hash)
+        return AuditRecord(audit_id=audit_id, status="stored", data_hash=data_hash, size=size)
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import io
 import uuid
+from typing import Sequence
 
 from minio import Minio
 
-from randomtrust.core import Settings
-from randomtrust.entropy import EntropyMixer
+from randomtrust.core import ComputeExecutor, Settings
+from randomtrust.entropy import EntropyMixer, EntropyMixResult
 
 from .unit_of_work import UnitOfWork
 
@@ -35,10 +36,12 @@ class EntropyService:
         mixer: EntropyMixer,
         storage: Minio,
         settings: Settings,
+        executor: ComputeExecutor,
     ) -> None:
         self._mixer = mixer
         self._storage = storage
         self._settings = settings
+        self._executor = executor
 
     async def create_entropy(
         self,
@@ -47,8 +50,34 @@ class EntropyService:
         noise_seed: int | None,
         overrides: dict[str, float] | None,
     ) -> StoredEntropy:
-        # Mix simulated noise and chaotic dynamics into a single entropy artifact.
-        result = self._mixer.mix_entropy(noise_seed=noise_seed, parameter_overrides=overrides)
+        # Mix simulated noise and chaotic dynamics into a single entropy artifact off the event loop.
+        result = await self._executor.run(
+            self._mixer.mix_entropy,
+            noise_seed=noise_seed,
+            parameter_overrides=overrides,
+        )
+        return await self._persist_result(uow=uow, result=result, noise_seed=noise_seed)
+
+    async def create_entropy_batch(
+        self,
+        *,
+        uow: UnitOfWork,
+        requests: Sequence[tuple[int | None, dict[str, float] | None]],
+    ) -> list[StoredEntropy]:
+        # A single executor task mixes the whole batch with stacked numpy work.
+        results = await self._executor.run(self._mixer.mix_entropy_batch, list(requests))
+        stored: list[StoredEntropy] = []
+        for (noise_seed, _), result in zip(requests, results):
+            stored.append(await self._persist_result(uow=uow, result=result, noise_seed=noise_seed))
+        return stored
+
+    async def _persist_result(
+        self,
+        *,
+        uow: UnitOfWork,
+        result: EntropyMixResult,
+        noise_seed: int | None,
+    ) -> StoredEntropy:
         simulation_id = uuid.uuid4()
 
         # Persist raw noise samples and chaotic trajectory for downstream audits.
@@ -58,17 +87,21 @@ class EntropyService:
             f"chaos/{simulation_id}.bin",
         )
 
+        metrics = {
+            "snr_db": result.metrics.snr_db,
+            "spectral_deviation_percent": result.metrics.spectral_deviation_percent,
+            "lyapunov_exponent": result.metrics.lyapunov_exponent,
+            "health_max_repetition": result.metrics.health_max_repetition,
+            "health_max_proportion": result.metrics.health_max_proportion,
+            "health_retries": result.metrics.health_retries,
+        }
         repo = uow.entropy
         # Record simulation metadata, metrics, and hashes for reproducibility.
         await repo.add_simulation(
             simulation_id=simulation_id,
             noise_seed=noise_seed,
             noise_config=result.noise_config,
-            metrics={
-                "snr_db": result.metrics.snr_db,
-                "spectral_deviation_percent": result.metrics.spectral_deviation_percent,
-                "lyapunov_exponent": result.metrics.lyapunov_exponent,
-            },
+            metrics=metrics,
             seed_hex=result.seed.hex(),
             pool_hash=result.pool_hash,
             chaos_checksum=result.chaos_checksum,
@@ -86,11 +119,7 @@ class EntropyService:
         return StoredEntropy(
             simulation_id=simulation_id,
             seed=result.seed,
-            metrics={
-                "snr_db": result.metrics.snr_db,
-                "spectral_deviation_percent": result.metrics.spectral_deviation_percent,
-                "lyapunov_exponent": result.metrics.lyapunov_exponent,
-            },
+            metrics=metrics,
         )
 
     def _upload_buffer(self, data: bytes, path: str) -> str:
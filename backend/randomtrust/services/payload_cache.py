@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import fcntl
+import mmap
+import os
+import threading
+import uuid
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from hashlib import blake2s
+from pathlib import Path
+from typing import BinaryIO, ContextManager, Iterator
+
+from minio import Minio
+
+from randomtrust.core import Settings
+from randomtrust.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_SUFFIX = ".bin"
+_PARTIAL_SUFFIX = ".part"
+# Fills of one key serialize on a lock file picked by hash, keeping the number of lock files fixed.
+_KEY_LOCK_STRIPES = 64
+
+
+class PayloadChecksumError(RuntimeError):
+    """Downloaded payload does not match the run checksum."""
+
+
+class RunPayloadCache:
+    """Object payloads mirrored on local disk, evicted least recently used first.
+
+    Entries are immutable files written atomically, so API and analysis worker processes on one
+    host share them; readers keep a mapped file valid even if another process evicts it meanwhile.
+    """
+
+    def __init__(self, *, storage: Minio, bucket: str, root: Path, max_bytes: int, chunk_size: int) -> None:
+        self._storage = storage
+        self._bucket = bucket
+        self._root = root
+        self._max_bytes = max_bytes
+        self._chunk_size = chunk_size
+        self._fills = ThreadPoolExecutor(max_workers=1, thread_name_prefix="payload-cache")
+        self._pending: set[str] = set()
+        self._pending_lock = threading.Lock()
+
+    def lookup(self, key: str, size: int) -> Path | None:
+        """Local copy of `key` if it is already cached."""
+        target = self._root / f"{key}{_SUFFIX}"
+        try:
+            if target.stat().st_size == size:
+                # The modification time orders entries for eviction.
+                os.utime(target)
+                return target
+        except FileNotFoundError:
+            pass
+        return None
+
+    def fetch(self, key: str, path: str, size: int, checksum: bytes | None) -> Path | None:
+        """Local copy of object `path`, downloaded on a miss; `None` when it cannot be cached.
+
+        Concurrent misses of one key, in any process, wait for a single download.
+        """
+        return self.lookup(key, size) or self._fill(key, path, size, checksum, wait=True)
+
+    def prefetch(self, key: str, path: str, size: int, checksum: bytes | None) -> None:
+        """Download object `path` in the background unless it is cached or already being fetched."""
+        if size > self._max_bytes or self.lookup(key, size) is not None:
+            return
+        with self._pending_lock:
+            if key in self._pending:
+                return
+            self._pending.add(key)
+        self._fills.submit(self._prefetch, key, path, size, checksum)
+
+    def shutdown(self) -> None:
+        self._fills.shutdown(wait=False, cancel_futures=True)
+
+    def open(self, target: Path) -> ContextManager[memoryview] | None:
+        """Mapped view of an entry from `lookup` or `fetch`; `None` if another process evicted it since.
+
+        The file is opened right away, so once this returns the entry stays readable even if unlinked.
+        """
+        try:
+            handle = open(target, "rb")
+        except FileNotFoundError:
+            return None
+        return self._mapped(handle)
+
+    @staticmethod
+    @contextmanager
+    def _mapped(handle: BinaryIO) -> Iterator[memoryview]:
+        with handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                # Empty files cannot be mapped.
+                yield memoryview(b"")
+                return
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    yield view
+                finally:
+                    view.release()
+
+    def _prefetch(self, key: str, path: str, size: int, checksum: bytes | None) -> None:
+        try:
+            self._fill(key, path, size, checksum, wait=False)
+        except Exception as exc:  # noqa: BLE001 - readers keep streaming from object storage
+            logger.warning("payload_cache_fill_failed", key=key, path=path, error=str(exc))
+        finally:
+            with self._pending_lock:
+                self._pending.discard(key)
+
+    def _fill(self, key: str, path: str, size: int, checksum: bytes | None, *, wait: bool) -> Path | None:
+        if size > self._max_bytes:
+            return None
+        stripe = zlib.crc32(key.encode("utf-8")) % _KEY_LOCK_STRIPES
+        try:
+            self._root.mkdir(parents=True, exist_ok=True)
+            with self._locked(f".key-{stripe:02d}.lock", wait=wait) as owned:
+                if not owned:
+                    # Another thread or process is downloading a key of this stripe right now.
+                    return None
+                # The download we waited for may have produced the entry.
+                target = self.lookup(key, size)
+                if target is not None:
+                    return target
+                return self._download(key, path, size, checksum)
+        except OSError as exc:
+            logger.warning("payload_cache_unavailable", root=str(self._root), error=str(exc))
+            return None
+
+    def _download(self, key: str, path: str, size: int, checksum: bytes | None) -> Path:
+        partial = self._root / f".{key}.{uuid.uuid4().hex}{_PARTIAL_SUFFIX}"
+        with self._locked(".lock", wait=True):
+            self._make_room(size)
+            # Allocating the full length up front makes concurrent fills see each other's share.
+            with open(partial, "wb") as handle:
+                handle.truncate(size)
+
+        target = self._root / f"{key}{_SUFFIX}"
+        digest = blake2s()
+        written = 0
+        obj = None
+        try:
+            obj = self._storage.get_object(self._bucket, path)
+            with open(partial, "r+b") as handle:
+                for chunk in obj.stream(self._chunk_size):
+                    handle.write(chunk)
+                    digest.update(chunk)
+                    written += len(chunk)
+            if written != size or (checksum is not None and digest.digest() != checksum):
+                raise PayloadChecksumError(f"object {path} does not match the stored checksum")
+            os.replace(partial, target)
+        finally:
+            if obj is not None:
+                try:
+                    obj.close()
+                    obj.release_conn()
+                except Exception:
+                    pass
+            partial.unlink(missing_ok=True)
+        return target
+
+    @contextmanager
+    def _locked(self, name: str, *, wait: bool) -> Iterator[bool]:
+        # flock serializes threads as well as processes, since every call opens its own descriptor.
+        with open(self._root / name, "a") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX if wait else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _make_room(self, incoming: int) -> None:
+        entries: list[tuple[float, int, str]] = []
+        used = incoming
+        with os.scandir(self._root) as scan:
+            for entry in scan:
+                if not entry.is_file() or not entry.name.endswith((_SUFFIX, _PARTIAL_SUFFIX)):
+                    continue
+                stat = entry.stat()
+                used += stat.st_size
+                # Downloads in progress take space but are never evicted.
+                if entry.name.endswith(_SUFFIX):
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+        for _, size, path in entries:
+            if used <= self._max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            used -= size
+
+
+def create_run_payload_cache(settings: Settings, *, storage: Minio) -> RunPayloadCache | None:
+    if not settings.rng_export_cache_enabled:
+        return None
+    return RunPayloadCache(
+        storage=storage,
+        bucket=settings.minio_bucket,
+        root=settings.rng_export_path,
+        max_bytes=settings.rng_export_cache_max_bytes,
+        chunk_size=settings.rng_export_chunk_size,
+    )
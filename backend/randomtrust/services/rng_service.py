@@ -1,26 +1,41 @@
 from __future__ import annotations
 
+import asyncio
 import io
+import itertools
 import uuid
+from collections import deque
 from dataclasses import dataclass
+from datetime import datetime
 from hashlib import blake2s
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterator, Sequence
 
+import numpy as np
 from minio import Minio
 from minio.error import S3Error
+from redis.exceptions import RedisError
 
-from randomtrust.core import Settings
-from randomtrust.rng.generator import ChaCha20RNGFactory
+from randomtrust.core import Settings, StreamingUpload
+from randomtrust.core.logging import get_logger
+from randomtrust.models import RNGRun
+from randomtrust.rng.export import EXPORT_FORMATS, ExportRenderer, render_export
+from randomtrust.rng.generator import ChaCha20RNG, ChaCha20RNGFactory, ParallelKeystream, draw_output
 
-from .entropy_service import EntropyService
+from .entropy_service import EntropyService, StoredEntropy
+from .payload_cache import RunPayloadCache
+from .seed_reservoir import SeedReservoir
 from .unit_of_work import UnitOfWork
 
+logger = get_logger(__name__)
+
 
 class GeneratedSequence:
     def __init__(
         self,
         *,
         run_id: uuid.UUID,
-        data: str | list[int],
+        data: str | list[int] | list[float],
         format: str,
         metrics: dict[str, float],
     ) -> None:
@@ -42,6 +57,16 @@ class RunDataUnavailableError(RunExportError):
     pass
 
 
+class ExportRangeError(RunExportError):
+    def __init__(self, size: int) -> None:
+        super().__init__(f"requested range is outside the {size}-byte export")
+        self.size = size
+
+
+class CorpusSelectionError(RunExportError):
+    """The runs selected for a corpus export cannot be exported together."""
+
+
 class InsufficientBitsError(RunExportError):
     def __init__(self, available: int, required: int) -> None:
         super().__init__(f"available bits {available} less than required {required}")
@@ -49,12 +74,136 @@ class InsufficientBitsError(RunExportError):
         self.required = required
 
 
+# Formats whose stored payload is the raw keystream itself, one byte per value.
+_KEYSTREAM_FORMATS = ("hex", "ints", "raw")
+_REPLAY_CHUNK_SIZE = 1024**2
+
+
+def run_payload_size(run: RNGRun) -> int:
+    """Size in bytes of the payload a run stores (or would store) in object storage."""
+    return run.length if run.run_format in _KEYSTREAM_FORMATS else run.length * 8
+
+
+def is_keystream_run(run: RNGRun) -> bool:
+    """Whether the payload is a uniform bitstream; sampled formats store float64/int64 words."""
+    return run.run_format in _KEYSTREAM_FORMATS
+
+
+def iter_run_payload(run: RNGRun, chunk_size: int = _REPLAY_CHUNK_SIZE) -> Iterator[bytes]:
+    """Regenerate a virtual run's output chunk by chunk; the checksum is verified after the last one."""
+    if not run.key_hex or not run.nonce_hex or run.counter_start is None:
+        raise RunDataUnavailableError("virtual run has no key material to replay")
+    rng = ChaCha20RNG(
+        key=bytes.fromhex(run.key_hex),
+        nonce=bytes.fromhex(run.nonce_hex),
+        counter=run.counter_start,
+    )
+    digest = blake2s()
+    if run.run_format in _KEYSTREAM_FORMATS:
+        # Block-aligned chunks replay the keystream in constant memory.
+        step = max(chunk_size // 64, 1) * 64
+        remaining = run.length
+        while remaining > 0:
+            chunk = rng.random_bytes(min(step, remaining))
+            digest.update(chunk)
+            remaining -= len(chunk)
+            yield chunk
+    else:
+        # Sampled formats are capped at the generate endpoint's length limit, so replay them whole.
+        params = run.output_params or {}
+        values = draw_output(rng, run.run_format, run.length, params.get("low"), params.get("high"))
+        payload = memoryview(values).cast("B")
+        for offset in range(0, payload.nbytes, chunk_size):
+            chunk = payload[offset : offset + chunk_size].tobytes()
+            digest.update(chunk)
+            yield chunk
+    if run.run_checksum is not None and digest.digest() != run.run_checksum:
+        raise RunDataUnavailableError("replayed sequence does not match the stored checksum")
+
+
+def replay_run_payload(run: RNGRun) -> bytes:
+    """Regenerate a virtual run's output from its key material and verify it against the checksum."""
+    return b"".join(iter_run_payload(run))
+
+
+def iter_run_payload_range(run: RNGRun, start: int, stop: int, chunk_size: int = _REPLAY_CHUNK_SIZE) -> Iterator[bytes]:
+    """Bytes [start, stop) of a virtual run; only a full replay can be checked against the checksum."""
+    if start == 0 and stop >= run_payload_size(run):
+        yield from iter_run_payload(run, chunk_size)
+        return
+    if run.run_format not in _KEYSTREAM_FORMATS:
+        # Sampled formats are small, so the slice is cut from a full replay.
+        yield b"".join(iter_run_payload(run, chunk_size))[start:stop]
+        return
+    if not run.key_hex or not run.nonce_hex or run.counter_start is None:
+        raise RunDataUnavailableError("virtual run has no key material to replay")
+    # The keystream is seekable by block, so only the covering blocks are generated.
+    rng = ChaCha20RNG(
+        key=bytes.fromhex(run.key_hex),
+        nonce=bytes.fromhex(run.nonce_hex),
+        counter=run.counter_start + start // 64,
+    )
+    step = max(chunk_size // 64, 1) * 64
+    position = start - start % 64
+    while position < stop:
+        block = rng.random_bytes(min(step, stop - position))
+        yield block[max(start - position, 0) :]
+        position += len(block)
+
+
+@dataclass(slots=True)
+class SequenceStream:
+    run_id: uuid.UUID
+    length: int
+    chunks: AsyncIterator[bytes]
+
+
 @dataclass(slots=True)
 class RunBitsExport:
     run_id: uuid.UUID
     bits_count: int
-    content: bytes
+    # Blocking iterator; StreamingResponse drains it on a worker thread.
+    chunks: Iterator[bytes]
     filename: str
+    media_type: str
+    # Full size of the rendered export and the byte range [start, stop) the chunks cover.
+    size: int
+    start: int
+    stop: int
+
+
+@dataclass(slots=True)
+class CorpusEntry:
+    run_id: uuid.UUID
+    # Byte offset of the run's payload in the concatenated corpus.
+    offset: int
+    length: int
+    created_at: datetime
+    run_checksum: bytes | None
+
+
+@dataclass(slots=True)
+class CorpusExport:
+    entries: list[CorpusEntry]
+    bits_count: int
+    chunks: AsyncIterator[bytes]
+    filename: str
+    media_type: str
+    size: int
+
+
+async def _prepend_chunk(first: bytes, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    try:
+        if first:
+            yield first
+        async for chunk in chunks:
+            yield chunk
+    finally:
+        await chunks.aclose()
+
+
+# Chunks buffered per prefetched run, so read-ahead memory is bounded by runs x depth x chunk size.
+_CORPUS_QUEUE_DEPTH = 4
 
 
 class RNGService:
@@ -65,11 +214,17 @@ class RNGService:
         rng_factory: ChaCha20RNGFactory,
         storage: Minio,
         settings: Settings,
+        seed_reservoir: SeedReservoir | None = None,
+        keystream: ParallelKeystream | None = None,
+        payload_cache: RunPayloadCache | None = None,
     ) -> None:
         self._entropy_service = entropy_service
         self._rng_factory = rng_factory
         self._storage = storage
         self._settings = settings
+        self._seed_reservoir = seed_reservoir
+        self._keystream = keystream
+        self._payload_cache = payload_cache
 
     async def generate(
         self,
@@ -79,27 +234,29 @@ class RNGService:
         fmt: str,
         noise_seed: int | None,
         overrides: dict[str, float] | None,
+        low: int | None = None,
+        high: int | None = None,
+        storage: str = "object",
     ) -> GeneratedSequence:
-        # Always obtain fresh entropy so each run is traceable to a simulation record.
-        stored_entropy = await self._entropy_service.create_entropy(
-            uow=uow,
-            noise_seed=noise_seed,
-            overrides=overrides,
-        )
+        # Reject malformed output parameters before any entropy is spent on the run.
+        output_params = self._resolve_output_params(fmt, length, low, high)
+
+        stored_entropy = await self._obtain_entropy(uow=uow, noise_seed=noise_seed, overrides=overrides)
 
         run_id = uuid.uuid4()
         # ChaCha20 key/nonce pair derives from the stored seed.
         rng = await self._rng_factory.create_rng(run_id=run_id, seed=stored_entropy.seed)
 
-        if fmt == "hex":
-            data = rng.random_hex(length)
-        elif fmt == "ints":
-            data = rng.random_ints(length)
-        else:
-            raise ValueError("Unsupported format")
+        # Output lands in one numpy buffer shared by storage, checksum and response encoding.
+        values = draw_output(rng, fmt, length, low, high)
 
-        # Sequence is persisted in MinIO to support later audits/export.
-        checksum = self._store_sequence(run_id, data, fmt)
+        if storage == "virtual":
+            # Virtual runs keep only key material; export/analysis replay the keystream on demand.
+            checksum = {"path": None, "digest": blake2s(memoryview(values).cast("B")).digest()}
+        else:
+            # Sequence is persisted in MinIO to support later audits/export.
+            checksum = self._store_sequence(run_id, values)
+        data = memoryview(values).hex() if fmt == "hex" else values.tolist()
 
         repo = uow.rng
         # Persist metadata enabling reproducibility and linkage to entropy simulation.
@@ -112,6 +269,8 @@ class RNGService:
             seed_hash=blake2s(stored_entropy.seed).hexdigest(),
             export_path=checksum["path"],
             run_checksum=checksum["digest"],
+            output_params=output_params,
+            **self._key_material(rng, storage),
         )
 
         return GeneratedSequence(
@@ -121,24 +280,161 @@ class RNGService:
             metrics=stored_entropy.metrics,
         )
 
-    def _store_sequence(self, run_id: uuid.UUID, data: str | list[int], fmt: str) -> dict[str, bytes | str]:
-        if isinstance(data, list):
-            payload = bytes(data)
+    async def open_stream(
+        self,
+        *,
+        uow: UnitOfWork,
+        length: int,
+        noise_seed: int | None,
+        overrides: dict[str, float] | None,
+        storage: str = "object",
+    ) -> SequenceStream:
+        stored_entropy = await self._obtain_entropy(uow=uow, noise_seed=noise_seed, overrides=overrides)
+        run_id = uuid.uuid4()
+        rng = await self._rng_factory.create_rng(run_id=run_id, seed=stored_entropy.seed)
+        chunks = self._stream_chunks(
+            uow=uow,
+            run_id=run_id,
+            rng=rng,
+            length=length,
+            stored_entropy=stored_entropy,
+            storage=storage,
+        )
+        return SequenceStream(run_id=run_id, length=length, chunks=chunks)
+
+    async def _stream_chunks(
+        self,
+        *,
+        uow: UnitOfWork,
+        run_id: uuid.UUID,
+        rng: ChaCha20RNG,
+        length: int,
+        stored_entropy: StoredEntropy,
+        storage: str,
+    ) -> AsyncIterator[bytes]:
+        # Block-aligned chunks make the concatenated stream equal to rng.random_bytes(length).
+        chunk_size = max(self._settings.rng_stream_chunk_size // 64, 1) * 64
+        digest = blake2s()
+        path = None
+        upload = None
+        if storage != "virtual":
+            path = f"runs/{run_id}/sequence.bin"
+            upload = StreamingUpload(self._storage, self._settings.minio_bucket, path, length=length)
+            upload.start()
+        produced = 0
+        try:
+            while produced < length:
+                size = min(chunk_size, length - produced)
+                chunk = await asyncio.to_thread(self._produce_chunk, rng, digest, size)
+                if upload is not None:
+                    # The multipart upload consumes the same chunk while it is sent to the client.
+                    await upload.write(chunk)
+                yield chunk
+                produced += size
+            if upload is not None:
+                await upload.close()
+        except BaseException:
+            # Client disconnects and storage failures must not leave a half-written run behind.
+            if upload is not None:
+                await upload.abort()
+            raise
+
+        async with uow:
+            await uow.rng.add_run(
+                run_id=run_id,
+                entropy_simulation_id=stored_entropy.simulation_id,
+                run_format="raw",
+                length=length,
+                entropy_metrics=stored_entropy.metrics,
+                seed_hash=blake2s(stored_entropy.seed).hexdigest(),
+                export_path=path,
+                run_checksum=digest.digest(),
+                **self._key_material(rng, storage),
+            )
+
+    @staticmethod
+    def _key_material(rng: ChaCha20RNG, storage: str) -> dict[str, Any]:
+        # Every run records its counter range; the key itself is kept only when it is the sole copy.
+        return {
+            "storage_mode": storage,
+            "key_hex": rng.key.hex() if storage == "virtual" else None,
+            "nonce_hex": rng.nonce.hex(),
+            "counter_start": 0,
+            "counter_end": rng.counter,
+        }
+
+    def _produce_chunk(self, rng: ChaCha20RNG, digest: Any, size: int) -> bytes:
+        buffer = bytearray(size)
+        if self._keystream is not None:
+            # Large chunks are split by block counter across the keystream worker pool.
+            self._keystream.fill(rng, buffer)
         else:
-            payload = bytes.fromhex(data) if fmt == "hex" else data.encode()
+            rng.random_into(buffer)
+        chunk = bytes(buffer)
+        digest.update(chunk)
+        return chunk
+
+    async def _obtain_entropy(
+        self,
+        *,
+        uow: UnitOfWork,
+        noise_seed: int | None,
+        overrides: dict[str, float] | None,
+    ) -> StoredEntropy:
+        # Every run is traceable to a simulation record: either a pre-persisted reservoir seed
+        # or, for explicit seeds/parameters and an empty reservoir, one simulated inline.
+        stored_entropy = None
+        if self._seed_reservoir is not None and noise_seed is None and not overrides:
+            try:
+                stored_entropy = await self._seed_reservoir.pop()
+            except RedisError as exc:
+                # The reservoir is only a shortcut; generation must not depend on Redis.
+                logger.warning("seed_reservoir_pop_failed", error=str(exc), key=self._seed_reservoir.key)
+        if stored_entropy is None:
+            stored_entropy = await self._entropy_service.create_entropy(
+                uow=uow,
+                noise_seed=noise_seed,
+                overrides=overrides,
+            )
+        return stored_entropy
 
+    @staticmethod
+    def _resolve_output_params(
+        fmt: str,
+        length: int,
+        low: int | None,
+        high: int | None,
+    ) -> dict[str, Any] | None:
+        if fmt in ("hex", "ints"):
+            return None
+        if fmt == "floats":
+            return {"dtype": "<f8"}
+        if fmt == "permutation":
+            return {"dtype": "<i8", "low": low or 0}
+        if fmt in ("range", "sample"):
+            if low is None or high is None:
+                raise ValueError(f"format '{fmt}' requires both low and high")
+            if low >= high:
+                raise ValueError("low must be less than high")
+            if fmt == "sample" and length > high - low:
+                raise ValueError("sample length exceeds the size of [low, high)")
+            return {"dtype": "<i8", "low": low, "high": high}
+        raise ValueError("Unsupported format")
+
+    def _store_sequence(self, run_id: uuid.UUID, payload: np.ndarray) -> dict[str, bytes | str]:
+        view = memoryview(payload).cast("B")
         path = f"runs/{run_id}/sequence.bin"
-        stream = io.BytesIO(payload)
+        stream = io.BytesIO(view)
         # Store opaque binary so consumers can choose export format later.
         self._storage.put_object(
             self._settings.minio_bucket,
             path,
             data=stream,
-            length=len(payload),
+            length=view.nbytes,
             content_type="application/octet-stream",
         )
 
-        digest = blake2s(payload).digest()
+        digest = blake2s(view).digest()
         return {"path": path, "digest": digest}
 
     async def export_bits(
@@ -147,31 +443,235 @@ class RNGService:
         uow: UnitOfWork,
         run_id: uuid.UUID,
         min_bits: int = 1_000_000,
+        export_format: str = "ascii",
+        byte_range: tuple[int | None, int | None] | None = None,
     ) -> RunBitsExport:
+        """Render a run in `export_format`; `byte_range` is an HTTP (first, last) pair with either end open."""
+        layout = EXPORT_FORMATS[export_format]
         run = await uow.rng.get_run(run_id)
         if run is None:
             raise RunNotFoundError(f"run {run_id} not found")
-        if not run.export_path:
-            raise RunDataUnavailableError("run has no persisted sequence to export")
-
-        # Download the raw bytes and transform them to human-readable bit string.
-        payload = self._download_sequence(run.export_path)
-        bits_text = self._bytes_to_bits_text(payload)
-        bits_count = len(bits_text)
+        if not is_keystream_run(run):
+            raise RunDataUnavailableError(f"run {run_id} stores {run.run_format} values, not a bitstream")
+        payload_bytes = run_payload_size(run)
+        bits_count = payload_bytes * 8
         if bits_count < min_bits:
             raise InsufficientBitsError(bits_count, min_bits)
 
-        filename = f"{run_id}_bits.txt"
-        content = bits_text.encode("ascii")
-        return RunBitsExport(run_id=run_id, bits_count=bits_count, content=content, filename=filename)
+        header = layout.render_header(f"run = {run_id}", payload_bytes)
+        size = layout.size(header, payload_bytes)
+        start, stop = self._resolve_range(byte_range, size)
+        source_start, source_stop = layout.source_range(header, start, stop)
+        # Stream (or replay) only the payload bytes the range is encoded from.
+        chunks = self._iter_sequence(run, source_start, min(source_stop, payload_bytes))
+        # Pulling the first chunk here reports a missing object or key material before the response starts.
+        first = await asyncio.to_thread(next, chunks, b"")
+        return RunBitsExport(
+            run_id=run_id,
+            bits_count=bits_count,
+            chunks=render_export(layout, header, itertools.chain((first,), chunks), start, stop),
+            filename=f"{run_id}_bits.{layout.extension}",
+            media_type=layout.media_type,
+            size=size,
+            start=start,
+            stop=stop,
+        )
 
-    def _download_sequence(self, path: str) -> bytes:
+    @staticmethod
+    def _resolve_range(byte_range: tuple[int | None, int | None] | None, size: int) -> tuple[int, int]:
+        if byte_range is None:
+            return 0, size
+        first, last = byte_range
+        if first is None:
+            # Suffix range: the final `last` bytes.
+            if not last:
+                raise ExportRangeError(size)
+            return max(size - last, 0), size
+        if first >= size or (last is not None and last < first):
+            raise ExportRangeError(size)
+        return first, size if last is None else min(last + 1, size)
+
+    async def select_corpus(
+        self,
+        *,
+        uow: UnitOfWork,
+        run_ids: Sequence[uuid.UUID] | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        metric: str | None = None,
+        metric_min: float | None = None,
+        metric_max: float | None = None,
+    ) -> list[RNGRun]:
+        """Runs named explicitly, or every exportable run matching the filters, oldest first."""
+        max_runs = self._settings.rng_corpus_max_runs
+        if run_ids:
+            unique_ids = list(dict.fromkeys(run_ids))
+            if len(unique_ids) > max_runs:
+                raise CorpusSelectionError(f"corpus is limited to {max_runs} runs")
+            found = {run.id: run for run in await uow.rng.get_runs(unique_ids)}
+            missing = [str(run_id) for run_id in unique_ids if run_id not in found]
+            if missing:
+                raise RunNotFoundError(f"runs not found: {', '.join(missing)}")
+            runs = [found[run_id] for run_id in unique_ids]
+            for run in runs:
+                if run.storage_mode != "virtual" and not run.export_path:
+                    raise RunDataUnavailableError(f"run {run.id} has no persisted sequence to export")
+                if not is_keystream_run(run):
+                    raise CorpusSelectionError(f"run {run.id} stores {run.run_format} values, not a bitstream")
+        elif created_from is not None or created_to is not None or metric is not None:
+            matched = await uow.rng.list_runs_matching(
+                created_from=created_from,
+                created_to=created_to,
+                metric=metric,
+                metric_min=metric_min,
+                metric_max=metric_max,
+                limit=max_runs + 1,
+            )
+            if len(matched) > max_runs:
+                raise CorpusSelectionError(f"filters select more than {max_runs} runs")
+            runs = [
+                run
+                for run in matched
+                if is_keystream_run(run) and (run.storage_mode == "virtual" or run.export_path)
+            ]
+        else:
+            raise CorpusSelectionError("either run ids or a filter is required")
+        if not runs:
+            raise CorpusSelectionError("no exportable runs selected")
+        return runs
+
+    @staticmethod
+    def corpus_manifest(runs: Sequence[RNGRun]) -> list[CorpusEntry]:
+        entries: list[CorpusEntry] = []
+        offset = 0
+        for run in runs:
+            length = run_payload_size(run)
+            entries.append(
+                CorpusEntry(
+                    run_id=run.id,
+                    offset=offset,
+                    length=length,
+                    created_at=run.created_at,
+                    run_checksum=run.run_checksum,
+                )
+            )
+            offset += length
+        return entries
+
+    async def export_corpus(
+        self,
+        *,
+        runs: Sequence[RNGRun],
+        min_bits: int = 1_000_000,
+        export_format: str = "ascii",
+    ) -> CorpusExport:
+        """Selected runs rendered as one concatenated sequence in `export_format`."""
+        layout = EXPORT_FORMATS[export_format]
+        entries = self.corpus_manifest(runs)
+        payload_bytes = sum(entry.length for entry in entries)
+        if payload_bytes * 8 < min_bits:
+            raise InsufficientBitsError(payload_bytes * 8, min_bits)
+        header = layout.render_header(f"corpus = {len(entries)} runs", payload_bytes)
+        size = layout.size(header, payload_bytes)
+        chunks = self._corpus_chunks(list(runs), ExportRenderer(layout, header, 0, size))
+        # Starting the stream here reports a missing first object before the response starts.
+        first = await anext(chunks, b"")
+        return CorpusExport(
+            entries=entries,
+            bits_count=payload_bytes * 8,
+            chunks=_prepend_chunk(first, chunks),
+            filename=f"corpus.{layout.extension}",
+            media_type=layout.media_type,
+            size=size,
+        )
+
+    async def _corpus_chunks(self, runs: list[RNGRun], renderer: ExportRenderer) -> AsyncIterator[bytes]:
+        # Up to `rng_corpus_read_ahead` runs are fetched at once, each into a small queue,
+        # and drained in corpus order, so the first bytes go out as soon as the first run starts.
+        pending: deque[tuple[asyncio.Queue, asyncio.Task]] = deque()
+        upcoming = iter(runs)
+
+        def schedule() -> None:
+            run = next(upcoming, None)
+            if run is not None:
+                queue: asyncio.Queue = asyncio.Queue(maxsize=_CORPUS_QUEUE_DEPTH)
+                pending.append((queue, asyncio.create_task(self._pump_run(run, queue))))
+
+        prefix = renderer.head
+        try:
+            for _ in range(self._settings.rng_corpus_read_ahead):
+                schedule()
+            while pending:
+                queue, task = pending.popleft()
+                schedule()
+                while (chunk := await queue.get()) is not None:
+                    piece = await asyncio.to_thread(renderer.feed, chunk)
+                    if prefix:
+                        piece, prefix = prefix + piece, b""
+                    if piece:
+                        yield piece
+                # Surfaces a failed fetch or a payload that does not match the manifest.
+                await task
+            if prefix:
+                yield prefix
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+    async def _pump_run(self, run: RNGRun, queue: asyncio.Queue) -> None:
+        expected = run_payload_size(run)
+        chunks = self._iter_sequence(run, 0, expected)
+        received = 0
+        try:
+            while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+                received += len(chunk)
+                await queue.put(chunk)
+            if received != expected:
+                raise RunDataUnavailableError(f"run {run.id} payload size does not match its metadata")
+        except BaseException:
+            # Buffered chunks are dropped so the end marker always fits and the consumer sees the error.
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(None)
+            raise
+        finally:
+            try:
+                chunks.close()
+            except ValueError:
+                # A cancelled fetch may still be running on its thread; the object is released when it returns.
+                pass
+        await queue.put(None)
+
+    def _iter_sequence(self, run: RNGRun, start: int, stop: int) -> Iterator[bytes]:
+        chunk_size = self._settings.rng_export_chunk_size
+        if start >= stop:
+            return
+        if run.storage_mode == "virtual":
+            yield from iter_run_payload_range(run, start, stop, chunk_size)
+            return
+        if not run.export_path:
+            raise RunDataUnavailableError("run has no persisted sequence to export")
+        path = run.export_path
+        cached = self._cached_payload(run)
+        # An entry evicted after the lookup is read from object storage like any other miss.
+        mapped = None if cached is None else self._payload_cache.open(cached)
+        if mapped is not None:
+            with mapped as view:
+                for offset in range(start, min(stop, len(view)), chunk_size):
+                    yield bytes(view[offset : min(offset + chunk_size, stop)])
+            return
         obj = None
         try:
-            obj = self._storage.get_object(self._settings.minio_bucket, path)
-            data = obj.read()
-        except S3Error as exc:
-            raise RunDataUnavailableError(f"failed to fetch object {path}: {exc}") from exc
+            try:
+                obj = self._storage.get_object(
+                    self._settings.minio_bucket,
+                    path,
+                    offset=start,
+                    length=stop - start,
+                )
+            except S3Error as exc:
+                raise RunDataUnavailableError(f"failed to fetch object {path}: {exc}") from exc
+            yield from obj.stream(chunk_size)
         finally:
             if obj is not None:
                 try:
@@ -179,8 +679,13 @@ class RNGService:
                     obj.release_conn()
                 except Exception:
                     pass
-        return data
 
-    @staticmethod
-    def _bytes_to_bits_text(payload: bytes) -> str:
-        return "".join(f"{byte:08b}" for byte in payload)
+    def _cached_payload(self, run: RNGRun) -> Path | None:
+        if self._payload_cache is None:
+            return None
+        size = run_payload_size(run)
+        cached = self._payload_cache.lookup(str(run.id), size)
+        if cached is None:
+            # Misses are served with ranged reads while a single background download fills the cache.
+            self._payload_cache.prefetch(str(run.id), run.export_path, size, run.run_checksum)
+        return cached
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+from contextlib import suppress
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from randomtrust.core.logging import get_logger
+
+from .entropy_service import EntropyService, StoredEntropy
+from .unit_of_work import UnitOfWork
+
+logger = get_logger(__name__)
+
+# Deletes the lock only while it still holds our token, so an expired lock taken over by
+# another worker is left alone.
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+class SeedReservoir:
+    """Redis list of persisted entropy seeds ready to be consumed by generation runs."""
+
+    def __init__(
+        self,
+        *,
+        redis_client,
+        key: str,
+        low_watermark: int,
+        high_watermark: int,
+    ) -> None:
+        if not 0 <= low_watermark <= high_watermark:
+            raise ValueError("seed reservoir watermarks must satisfy 0 <= low <= high")
+        self._redis = redis_client
+        self._key = key
+        self._low_watermark = low_watermark
+        self._high_watermark = high_watermark
+        self._demand = asyncio.Event()
+
+    @property
+    def key(self) -> str:
+        return self._key
+
+    @property
+    def low_watermark(self) -> int:
+        return self._low_watermark
+
+    @property
+    def high_watermark(self) -> int:
+        return self._high_watermark
+
+    async def size(self) -> int:
+        return int(await self._redis.llen(self._key))
+
+    async def pop(self) -> StoredEntropy | None:
+        # LPOP is atomic, so every seed is handed to exactly one run even across workers.
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.lpop(self._key)
+            pipe.llen(self._key)
+            raw, remaining = await pipe.execute()
+        if int(remaining) < self._low_watermark:
+            self._demand.set()
+        if raw is None:
+            return None
+        return self._decode(raw)
+
+    async def push(self, entries: list[StoredEntropy]) -> None:
+        if entries:
+            await self._redis.rpush(self._key, *(self._encode(entry) for entry in entries))
+
+    async def wait_for_demand(self, timeout: float) -> None:
+        # Local pops wake the producer early; other workers are picked up by the poll timeout.
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._demand.wait(), timeout=timeout)
+        self._demand.clear()
+
+    @staticmethod
+    def _encode(entry: StoredEntropy) -> bytes:
+        payload = {
+            "simulation_id": str(entry.simulation_id),
+            "seed_hex": entry.seed_hex,
+            "metrics": entry.metrics,
+        }
+        return json.dumps(payload).encode("utf-8")
+
+    @staticmethod
+    def _decode(raw: bytes) -> StoredEntropy:
+        payload = json.loads(raw)
+        return StoredEntropy(
+            simulation_id=uuid.UUID(payload["simulation_id"]),
+            seed=bytes.fromhex(payload["seed_hex"]),
+            metrics={k: float(v) for k, v in payload["metrics"].items()},
+        )
+
+
+class SeedReservoirWorker:
+    """Background producer keeping the reservoir between its watermarks."""
+
+    def __init__(
+        self,
+        *,
+        reservoir: SeedReservoir,
+        entropy_service: EntropyService,
+        session_factory: async_sessionmaker[AsyncSession],
+        redis_client,
+        batch_size: int,
+        poll_interval: float,
+        lock_ttl_seconds: int = 300,
+    ) -> None:
+        self._reservoir = reservoir
+        self._entropy_service = entropy_service
+        self._session_factory = session_factory
+        self._redis = redis_client
+        self._batch_size = max(batch_size, 1)
+        self._poll_interval = poll_interval
+        self._lock_key = f"{reservoir.key}:lock"
+        self._lock_ttl_seconds = lock_ttl_seconds
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="seed-reservoir-worker")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def refill(self) -> int:
+        size = await self._reservoir.size()
+        if size >= self._reservoir.low_watermark:
+            return 0
+
+        # Only one worker per deployment tops up the reservoir at a time.
+        token = uuid.uuid4().hex.encode("ascii")
+        acquired = await self._redis.set(self._lock_key, token, nx=True, ex=self._lock_ttl_seconds)
+        if not acquired:
+            return 0
+
+        produced = 0
+        try:
+            while size < self._reservoir.high_watermark:
+                if await self._redis.get(self._lock_key) != token:
+                    # The lock expired mid-refill and another worker may be topping up now.
+                    logger.warning("seed_reservoir_lock_lost", key=self._reservoir.key, produced=produced)
+                    break
+                count = min(self._batch_size, self._reservoir.high_watermark - size)
+                async with UnitOfWork(self._session_factory) as uow:
+                    stored = await self._entropy_service.create_entropy_batch(
+                        uow=uow,
+                        requests=[(None, None)] * count,
+                    )
+                # Seeds are published only after their simulation records are committed.
+                await self._reservoir.push(stored)
+                produced += len(stored)
+                size = await self._reservoir.size()
+        finally:
+            await self._redis.eval(_RELEASE_LOCK_SCRIPT, 1, self._lock_key, token)
+        return produced
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                produced = await self.refill()
+                if produced:
+                    logger.info("seed_reservoir_refilled", produced=produced, key=self._reservoir.key)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001 - keep producing after transient failures
+                logger.warning("seed_reservoir_refill_failed", error=str(exc), key=self._reservoir.key)
+            await self._reservoir.wait_for_demand(self._poll_interval)
@@ -5,6 +5,7 @@ from contextlib import AbstractAsyncContextManager
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from randomtrust.repositories import (
+    AnalysisBatchRepository,
     AuditRepository,
     EntropyRepository,
     RNGRepository,
@@ -47,3 +48,8 @@ class UnitOfWork(AbstractAsyncContextManager["UnitOfWork"]):
     def test_reports(self) -> TestReportRepository:
         assert self.session is not None
         return TestReportRepository(self.session)
+
+    @property
+    def analysis_batches(self) -> AnalysisBatchRepository:
+        assert self.session is not None
+        return AnalysisBatchRepository(self.session)
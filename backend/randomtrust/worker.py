@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+import socket
+
+from randomtrust.core import (
+    close_redis,
+    create_compute_executor,
+    create_engine,
+    create_minio_client,
+    create_redis,
+    create_session_factory,
+    dispose_engine,
+    get_settings,
+    setup_logging,
+)
+from randomtrust.core.logging import get_logger
+from randomtrust.services import (
+    AnalysisJobWorker,
+    AnalysisService,
+    create_analysis_job_queue,
+    create_analysis_result_cache,
+    create_run_payload_cache,
+)
+
+logger = get_logger(__name__)
+
+
+async def run_analysis_worker() -> None:
+    """Consume analysis jobs until SIGINT or SIGTERM; scale by starting more processes."""
+    setup_logging()
+    settings = get_settings()
+    redis_client = create_redis(settings)
+    engine = create_engine(settings)
+    compute_executor = create_compute_executor(settings)
+    minio_client = create_minio_client(settings)
+    payload_cache = create_run_payload_cache(settings, storage=minio_client)
+    consumer = f"{socket.gethostname()}-{os.getpid()}"
+    worker = AnalysisJobWorker(
+        queue=create_analysis_job_queue(settings, redis_client=redis_client),
+        analysis_service=AnalysisService(
+            storage=minio_client,
+            settings=settings,
+            executor=compute_executor,
+            cache=create_analysis_result_cache(settings, redis_client=redis_client),
+            payload_cache=payload_cache,
+        ),
+        session_factory=create_session_factory(engine),
+        group=settings.analysis_job_group,
+        consumer=consumer,
+        block_seconds=settings.analysis_job_block_seconds,
+        claim_idle_seconds=settings.analysis_job_claim_idle_seconds,
+        max_attempts=settings.analysis_job_max_attempts,
+        progress_interval=settings.analysis_job_progress_seconds,
+    )
+
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stopping.set)
+
+    worker.start()
+    logger.info("analysis_worker_started", consumer=consumer, group=settings.analysis_job_group)
+    try:
+        await stopping.wait()
+    finally:
+        await worker.stop()
+        compute_executor.shutdown()
+        if payload_cache is not None:
+            payload_cache.shutdown()
+        await close_redis(redis_client)
+        await dispose_engine(engine)
+        logger.info("analysis_worker_stopped", consumer=consumer)
+
+
+def main() -> None:
+    asyncio.run(run_analysis_worker())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""SP 800-90B estimator checks: the §6.3.1 worked example and sources of known min-entropy."""
+
+from __future__ import annotations
+
+from math import log2
+
+import numpy as np
+import pytest
+
+from randomtrust.analysis import estimate_min_entropy
+from randomtrust.analysis.min_entropy import collision, markov, most_common_value
+
+_RNG_SEED = 2026
+
+
+def test_most_common_value_example() -> None:
+    # §6.3.1: the mode (1) occurs 8 times in 20 samples, p_u = 0.6895.
+    samples = np.array([0, 1, 1, 2, 0, 1, 2, 2, 0, 1, 0, 1, 1, 0, 2, 2, 1, 0, 2, 1])
+    estimate = most_common_value(samples, 2)
+    assert estimate.p_max == pytest.approx(0.6895, abs=1e-4)
+    assert estimate.min_entropy == pytest.approx(0.5363, abs=1e-4)
+
+
+def test_constant_input_has_no_entropy() -> None:
+    report = estimate_min_entropy(np.zeros(10_000, dtype=np.uint8))
+    assert report.h_original == 0.0
+    assert report.h_bitstring == pytest.approx(0.0, abs=1e-6)
+    assert report.min_entropy == pytest.approx(0.0, abs=1e-6)
+
+
+def test_biased_bernoulli() -> None:
+    p = 0.8
+    bits = (np.random.default_rng(_RNG_SEED).random(100_000) < p).astype(np.uint8)
+    expected = -log2(p)
+    mcv = most_common_value(bits, 1)
+    # The 99% upper bound on the most likely outcome sits just above p.
+    assert p < mcv.p_max < p + 0.01
+    assert mcv.min_entropy < expected
+    for estimate in (mcv, collision(bits), markov(bits)):
+        assert estimate.min_entropy == pytest.approx(expected, abs=0.02)
+
+    report = estimate_min_entropy(bits, bits_per_sample=1)
+    # The final estimate is the most conservative one.
+    assert 0.0 < report.min_entropy <= expected
+
+
+def test_uniform_bytes() -> None:
+    samples = np.random.default_rng(_RNG_SEED).integers(0, 256, 20_000, dtype=np.uint8)
+    report = estimate_min_entropy(samples)
+    assert 7.0 < report.h_original <= 8.0
+    assert 0.75 < report.h_bitstring <= 1.0
+    assert 6.0 < report.min_entropy == pytest.approx(min(report.h_original, 8 * report.h_bitstring))
+
+
+def test_too_few_samples() -> None:
+    with pytest.raises(ValueError):
+        estimate_min_entropy(np.zeros(1, dtype=np.uint8))
@@ -0,0 +1,221 @@
+"""Known-answer tests from the worked examples of NIST SP 800-22 rev. 1a.
+
+Section 2 of the publication runs every test on the first 100 bits of pi or on the first
+1,000,000 bits of e as shipped with the reference suite (`data.e`: the binary expansion with its
+integer part, "10.1011..."); appendix B lists the P-values for `data.e` with default parameters.
+"""
+
+from __future__ import annotations
+
+from math import log2
+
+import numpy as np
+import pytest
+
+from randomtrust.analysis import PackedBits, SequenceTooShortError, nist
+from randomtrust.analysis.tests import frequency_test, runs_test
+
+# §2.1.8 and the other 100-bit examples: the binary expansion of pi, integer part included.
+PI_100 = (
+    "11001001000011111101101010100010001000010110100011"
+    "00001000110100110001001100011001100010100010111000"
+)
+# §2.4.8.
+LONGEST_RUN_128 = (
+    "1100110000010101011011000100110011100000000000100100110101010001"
+    "0001001111010110100000001101011111001100111001101101100010110010"
+)
+
+
+def _bits(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode("ascii"), dtype=np.uint8) - ord("0")
+
+
+def _inverse_factorial_sum(low: int, high: int) -> tuple[int, int]:
+    # Binary splitting of sum(1 / ((low + 1) * ... * k) for k in low + 1..high) into numerator and denominator.
+    if high - low == 1:
+        return 1, high
+    middle = (low + high) // 2
+    left_num, left_den = _inverse_factorial_sum(low, middle)
+    right_num, right_den = _inverse_factorial_sum(middle, high)
+    return left_num * right_den + right_num, left_den * right_den
+
+
+def _e_bits(n: int) -> np.ndarray:
+    """First n bits of e in binary, integer part included."""
+    terms, precision = 2, 0.0
+    while precision < n + 16:
+        terms += 1
+        precision += log2(terms)
+    numerator, denominator = _inverse_factorial_sum(0, terms)
+    # The series above starts at 1/1!, so the 1/0! term is added as one more denominator.
+    value = ((numerator + denominator) << (n - 2)) // denominator
+    return _bits(format(value, "b"))
+
+
+@pytest.fixture(scope="module")
+def e_bits() -> np.ndarray:
+    bits = _e_bits(1_000_000)
+    assert "".join(map(str, bits[:20])) == "10101101111110000101"
+    return bits
+
+
+@pytest.fixture(scope="module")
+def e_packed(e_bits: np.ndarray) -> PackedBits:
+    return PackedBits.from_bits(e_bits)
+
+
+def test_igamc_matches_chi_square_tail() -> None:
+    # §2.7.4: chi^2 = 2.133333 with N = 2 blocks.
+    assert nist.igamc(1.0, 2.133333 / 2.0) == pytest.approx(0.344154, abs=1e-6)
+    assert nist.igamc(2.5, 0.0) == 1.0
+
+
+def test_frequency_pi() -> None:
+    assert frequency_test(_bits(PI_100)).details["p_value"] == pytest.approx(0.109599, abs=1e-6)
+
+
+def test_frequency_e(e_packed: PackedBits) -> None:
+    assert frequency_test(e_packed).details["p_value"] == pytest.approx(0.953749, abs=1e-6)
+
+
+def test_block_frequency_pi() -> None:
+    outcome = nist.block_frequency_test(_bits(PI_100), block_size=10)
+    assert outcome.details["chi_square"] == pytest.approx(7.2)
+    assert outcome.metric == pytest.approx(0.706438, abs=1e-6)
+
+
+def test_runs_pi() -> None:
+    assert runs_test(_bits(PI_100)).details["p_value"] == pytest.approx(0.500798, abs=1e-6)
+
+
+def test_runs_e(e_packed: PackedBits) -> None:
+    assert runs_test(e_packed).details["p_value"] == pytest.approx(0.561917, abs=1e-6)
+
+
+def test_longest_run_example() -> None:
+    outcome = nist.longest_run_test(_bits(LONGEST_RUN_128))
+    assert outcome.details["block_size"] == 8
+    # The publication prints 0.180609 from rounded intermediates; the reference code gives 0.180598.
+    assert outcome.metric == pytest.approx(0.180609, abs=2e-5)
+
+
+def test_longest_run_e(e_packed: PackedBits) -> None:
+    assert nist.longest_run_test(e_packed).metric == pytest.approx(0.718945, abs=1e-6)
+
+
+def test_matrix_rank_e(e_bits: np.ndarray, e_packed: PackedBits) -> None:
+    # §2.5.8 uses the first 100,000 bits: 97 matrices, 23 of full rank.
+    outcome = nist.matrix_rank_test(e_bits[:100_000])
+    assert outcome.details["full_rank"] == 23
+    assert outcome.details["chi_square"] == pytest.approx(1.2619656, abs=1e-6)
+    assert outcome.metric == pytest.approx(0.532069, abs=1e-6)
+    assert nist.matrix_rank_test(e_packed).metric == pytest.approx(0.306156, abs=1e-6)
+
+
+def test_dft_e(e_packed: PackedBits) -> None:
+    assert nist.dft_test(e_packed).metric == pytest.approx(0.847187, abs=1e-6)
+
+
+def test_non_overlapping_template_example() -> None:
+    # §2.7.4: B = 001 occurs twice in the first 10-bit block and once in the second.
+    counts = nist.non_overlapping_counts(_bits("10100100101110010110").reshape(2, 10), template_length=3)
+    assert counts[:, 0b001].tolist() == [2, 1]
+
+
+def test_non_overlapping_template_e(e_bits: np.ndarray) -> None:
+    # Appendix B reports B = 000000001 only, while the battery reports the smallest P-value over
+    # all 148 templates, so the statistic is rebuilt from the per-block counts.
+    block_size = nist.non_overlapping_block_size(e_bits.size)
+    counts = nist.non_overlapping_counts(e_bits[: 8 * block_size].reshape(8, block_size))[:, 1]
+    mean = (block_size - 8) / 2.0**9
+    variance = block_size * (1.0 / 2.0**9 - 17.0 / 2.0**18)
+    chi_square = float(((counts - mean) ** 2 / variance).sum())
+    assert nist.igamc(4.0, chi_square / 2.0) == pytest.approx(0.078790, abs=1e-6)
+    assert nist.non_overlapping_template_test(e_bits).details["templates"] == 148
+
+
+def test_overlapping_template_e(e_bits: np.ndarray) -> None:
+    # §2.8.8 counts; its P-value (0.110434) predates the corrected class probabilities of rev. 1a.
+    blocks = nist.overlapping_block_count(e_bits.size)
+    classes = nist.overlapping_template_classes(e_bits[: blocks * 1032].reshape(blocks, 1032))
+    assert classes.tolist() == [329, 164, 150, 111, 78, 136]
+
+
+def test_universal_e(e_packed: PackedBits) -> None:
+    outcome = nist.universal_test(e_packed)
+    assert outcome.details["block_length"] == 7
+    assert outcome.metric == pytest.approx(0.282568, abs=1e-6)
+
+
+def test_linear_complexity_e(e_bits: np.ndarray) -> None:
+    # §2.10.8 with M = 1000.
+    blocks = e_bits.reshape(1000, 1000)
+    assert nist.linear_complexity_classes(blocks).tolist() == [11, 31, 116, 501, 258, 57, 26]
+    # The publication (and reference code) rounds pi_0 = 1/96 to 0.01047, which moves the P-value
+    # in the fourth decimal: 0.845406 there against 0.844721 with the exact probability.
+    assert nist.linear_complexity_test(e_bits, block_size=1000).metric == pytest.approx(0.845406, abs=1e-3)
+
+
+def test_serial_e(e_packed: PackedBits) -> None:
+    outcome = nist.serial_test(e_packed, block_length=2)
+    assert outcome.details["p_value_1"] == pytest.approx(0.843764, abs=1e-6)
+    assert outcome.details["p_value_2"] == pytest.approx(0.561915, abs=1e-6)
+    outcome = nist.serial_test(e_packed, block_length=16)
+    assert outcome.details["p_value_1"] == pytest.approx(0.766182, abs=1e-6)
+    assert outcome.details["p_value_2"] == pytest.approx(0.462921, abs=1e-6)
+
+
+def test_approximate_entropy_pi() -> None:
+    # §2.12.8 uses m = 2 on 100 bits, below the length the battery requires for any m.
+    counts = np.bincount(nist.window_values(_bits(PI_100), 3, wrap=True), minlength=8)
+    outcome = nist.approximate_entropy_outcome(counts, 100)
+    assert outcome.details["apen"] == pytest.approx(0.665393, abs=1e-6)
+    assert outcome.details["chi_square"] == pytest.approx(5.550792, abs=1e-6)
+    assert outcome.metric == pytest.approx(0.235301, abs=1e-6)
+
+
+def test_approximate_entropy_e(e_packed: PackedBits) -> None:
+    assert nist.approximate_entropy_test(e_packed, block_length=10).metric == pytest.approx(0.700073, abs=1e-6)
+
+
+def test_cumulative_sums_pi() -> None:
+    outcome = nist.cumulative_sums_test(_bits(PI_100))
+    assert (outcome.details["z_forward"], outcome.details["z_backward"]) == (16, 19)
+    assert outcome.details["p_value_forward"] == pytest.approx(0.219194, abs=1e-6)
+    assert outcome.details["p_value_backward"] == pytest.approx(0.114866, abs=1e-6)
+
+
+def test_cumulative_sums_e(e_packed: PackedBits) -> None:
+    outcome = nist.cumulative_sums_test(e_packed)
+    assert outcome.details["p_value_forward"] == pytest.approx(0.669887, abs=2e-6)
+    assert outcome.details["p_value_backward"] == pytest.approx(0.724266, abs=2e-6)
+
+
+def test_random_excursions_e(e_packed: PackedBits) -> None:
+    outcome = nist.random_excursions_test(e_packed)
+    expected = {
+        -4: 0.573306,
+        -3: 0.197996,
+        -2: 0.164011,
+        -1: 0.007779,
+        1: 0.786868,
+        2: 0.440912,
+        3: 0.797854,
+        4: 0.778186,
+    }
+    assert outcome.details["cycles"] == 1490
+    for state, p_value in expected.items():
+        assert outcome.details[f"p_value_{state:+d}"] == pytest.approx(p_value, abs=1e-6)
+
+
+def test_random_excursions_variant_e(e_packed: PackedBits) -> None:
+    outcome = nist.random_excursions_variant_test(e_packed)
+    assert outcome.details["cycles"] == 1490
+    assert outcome.details["p_value_-1"] == pytest.approx(0.826009, abs=1e-6)
+    assert outcome.details["p_value_-9"] == pytest.approx(0.858946, abs=1e-6)
+
+
+def test_short_sequences_are_rejected() -> None:
+    with pytest.raises(SequenceTooShortError):
+        nist.dft_test(_bits(PI_100))
@@ -0,0 +1,94 @@
+"""The parallel scheduler must give the outcomes of the serial battery.
+
+Block tests are split into segments whose summaries are merged afterwards, so the lengths below
+put segment edges off byte boundaries (500-bit linear complexity blocks, n // 8-bit template
+blocks) and the segment cap is lowered to force many segments per test.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from randomtrust.analysis import (
+    AVAILABLE_TESTS,
+    PackedBits,
+    ParallelReport,
+    SequenceTooShortError,
+    SharedBits,
+    parallel,
+    run_parallel_tests,
+)
+from randomtrust.analysis.tests import run_selected_tests
+from randomtrust.core.executor import ComputeExecutor
+
+
+def _run(bits: PackedBits, tests: list[str] | None = None, workers: int = 4) -> ParallelReport:
+    async def run() -> ParallelReport:
+        executor = ComputeExecutor(kind="thread", max_workers=workers)
+        try:
+            with SharedBits.from_packed(bits) as shared:
+                return await run_parallel_tests(shared, tests, executor=executor, min_segment_bits=4_096)
+        finally:
+            executor.shutdown()
+
+    return asyncio.run(run())
+
+
+# 30,001 bits per segment puts linear complexity edges on odd 500-bit blocks, off byte boundaries.
+@pytest.mark.parametrize("max_segment_bits", [1 << 22, 30_001])
+@pytest.mark.parametrize("length", [400_017, 1_000_003])
+def test_parallel_matches_serial(length: int, max_segment_bits: int, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(parallel, "_MAX_SEGMENT_BITS", max_segment_bits)
+    bits = PackedBits.from_bits(np.random.default_rng(length).integers(0, 2, length, dtype=np.uint8))
+    report = _run(bits)
+    expected = run_selected_tests(bits)
+
+    assert [outcome.name for outcome in report.outcomes] == list(AVAILABLE_TESTS)
+    assert [timing.name for timing in report.timings] == list(AVAILABLE_TESTS)
+    for actual, reference in zip(report.outcomes, expected):
+        assert actual.name == reference.name
+        assert actual.passed == reference.passed
+        assert actual.metric == pytest.approx(reference.metric, rel=1e-9, abs=1e-12), actual.name
+        assert actual.details == pytest.approx(reference.details, rel=1e-9, abs=1e-12), actual.name
+    segments = {timing.name: timing.segments for timing in report.timings}
+    assert segments["linear_complexity"] > 1
+    assert segments["non_overlapping_template"] > 1
+
+
+@pytest.mark.parametrize("name", list(parallel._SPLIT_TESTS))
+def test_segment_summaries_match(name: str) -> None:
+    length = 400_017
+    sequence = np.random.default_rng(11).integers(0, 2, length, dtype=np.uint8)
+    split = parallel._SPLIT_TESTS[name]
+    block_size, blocks = split.layout(length)
+    with SharedBits.from_packed(PackedBits.from_bits(sequence)) as shared:
+        # Odd first blocks start segments mid-byte for every block size that is not a multiple of 8.
+        for first, last in [(0, 1), (1, 2), (3, blocks - 1), (blocks - 3, blocks)]:
+            _, _, summary = parallel._run_segment(shared.name, length, name, block_size, first, last)
+            rows = sequence[first * block_size : last * block_size].reshape(last - first, block_size)
+            np.testing.assert_array_equal(summary, split.summarize(rows))
+
+
+def test_segments_respect_the_cap(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(parallel, "_MAX_SEGMENT_BITS", 10_000)
+    ranges = parallel._segments(blocks=1_000, block_size=500, workers=2, min_segment_bits=1 << 20)
+    assert ranges[0][0] == 0 and ranges[-1][1] == 1_000
+    assert all(previous[1] == following[0] for previous, following in zip(ranges, ranges[1:]))
+    assert max(last - first for first, last in ranges) * 500 <= 10_000
+    # Blocks are never split, however long they are.
+    assert len(parallel._segments(blocks=8, block_size=100_000, workers=2, min_segment_bits=1 << 20)) == 8
+
+
+def test_explicit_tests_keep_their_order() -> None:
+    bits = PackedBits.from_bits(np.random.default_rng(3).integers(0, 2, 200_000, dtype=np.uint8))
+    tests = ["serial", "longest_run", "frequency"]
+    assert [outcome.name for outcome in _run(bits, tests).outcomes] == tests
+
+
+def test_explicit_test_too_short() -> None:
+    bits = PackedBits.from_bits(np.random.default_rng(3).integers(0, 2, 10_000, dtype=np.uint8))
+    with pytest.raises(SequenceTooShortError):
+        _run(bits, ["universal"])
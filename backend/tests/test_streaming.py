@@ -0,0 +1,102 @@
+"""The streaming accumulators must reproduce the in-memory tests on the concatenated sequence.
+
+Chunk boundaries fall at arbitrary bit offsets, so carried state (partial blocks, the last bit,
+template and serial windows, open excursion cycles) is exercised across byte and block edges.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from randomtrust.analysis import ACCUMULATORS, AVAILABLE_TESTS, PackedBits, StreamingBattery
+from randomtrust.analysis.streaming import run_chunked_test
+from randomtrust.analysis.tests import run_selected_tests
+
+if TYPE_CHECKING:
+    # Imported for annotations only; pytest would try to collect a module-level Test* class.
+    from randomtrust.analysis import TestOutcome
+
+# Long enough for every test of the battery, including universal (387,840 bits) and 500 excursion cycles.
+SEQUENCE_BITS = 1_000_003
+
+
+@pytest.fixture(scope="module")
+def sequence() -> np.ndarray:
+    return np.random.default_rng(2026).integers(0, 2, SEQUENCE_BITS, dtype=np.uint8)
+
+
+def _chunk_sizes(total: int, seed: int) -> list[int]:
+    rng = np.random.default_rng(seed)
+    sizes: list[int] = []
+    while sum(sizes) < total:
+        # Mostly large chunks, with runs of tiny ones that end mid-byte and mid-window.
+        sizes.append(int(rng.integers(1, 17)) if rng.random() < 0.3 else int(rng.integers(1, 60_000)))
+    sizes[-1] -= sum(sizes) - total
+    return [size for size in sizes if size]
+
+
+def _assert_same_outcome(actual: TestOutcome, expected: TestOutcome) -> None:
+    assert actual.name == expected.name
+    assert actual.passed == expected.passed
+    # Chunked float sums may differ from the one-shot ones in the last bits.
+    assert actual.metric == pytest.approx(expected.metric, rel=1e-9, abs=1e-12)
+    assert actual.threshold == pytest.approx(expected.threshold)
+    assert actual.details.keys() == expected.details.keys()
+    for key, value in expected.details.items():
+        assert actual.details[key] == pytest.approx(value, rel=1e-9, abs=1e-12), key
+
+
+# Every test with its battery defaults, plus short templates and windows: a 9-bit template test
+# only reports its smallest P-value over 148 templates, which a few miscounted windows rarely move.
+CASES = [(name, {}) for name in ACCUMULATORS] + [
+    ("chi_square", {"block_size": 7}),
+    ("block_frequency", {"block_size": 100}),
+    ("non_overlapping_template", {"template_length": 3}),
+    ("non_overlapping_template", {"template_length": 4, "blocks": 5}),
+    ("serial", {"block_length": 3}),
+    ("approximate_entropy", {"block_length": 2}),
+]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+@pytest.mark.parametrize(("name", "params"), CASES)
+def test_accumulator_matches_test(name: str, params: dict[str, int], seed: int, sequence: np.ndarray) -> None:
+    accumulator = ACCUMULATORS[name](sequence.size, **params)
+    offset = 0
+    for size in _chunk_sizes(sequence.size, seed):
+        accumulator.update(sequence[offset : offset + size])
+        offset += size
+    _assert_same_outcome(accumulator.finalize(), AVAILABLE_TESTS[name](sequence, **params))
+
+
+@pytest.mark.parametrize("name", list(ACCUMULATORS))
+def test_chunked_test_matches_test(name: str, sequence: np.ndarray) -> None:
+    packed = PackedBits.from_bits(sequence)
+    # 2^16 + 8 bits per chunk leaves the block edges of every test unaligned with the chunks.
+    _assert_same_outcome(run_chunked_test(name, packed, chunk_bits=(1 << 16) + 8), AVAILABLE_TESTS[name](packed))
+
+
+def test_accumulators_cover_the_battery() -> None:
+    assert list(ACCUMULATORS) == list(AVAILABLE_TESTS)
+
+
+def test_battery_skips_like_the_serial_battery() -> None:
+    sequence = np.random.default_rng(7).integers(0, 2, 20_001, dtype=np.uint8)
+    battery = StreamingBattery(sequence.size)
+    for start in range(0, sequence.size, 4_099):
+        battery.update(sequence[start : start + 4_099])
+    outcomes = battery.finalize()
+    expected = run_selected_tests(sequence)
+    assert [outcome.name for outcome in outcomes] == [outcome.name for outcome in expected]
+    for actual, reference in zip(outcomes, expected):
+        _assert_same_outcome(actual, reference)
+
+
+def test_accumulator_rejects_extra_bits() -> None:
+    accumulator = ACCUMULATORS["frequency"](8)
+    accumulator.update(np.ones(8, dtype=np.uint8))
+    with pytest.raises(ValueError):
+        accumulator.update(np.ones(1, dtype=np.uint8))